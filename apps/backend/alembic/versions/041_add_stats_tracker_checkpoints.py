@@ -0,0 +1,51 @@
+"""add_stats_tracker_checkpoints
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-16 00:00:00.000000
+
+Add stats_tracker_checkpoints table holding periodic StatsTracker snapshots so
+edits to old sessions replay only from the nearest checkpoint instead of from
+the first match.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "041"
+down_revision: Union[str, None] = "040"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create stats_tracker_checkpoints table (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    if "stats_tracker_checkpoints" not in inspector.get_table_names():
+        op.create_table(
+            "stats_tracker_checkpoints",
+            sa.Column("scope", sa.String(), nullable=False),
+            sa.Column("last_match_id", sa.Integer(), nullable=False),
+            sa.Column("match_count", sa.Integer(), nullable=False),
+            sa.Column("fingerprint", sa.BigInteger(), nullable=False),
+            sa.Column("state", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=True,
+            ),
+            sa.PrimaryKeyConstraint("scope", "last_match_id"),
+        )
+
+
+def downgrade() -> None:
+    """Drop stats_tracker_checkpoints table."""
+    op.drop_table("stats_tracker_checkpoints")
@@ -0,0 +1,98 @@
+"""add_leaderboard_entries
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-10-17 00:00:00.000000
+
+Add league_leaderboard_entries and season_leaderboard_entries: ranked
+leaderboards the league stats job rebuilds along with the player stats, so
+rankings reads are a range scan over (scope, rank) instead of aggregating and
+sorting player stats on every request. Existing stats are ranked here so the
+leaderboards are populated before the next recompute.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "042"
+down_revision: Union[str, None] = "041"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INITIAL_ELO = 1200
+
+# (entry table, scope column, scope table, stats table, points type, sort keys before ELO)
+LEADERBOARDS = (
+    (
+        "league_leaderboard_entries",
+        "league_id",
+        "leagues",
+        "player_league_stats",
+        sa.Integer(),
+        ("wins", "win_rate", "avg_point_diff"),
+    ),
+    (
+        "season_leaderboard_entries",
+        "season_id",
+        "seasons",
+        "player_season_stats",
+        sa.Float(),
+        ("points", "avg_point_diff", "win_rate"),
+    ),
+)
+
+
+def upgrade() -> None:
+    """Create and backfill the leaderboard tables (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    for table_name, scope_column, scope_table, stats_table, points_type, sort_keys in LEADERBOARDS:
+        if table_name in existing_tables:
+            continue
+        op.create_table(
+            table_name,
+            sa.Column(scope_column, sa.Integer(), nullable=False),
+            sa.Column("rank", sa.Integer(), nullable=False),
+            sa.Column("player_id", sa.Integer(), nullable=False),
+            sa.Column("games", sa.Integer(), nullable=False),
+            sa.Column("wins", sa.Integer(), nullable=False),
+            sa.Column("points", points_type, nullable=False),
+            sa.Column("win_rate", sa.Float(), nullable=False),
+            sa.Column("avg_point_diff", sa.Float(), nullable=False),
+            sa.ForeignKeyConstraint([scope_column], [f"{scope_table}.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["player_id"], ["players.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint(scope_column, "rank"),
+        )
+        op.create_index(f"idx_{table_name}_player", table_name, ["player_id"])
+
+        order_by = ", ".join(f"s.{key} DESC" for key in sort_keys)
+        op.execute(
+            f"""
+            INSERT INTO {table_name}
+                ({scope_column}, rank, player_id, games, wins, points, win_rate, avg_point_diff)
+            SELECT
+                s.{scope_column},
+                row_number() OVER (
+                    PARTITION BY s.{scope_column}
+                    ORDER BY {order_by},
+                        CASE WHEN g.current_rating IS NULL OR g.current_rating = 0
+                            THEN {INITIAL_ELO} ELSE round(g.current_rating) END DESC,
+                        s.player_id
+                ),
+                s.player_id, s.games, s.wins, s.points, s.win_rate, s.avg_point_diff
+            FROM {stats_table} s
+            LEFT JOIN player_global_stats g ON g.player_id = s.player_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the leaderboard tables."""
+    op.drop_table("season_leaderboard_entries")
+    op.drop_table("league_leaderboard_entries")
@@ -0,0 +1,65 @@
+"""add_stats_generations
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-10-17 00:00:00.000000
+
+Add stats_generations, the per-scope version counters that key the stats read
+cache, and the sequence their values come from. Every existing scope is seeded
+so reads are cacheable straight away rather than after each scope's next
+stats job.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "043"
+down_revision: Union[str, None] = "042"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and seed stats_generations (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    op.execute("CREATE SEQUENCE IF NOT EXISTS stats_generation_seq")
+    if "stats_generations" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "stats_generations",
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column(
+            "generation",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('stats_generation_seq')"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+    op.execute(
+        """
+        INSERT INTO stats_generations (scope)
+        SELECT unnest(ARRAY['all', 'global', 'players'])
+        UNION ALL
+        SELECT 'league:' || id FROM leagues
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop stats_generations and its sequence."""
+    op.drop_table("stats_generations")
+    op.execute("DROP SEQUENCE IF EXISTS stats_generation_seq")
@@ -0,0 +1,70 @@
+"""add_player_elo_series
+
+Revision ID: 044
+Revises: 043
+Create Date: 2026-10-17 00:00:00.000000
+
+Add player_elo_series: each player's global ELO timeline as sparse [date, elo]
+change points, rebuilt by the global stats job alongside elo_history, so the
+timeline API reads one row per player instead of building a players x dates
+table. Existing history is folded into series here.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "044"
+down_revision: Union[str, None] = "043"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and backfill player_elo_series (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "player_elo_series" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "player_elo_series",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("points", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["player_id"], ["players.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("player_id"),
+    )
+    # End-of-day ELO per player and date, minus days that ended unchanged
+    op.execute(
+        """
+        INSERT INTO player_elo_series (player_id, points, point_count)
+        SELECT player_id, jsonb_agg(jsonb_build_array(date, elo_after) ORDER BY date), count(*)
+        FROM (
+            SELECT player_id, date, elo_after,
+                lag(elo_after) OVER (PARTITION BY player_id ORDER BY date) AS previous
+            FROM (
+                SELECT DISTINCT ON (player_id, date) player_id, date, elo_after
+                FROM elo_history
+                ORDER BY player_id, date, match_id DESC
+            ) end_of_day
+        ) days
+        WHERE previous IS NULL OR previous <> elo_after
+        GROUP BY player_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop player_elo_series."""
+    op.drop_table("player_elo_series")
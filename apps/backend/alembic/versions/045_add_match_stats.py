@@ -0,0 +1,84 @@
+"""add_match_stats
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-17 00:00:00.000000
+
+Add match_stats: per-match global ELO and season rating results, written by
+the stats jobs from elo_history / season_rating_history so match lists get
+real deltas from the same query as the match. Existing history is copied
+here so lists show deltas before the next recompute.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "045"
+down_revision: Union[str, None] = "044"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEATS = ("team1_player1", "team1_player2", "team2_player1", "team2_player2")
+
+
+def upgrade() -> None:
+    """Create and backfill match_stats (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "match_stats" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "match_stats",
+        sa.Column("match_id", sa.Integer(), nullable=False),
+        sa.Column("team1_elo_change", sa.Float(), nullable=True),
+        sa.Column("team2_elo_change", sa.Float(), nullable=True),
+        *(sa.Column(f"{seat}_elo_after", sa.Float(), nullable=True) for seat in SEATS),
+        sa.Column("team1_rating_change", sa.Float(), nullable=True),
+        sa.Column("team2_rating_change", sa.Float(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["match_id"], ["matches.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("match_id"),
+    )
+
+    # One elo_history (e<n>) and season_rating_history (r<n>) row per seat
+    joins = "\n".join(
+        f"""
+        LEFT JOIN elo_history e{n} ON e{n}.match_id = m.id AND e{n}.player_id = m.{seat}_id
+        LEFT JOIN season_rating_history r{n} ON r{n}.match_id = m.id
+            AND r{n}.player_id = m.{seat}_id AND r{n}.season_id = s.season_id"""
+        for n, seat in enumerate(SEATS, start=1)
+    )
+    op.execute(
+        f"""
+        INSERT INTO match_stats (
+            match_id, team1_elo_change, team2_elo_change,
+            {", ".join(f"{seat}_elo_after" for seat in SEATS)},
+            team1_rating_change, team2_rating_change
+        )
+        SELECT
+            m.id,
+            coalesce(e1.elo_change, e2.elo_change),
+            coalesce(e3.elo_change, e4.elo_change),
+            e1.elo_after, e2.elo_after, e3.elo_after, e4.elo_after,
+            coalesce(r1.rating_change, r2.rating_change),
+            coalesce(r3.rating_change, r4.rating_change)
+        FROM matches m
+        LEFT JOIN sessions s ON s.id = m.session_id
+        {joins}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop match_stats."""
+    op.drop_table("match_stats")
@@ -0,0 +1,107 @@
+"""add_match_participants
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-17 00:00:00.000000
+
+Add match_participants: one (player_id, match_id, team, session_id) row per
+seat of every match, kept in sync by a trigger on matches, so "matches for a
+player" reads one index range instead of OR-ing the four player columns.
+Existing matches are unpivoted here.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "046"
+down_revision: Union[str, None] = "045"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same statements as database.models.MATCH_PARTICIPANTS_TRIGGER_SQL
+TRIGGER_SQL = (
+    """
+    CREATE OR REPLACE FUNCTION sync_match_participants() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM match_participants WHERE match_id = OLD.id;
+        END IF;
+        INSERT INTO match_participants (player_id, match_id, team, session_id)
+        SELECT DISTINCT ON (seat.player_id) seat.player_id, NEW.id, seat.team, NEW.session_id
+        FROM (VALUES
+            (NEW.team1_player1_id, 1), (NEW.team1_player2_id, 1),
+            (NEW.team2_player1_id, 2), (NEW.team2_player2_id, 2)
+        ) AS seat (player_id, team)
+        WHERE seat.player_id IS NOT NULL
+        ORDER BY seat.player_id, seat.team;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_matches_sync_participants ON matches",
+    """
+    CREATE TRIGGER trg_matches_sync_participants
+    AFTER INSERT OR UPDATE OF session_id, team1_player1_id, team1_player2_id,
+        team2_player1_id, team2_player2_id
+    ON matches
+    FOR EACH ROW EXECUTE FUNCTION sync_match_participants()
+    """,
+)
+
+
+def upgrade() -> None:
+    """Create, backfill and start maintaining match_participants (idempotent)."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "match_participants" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "match_participants",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("match_id", sa.Integer(), nullable=False),
+        sa.Column("team", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["player_id"], ["players.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["match_id"], ["matches.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("player_id", "match_id"),
+    )
+    op.create_index(
+        "idx_match_participants_player_session",
+        "match_participants",
+        ["player_id", "session_id"],
+    )
+    op.create_index(
+        "idx_match_participants_match",
+        "match_participants",
+        ["match_id"],
+        postgresql_include=["player_id", "team"],
+    )
+
+    # Backfill before the trigger exists; a player listed twice keeps team 1
+    op.execute(
+        """
+        INSERT INTO match_participants (player_id, match_id, team, session_id)
+        SELECT DISTINCT ON (seat.player_id, m.id) seat.player_id, m.id, seat.team, m.session_id
+        FROM matches m
+        CROSS JOIN LATERAL (VALUES
+            (m.team1_player1_id, 1), (m.team1_player2_id, 1),
+            (m.team2_player1_id, 2), (m.team2_player2_id, 2)
+        ) AS seat (player_id, team)
+        WHERE seat.player_id IS NOT NULL
+        ORDER BY seat.player_id, m.id, seat.team
+        """
+    )
+    for statement in TRIGGER_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the trigger and match_participants."""
+    op.execute("DROP TRIGGER IF EXISTS trg_matches_sync_participants ON matches")
+    op.execute("DROP FUNCTION IF EXISTS sync_match_participants()")
+    op.drop_table("match_participants")
@@ -0,0 +1,62 @@
+"""add_courts_generation_trigger
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-17 00:00:00.000000
+
+Bump a "courts" stats generation (and "all") on every write to courts, so
+processes holding the in-memory court index (services/court_index.py) learn
+that it is stale from the generation feed, whichever code path wrote.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "047"
+down_revision: Union[str, None] = "046"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same statements as database.models.COURTS_GENERATION_TRIGGER_SQL
+TRIGGER_SQL = (
+    """
+    CREATE OR REPLACE FUNCTION bump_courts_generation() RETURNS trigger AS $$
+    DECLARE
+        payload text;
+    BEGIN
+        WITH bumped AS (
+            INSERT INTO stats_generations (scope) VALUES ('all'), ('courts')
+            ON CONFLICT (scope) DO UPDATE
+                SET generation = nextval('stats_generation_seq'), updated_at = now()
+            RETURNING scope, generation
+        )
+        SELECT string_agg(scope || '=' || generation, ' ') INTO payload FROM bumped;
+        PERFORM pg_notify('stats_generations', payload);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_courts_bump_generation ON courts",
+    """
+    CREATE TRIGGER trg_courts_bump_generation
+    AFTER INSERT OR UPDATE OR DELETE ON courts
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_courts_generation()
+    """,
+)
+
+
+def upgrade() -> None:
+    """Seed the courts generation and install the trigger (idempotent)."""
+    op.execute("INSERT INTO stats_generations (scope) VALUES ('courts') ON CONFLICT DO NOTHING")
+    for statement in TRIGGER_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the trigger and its function."""
+    op.execute("DROP TRIGGER IF EXISTS trg_courts_bump_generation ON courts")
+    op.execute("DROP FUNCTION IF EXISTS bump_courts_generation()")
+    op.execute("DELETE FROM stats_generations WHERE scope = 'courts'")
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.database.db import get_db_session
 from backend.database.models import Season
 from backend.services.stats_queue import get_stats_queue
-from backend.api.auth_dependencies import get_current_user
+from backend.api.auth_dependencies import get_current_user, require_system_admin
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -87,6 +87,29 @@ async def calculate_stats(
         raise HTTPException(status_code=500, detail=f"Error queueing stats calculation: {str(e)}")
 
 
+@router.post("/api/calculate-stats/rebuild", response_model=dict)
+async def rebuild_global_stats(
+    current_user: dict = Depends(require_system_admin),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Queue a full rebuild of global stats (system admin only).
+
+    Ignores the persisted tracker state and checkpoints and replays every
+    stat-eligible match from scratch.
+
+    Returns:
+        dict: Job ID and status
+    """
+    try:
+        queue = get_stats_queue()
+        job_id = await queue.enqueue_calculation(session, "global_rebuild")
+
+        return {"job_id": job_id, "status": "queued", "calc_type": "global_rebuild"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error queueing stats rebuild: {str(e)}")
+
+
 @router.get("/api/calculate-stats/status", response_model=dict)
 async def get_calculation_status(
     current_user: dict = Depends(get_current_user), session: AsyncSession = Depends(get_db_session)
@@ -23,7 +23,7 @@ from backend.api.routes import limiter
 from backend.api.routes.sessions import is_user_admin_of_session_league
 from backend.database.db import get_db_session
 from backend.database.models import Season, Session, SessionStatus, PhotoMatchJobStatus
-from backend.services import data_service, photo_match_service
+from backend.services import data_service, photo_match_service, ratings_snapshot
 from backend.api.auth_dependencies import (
     get_current_user,
     require_user,
@@ -32,6 +32,8 @@ from backend.api.auth_dependencies import (
 from backend.models.schemas import (
     CreateMatchRequest,
     CreateMatchResponse,
+    MatchPreviewRequest,
+    MatchPreviewResponse,
     UpdateMatchRequest,
     EditPhotoResultsRequest,
     ConfirmPhotoMatchesRequest,
@@ -260,6 +262,55 @@ async def create_match(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/api/matches/preview", response_model=MatchPreviewResponse)
+async def preview_matches(
+    preview_request: MatchPreviewRequest,
+    current_user: dict = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Preview win probabilities and rating swings for pairings before they are played.
+
+    Ratings come from an in-memory snapshot refreshed when stats jobs finish,
+    so a batch (a KOB round, every pairing of a signup pool) costs no more
+    database reads than a single pairing.
+
+    Request body:
+        {
+            "pairings": [{"team1": [1, 2], "team2": [3, 4]}, ...],  // Up to 1000
+            "season_id": 1  // Optional - also preview season ratings (season-rating seasons)
+        }
+
+    Returns:
+        dict: {"pairings": [{"team1", "team2", "elo", "season_rating"}]}, where
+        elo / season_rating hold team ratings, team 1's expected_score and the
+        per-player change_if_win / change_if_loss for team 1
+    """
+    try:
+        global_ratings = await ratings_snapshot.get_global_ratings(session)
+        season_ratings = None
+        if preview_request.season_id is not None:
+            season_ratings = await ratings_snapshot.get_season_ratings(
+                session, preview_request.season_id
+            )
+        return {
+            "pairings": [
+                {
+                    "team1": pairing.team1,
+                    "team2": pairing.team2,
+                    "elo": global_ratings.preview(pairing.team1, pairing.team2),
+                    "season_rating": season_ratings.preview(pairing.team1, pairing.team2)
+                    if season_ratings is not None
+                    else None,
+                }
+                for pairing in preview_request.pairings
+            ]
+        }
+    except Exception as e:
+        logger.error("Error previewing matches: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.put("/api/matches/{match_id}", response_model=MatchStatusResponse)
 async def update_match(
     match_id: int,
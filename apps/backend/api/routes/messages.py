@@ -1,6 +1,7 @@
 """Direct messaging route handlers."""
 
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
@@ -10,6 +11,7 @@ from backend.database.db import get_db_session
 from backend.services import direct_message_service
 from backend.api.auth_dependencies import require_verified_player
 from backend.api.routes import limiter
+from backend.utils.pagination import InvalidCursorError
 from backend.models.schemas import (
     SendMessageRequest,
     DirectMessageResponse,
@@ -40,15 +42,26 @@ async def get_conversations(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     user: dict = Depends(require_verified_player),
     session: AsyncSession = Depends(get_db_session),
 ):
-    """Get conversation list for the current user, sorted by most recent message."""
+    """
+    Get conversation list for the current user, sorted by most recent message.
+
+    Pass the previous page's next_cursor as cursor to page without offsets.
+    """
     try:
         result = await direct_message_service.get_conversations(
-            session, user["player_id"], limit=page_size, offset=_page_offset(page, page_size)
+            session,
+            user["player_id"],
+            limit=page_size,
+            offset=_page_offset(page, page_size),
+            cursor=cursor,
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching conversations: {e}")
         raise HTTPException(status_code=500, detail="Error fetching conversations")
@@ -61,10 +74,15 @@ async def get_thread(
     player_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     user: dict = Depends(require_verified_player),
     session: AsyncSession = Depends(get_db_session),
 ):
-    """Get messages in a thread with a specific player (newest first)."""
+    """
+    Get messages in a thread with a specific player (newest first).
+
+    Pass the previous page's next_cursor as cursor to page without offsets.
+    """
     try:
         result = await direct_message_service.get_thread(
             session,
@@ -72,8 +90,11 @@ async def get_thread(
             player_id,
             limit=page_size,
             offset=_page_offset(page, page_size),
+            cursor=cursor,
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching thread: {e}")
         raise HTTPException(status_code=500, detail="Error fetching thread")
@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.database.db import get_db_session
 from backend.services import auth_service, notification_service
 from backend.services.websocket_manager import get_websocket_manager
+from backend.utils.pagination import InvalidCursorError
 from backend.api.auth_dependencies import require_user
 from backend.models.schemas import (
     NotificationResponse,
@@ -27,16 +29,24 @@ async def get_notifications(
     limit: int = 50,
     offset: int = 0,
     unread_only: bool = False,
+    cursor: Optional[str] = None,
     user: dict = Depends(require_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    """Get user notifications with pagination."""
+    """Get user notifications, paged by offset or by the previous page's next_cursor."""
     try:
         user_id = user.get("id")
         result = await notification_service.get_user_notifications(
-            session, user_id, limit=limit, offset=offset, unread_only=unread_only
+            session,
+            user_id,
+            limit=limit,
+            offset=offset,
+            unread_only=unread_only,
+            cursor=cursor,
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching notifications: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching notifications: {str(e)}")
@@ -1,16 +1,19 @@
 """Player list, create, data, placeholder, and invite route handlers."""
 
 import logging
-from typing import Any, Optional, List
+import zlib
+from datetime import date
+from typing import Any, AsyncIterator, Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.routes import limiter
 from backend.database.db import get_db_session
-from backend.services import data_service, placeholder_service
+from backend.services import data_service, placeholder_service, stats_cache
+from backend.utils.pagination import InvalidCursorError
 from backend.api.auth_dependencies import (
     get_current_user,
     get_current_user_optional,
@@ -429,9 +432,48 @@ async def get_elo_timeline(session: AsyncSession = Depends(get_db_session)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/api/elo-timeline/series", response_model=List[Any])
+async def get_elo_series(
+    player_ids: Optional[List[int]] = Query(None, description="Only these players"),
+    league_id: Optional[int] = Query(None, description="Only players with stats in this league"),
+    max_points: Optional[int] = Query(
+        None, ge=2, le=5000, description="Downsample each series to at most this many points"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get per-player ELO timelines as sparse change points.
+
+    Unlike /api/elo-timeline, each player only carries the dates on which their
+    ELO changed, optionally downsampled to a point budget.
+
+    Returns:
+        list: [{"player_id", "name", "points": [[date, elo], ...]}] ordered by name
+    """
+    try:
+        if league_id is not None:
+            scopes = await stats_cache.stats_scopes(session, league_id=league_id, elo=True)
+        else:
+            scopes = [stats_cache.GLOBAL_SCOPE, stats_cache.PLAYERS_SCOPE]
+        players = ",".join(map(str, sorted(set(player_ids)))) if player_ids else ""
+        body = await stats_cache.get_json(
+            session,
+            f"elo_series:players={players}:league={league_id}:max={max_points}",
+            scopes,
+            lambda: data_service.get_elo_series(
+                session, player_ids=player_ids, league_id=league_id, max_points=max_points
+            ),
+        )
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.error("Error loading ELO series: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.post("/api/matches/search", response_model=List[Any])
 async def search_matches(
     body: MatchesQueryRequest,
+    response: Response,
     user: Optional[dict] = Depends(get_current_user_optional),
     session: AsyncSession = Depends(get_db_session),
 ):
@@ -439,12 +481,21 @@ async def search_matches(
     Search matches with filters.
     Body: MatchesQueryRequest
 
+    When more matches may follow, the X-Next-Cursor response header holds a
+    cursor; send it back as body.cursor for the next page.
+
     Returns:
         list: Array of matches matching the query criteria
     """
     try:
-        results = await data_service.query_matches(session, body.model_dump(), user)
+        query = body.model_dump()
+        results = await data_service.query_matches(session, query, user)
+        next_cursor = data_service.query_matches_next_cursor(query, results)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return results
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -452,24 +503,61 @@ async def search_matches(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _gzip_stream(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Gzip a stream of text chunks incrementally."""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 @router.get("/api/matches/export")
-async def export_matches(session: AsyncSession = Depends(get_db_session)):
+async def export_matches(
+    league_id: Optional[int] = None,
+    season_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    gzip: bool = False,
+    session: AsyncSession = Depends(get_db_session),
+):
     """
-    Export all matches to CSV format (Google Sheets compatible).
+    Export matches to CSV format (Google Sheets compatible).
+
+    Streams rows as they are read. Optional filters: league_id, season_id,
+    date_from / date_to (ISO dates, inclusive). gzip=true returns a .csv.gz file.
 
     Returns CSV file with headers: DATE, T1P1, T1P2, T2P1, T2P2, T1SCORE, T2SCORE
     """
+    chunks = data_service.iter_matches_csv(
+        session, league_id=league_id, season_id=season_id, date_from=date_from, date_to=date_to
+    )
     try:
-        csv_content = await data_service.export_matches_to_csv(session)
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=matches_export.csv"},
-        )
+        # Start the query now so failures are still a 500, not a truncated file
+        first = await anext(chunks)
     except Exception as e:
         logger.error("Error exporting matches: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
+    async def body() -> AsyncIterator[str]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    filename = "matches_export.csv"
+    media_type = "text/csv"
+    content = body()
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+        content = _gzip_stream(content)
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
 
 @router.get("/api/players/{player_id}/stats", response_model=dict)
 async def get_player_stats(player_id: int, session: AsyncSession = Depends(get_db_session)):
@@ -483,12 +571,18 @@ async def get_player_stats(player_id: int, session: AsyncSession = Depends(get_d
         dict: Player stats including partnerships and opponents
     """
     try:
-        player_stats = await data_service.get_player_stats_by_id(session, player_id)
+        # Global, latest-season and partnership stats: depends on every scope
+        body = await stats_cache.get_json(
+            session,
+            f"player:{player_id}",
+            [stats_cache.ALL_SCOPE],
+            lambda: data_service.get_player_stats_by_id(session, player_id),
+        )
 
-        if player_stats is None:
+        if body is None:
             raise HTTPException(status_code=404, detail=f"Player with ID {player_id} not found.")
 
-        return player_stats
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
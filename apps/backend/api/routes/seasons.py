@@ -4,13 +4,19 @@ import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy import select as sa_select
 
 from backend.database.db import get_db_session
 from backend.database.models import Season as SeasonModel
-from backend.services import data_service, notification_service, season_awards_service
+from backend.services import (
+    data_service,
+    notification_service,
+    season_awards_service,
+    stats_cache,
+)
 from backend.api.auth_dependencies import (
     get_current_user,
     require_user,
@@ -142,6 +148,15 @@ async def update_season(
 # ---------------------------------------------------------------------------
 
 
+async def _cached_stats(
+    session: AsyncSession, key: str, loader, season_id=None, league_id=None, elo=False
+) -> Response:
+    """Serve a season's/league's stats read through stats_cache."""
+    scopes = await stats_cache.stats_scopes(session, season_id, league_id, elo=elo)
+    body = await stats_cache.get_json(session, key, scopes, loader)
+    return Response(content=body, media_type="application/json")
+
+
 @router.post("/api/matches/elo", response_model=list[dict])
 async def get_matches(request: Request, session: AsyncSession = Depends(get_db_session)):
     """Get all matches for a season or league with ELO changes (public)."""
@@ -151,11 +166,21 @@ async def get_matches(request: Request, session: AsyncSession = Depends(get_db_s
         league_id = body.get("league_id")
 
         if season_id is not None:
-            matches = await data_service.get_season_matches_with_elo(session, season_id)
-            return matches
+            return await _cached_stats(
+                session,
+                f"matches:season={season_id}",
+                lambda: data_service.get_season_matches_with_elo(session, season_id),
+                season_id=season_id,
+                elo=True,
+            )
         elif league_id is not None:
-            matches = await data_service.get_league_matches_with_elo(session, league_id)
-            return matches
+            return await _cached_stats(
+                session,
+                f"matches:league={league_id}",
+                lambda: data_service.get_league_matches_with_elo(session, league_id),
+                league_id=league_id,
+                elo=True,
+            )
         else:
             raise HTTPException(
                 status_code=400, detail="Either season_id or league_id is required"
@@ -170,8 +195,13 @@ async def get_matches(request: Request, session: AsyncSession = Depends(get_db_s
 async def get_season_matches(season_id: int, session: AsyncSession = Depends(get_db_session)):
     """Get all matches for a season with ELO changes (public). Deprecated: use POST /api/matches instead."""
     try:
-        matches = await data_service.get_season_matches_with_elo(session, season_id)
-        return matches
+        return await _cached_stats(
+            session,
+            f"matches:season={season_id}",
+            lambda: data_service.get_season_matches_with_elo(session, season_id),
+            season_id=season_id,
+            elo=True,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading season matches: {str(e)}")
 
@@ -185,11 +215,19 @@ async def get_all_player_stats(request: Request, session: AsyncSession = Depends
         league_id = body.get("league_id")
 
         if season_id is not None:
-            player_stats = await data_service.get_all_player_season_stats(session, season_id)
-            return player_stats
+            return await _cached_stats(
+                session,
+                f"player_stats:season={season_id}",
+                lambda: data_service.get_all_player_season_stats(session, season_id),
+                season_id=season_id,
+            )
         elif league_id is not None:
-            player_stats = await data_service.get_all_player_league_stats(session, league_id)
-            return player_stats
+            return await _cached_stats(
+                session,
+                f"player_stats:league={league_id}",
+                lambda: data_service.get_all_player_league_stats(session, league_id),
+                league_id=league_id,
+            )
         else:
             raise HTTPException(
                 status_code=400, detail="Either season_id or league_id is required"
@@ -204,8 +242,12 @@ async def get_all_player_stats(request: Request, session: AsyncSession = Depends
 async def get_season_player_stats(season_id: int, session: AsyncSession = Depends(get_db_session)):
     """Get all player season stats for a season (public). Deprecated: use POST /api/player-stats instead."""
     try:
-        player_stats = await data_service.get_all_player_season_stats(session, season_id)
-        return player_stats
+        return await _cached_stats(
+            session,
+            f"player_stats:season={season_id}",
+            lambda: data_service.get_all_player_season_stats(session, season_id),
+            season_id=season_id,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading player season stats: {str(e)}")
 
@@ -221,15 +263,23 @@ async def get_partnership_opponent_stats(
         league_id = body.get("league_id")
 
         if season_id is not None:
-            stats = await data_service.get_all_player_season_partnership_opponent_stats(
-                session, season_id
+            return await _cached_stats(
+                session,
+                f"pair_stats:season={season_id}",
+                lambda: data_service.get_all_player_season_partnership_opponent_stats(
+                    session, season_id
+                ),
+                season_id=season_id,
             )
-            return stats
         elif league_id is not None:
-            stats = await data_service.get_all_player_league_partnership_opponent_stats(
-                session, league_id
+            return await _cached_stats(
+                session,
+                f"pair_stats:league={league_id}",
+                lambda: data_service.get_all_player_league_partnership_opponent_stats(
+                    session, league_id
+                ),
+                league_id=league_id,
             )
-            return stats
         else:
             raise HTTPException(
                 status_code=400, detail="Either season_id or league_id is required"
@@ -248,10 +298,14 @@ async def get_season_partnership_opponent_stats(
 ):
     """Get all partnership and opponent stats for all players in a season (public). Deprecated: use POST /api/partnership-opponent-stats instead."""
     try:
-        stats = await data_service.get_all_player_season_partnership_opponent_stats(
-            session, season_id
+        return await _cached_stats(
+            session,
+            f"pair_stats:season={season_id}",
+            lambda: data_service.get_all_player_season_partnership_opponent_stats(
+                session, season_id
+            ),
+            season_id=season_id,
         )
-        return stats
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error loading partnership/opponent stats: {str(e)}"
@@ -267,10 +321,14 @@ async def get_player_season_partnership_opponent_stats(
 ):
     """Get partnership and opponent stats for a player in a season (public)."""
     try:
-        stats = await data_service.get_player_season_partnership_opponent_stats(
-            session, player_id, season_id
+        return await _cached_stats(
+            session,
+            f"pair_stats:season={season_id}:player={player_id}",
+            lambda: data_service.get_player_season_partnership_opponent_stats(
+                session, player_id, season_id
+            ),
+            season_id=season_id,
         )
-        return stats
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error loading partnership/opponent stats: {str(e)}"
@@ -281,8 +339,12 @@ async def get_player_season_partnership_opponent_stats(
 async def get_league_player_stats(league_id: int, session: AsyncSession = Depends(get_db_session)):
     """Get all player league stats for a league (public)."""
     try:
-        player_stats = await data_service.get_all_player_league_stats(session, league_id)
-        return player_stats
+        return await _cached_stats(
+            session,
+            f"player_stats:league={league_id}",
+            lambda: data_service.get_all_player_league_stats(session, league_id),
+            league_id=league_id,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading player league stats: {str(e)}")
 
@@ -293,10 +355,14 @@ async def get_league_partnership_opponent_stats(
 ):
     """Get all partnership and opponent stats for all players in a league (public)."""
     try:
-        stats = await data_service.get_all_player_league_partnership_opponent_stats(
-            session, league_id
+        return await _cached_stats(
+            session,
+            f"pair_stats:league={league_id}",
+            lambda: data_service.get_all_player_league_partnership_opponent_stats(
+                session, league_id
+            ),
+            league_id=league_id,
         )
-        return stats
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error loading partnership/opponent stats: {str(e)}"
@@ -339,10 +405,14 @@ async def get_player_league_partnership_opponent_stats(
 ):
     """Get partnership and opponent stats for a player in a league (public)."""
     try:
-        stats = await data_service.get_player_league_partnership_opponent_stats(
-            session, player_id, league_id
+        return await _cached_stats(
+            session,
+            f"pair_stats:league={league_id}:player={player_id}",
+            lambda: data_service.get_player_league_partnership_opponent_stats(
+                session, player_id, league_id
+            ),
+            league_id=league_id,
         )
-        return stats
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error loading partnership/opponent stats: {str(e)}"
@@ -365,10 +435,22 @@ async def query_rankings(request: Request, session: AsyncSession = Depends(get_d
     """
     try:
         body = await request.json()
-        rankings = await data_service.get_rankings(session, body)
-        # Return empty array with 200 status if no rankings (e.g., season with no matches)
-        # This is more appropriate than 404, as the resource exists but has no data
-        return rankings or []
+        season_id = (body or {}).get("season_id")
+        league_id = (body or {}).get("league_id")
+
+        async def load_rankings():
+            # Empty array with 200 status if no rankings (e.g., season with no matches)
+            # This is more appropriate than 404, as the resource exists but has no data
+            return await data_service.get_rankings(session, body) or []
+
+        return await _cached_stats(
+            session,
+            f"rankings:season={season_id}:league={league_id}",
+            load_rankings,
+            season_id=season_id,
+            league_id=league_id,
+            elo=True,
+        )
     except HTTPException:
         raise
     except Exception as e:
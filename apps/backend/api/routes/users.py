@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.routes import limiter
 from backend.database.db import get_db_session
 from backend.database.models import Player
-from backend.services import data_service, user_service, avatar_service, s3_service
+from backend.services import data_service, user_service, avatar_service, s3_service, stats_cache
 from backend.api.auth_dependencies import get_current_user
 from backend.models.schemas import UserResponse, UserUpdate, PlayerUpdate, StatusResponse
 
@@ -181,6 +181,7 @@ async def upload_avatar(
         if player_obj:
             player_obj.profile_picture_url = new_url
             player_obj.avatar = new_url
+            await stats_cache.bump_generation(session, stats_cache.PLAYERS_SCOPE)
             await session.commit()
 
         if old_url:
@@ -224,6 +225,7 @@ async def delete_avatar(
             initials = data_service.generate_player_initials(player_obj.full_name or "")
             player_obj.profile_picture_url = None
             player_obj.avatar = initials or None
+            await stats_cache.bump_generation(session, stats_cache.PLAYERS_SCOPE)
             await session.commit()
 
         return {"message": "Avatar removed"}
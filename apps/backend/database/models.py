@@ -7,6 +7,7 @@ import enum
 from sqlalchemy import (
     Column,
     Integer,
+    BigInteger,
     String,
     Text,
     Boolean,
@@ -18,6 +19,9 @@ from sqlalchemy import (
     UniqueConstraint,
     CheckConstraint,
     Index,
+    Sequence,
+    DDL,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -782,6 +786,71 @@ class Match(Base):
     )
 
 
+class MatchParticipant(Base):
+    """
+    One row per (player, match): the four player columns of matches unpivoted,
+    so "matches for player X" is a single index range scan instead of a
+    four-column OR.
+
+    Maintained by a trigger on matches (see MATCH_PARTICIPANTS_TRIGGER_SQL), so
+    every writer - the API, placeholder merges, scripts and raw inserts - keeps
+    it in sync. Rows go away with their match via the FK cascade.
+    """
+
+    __tablename__ = "match_participants"
+
+    player_id = Column(
+        Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    team = Column(Integer, nullable=False)  # 1 or 2
+    session_id = Column(Integer, nullable=True)  # Copy of matches.session_id
+
+    __table_args__ = (
+        Index("idx_match_participants_player_session", "player_id", "session_id"),
+        Index(
+            "idx_match_participants_match",
+            "match_id",
+            postgresql_include=["player_id", "team"],
+        ),
+    )
+
+
+MATCH_PARTICIPANTS_TRIGGER_SQL = (
+    """
+    CREATE OR REPLACE FUNCTION sync_match_participants() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM match_participants WHERE match_id = OLD.id;
+        END IF;
+        INSERT INTO match_participants (player_id, match_id, team, session_id)
+        SELECT DISTINCT ON (seat.player_id) seat.player_id, NEW.id, seat.team, NEW.session_id
+        FROM (VALUES
+            (NEW.team1_player1_id, 1), (NEW.team1_player2_id, 1),
+            (NEW.team2_player1_id, 2), (NEW.team2_player2_id, 2)
+        ) AS seat (player_id, team)
+        WHERE seat.player_id IS NOT NULL
+        ORDER BY seat.player_id, seat.team;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_matches_sync_participants ON matches",
+    """
+    CREATE TRIGGER trg_matches_sync_participants
+    AFTER INSERT OR UPDATE OF session_id, team1_player1_id, team1_player2_id,
+        team2_player1_id, team2_player2_id
+    ON matches
+    FOR EACH ROW EXECUTE FUNCTION sync_match_participants()
+    """,
+)
+
+for _statement in MATCH_PARTICIPANTS_TRIGGER_SQL:
+    event.listen(MatchParticipant.__table__, "after_create", DDL(_statement))
+
+
 class PartnershipStats(Base):
     """How each player performs WITH each partner (global stats)."""
 
@@ -849,6 +918,53 @@ class EloHistory(Base):
     )
 
 
+class MatchStats(Base):
+    """
+    Per-match rating results, copied from the history tables by the stats jobs
+    so match lists read them in the same query as the match.
+
+    Teammates always move by the same amount, so deltas are stored per team;
+    ELO after the match is stored per seat. Columns are NULL when the match
+    produced no such rating (not stat-eligible, placeholder players, or a
+    season not in season-rating mode).
+    """
+
+    __tablename__ = "match_stats"
+
+    match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    # Global ELO (written by the global stats job)
+    team1_elo_change = Column(Float, nullable=True)
+    team2_elo_change = Column(Float, nullable=True)
+    team1_player1_elo_after = Column(Float, nullable=True)
+    team1_player2_elo_after = Column(Float, nullable=True)
+    team2_player1_elo_after = Column(Float, nullable=True)
+    team2_player2_elo_after = Column(Float, nullable=True)
+    # Season rating (written by the league/season stats jobs)
+    team1_rating_change = Column(Float, nullable=True)
+    team2_rating_change = Column(Float, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class PlayerEloSeries(Base):
+    """
+    A player's global ELO timeline as sparse change points, for charting.
+
+    One [date, elo] pair per date on which the player's end-of-day ELO changed,
+    derived from EloHistory and rebuilt by the global stats job alongside it.
+    """
+
+    __tablename__ = "player_elo_series"
+
+    player_id = Column(
+        Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    points = Column(JSONB, nullable=False)  # [[date, elo_after], ...] in date order
+    point_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class SeasonRatingHistory(Base):
     """Track season rating changes over time for charting (season-specific)."""
 
@@ -890,6 +1006,100 @@ class PlayerGlobalStats(Base):
     __table_args__ = (Index("idx_player_global_stats_player", "player_id"),)
 
 
+class StatsTrackerState(Base):
+    """
+    Persisted StatsTracker state for resuming stats calculation incrementally.
+
+    One row per scope (e.g. "global"). The fingerprint summarizes every
+    stat-eligible match with id <= last_match_id; if it no longer matches the
+    database, the stored state is stale and a full rebuild is required.
+    """
+
+    __tablename__ = "stats_tracker_state"
+
+    scope = Column(String, primary_key=True)
+    last_match_id = Column(Integer, nullable=False)
+    match_count = Column(Integer, nullable=False)
+    fingerprint = Column(BigInteger, nullable=False)
+    state = Column(JSONB, nullable=False)  # StatsTracker.to_state() payload
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class StatsTrackerCheckpoint(Base):
+    """
+    Periodic StatsTracker snapshot used to replay from the middle of history.
+
+    Taken every STATS_CHECKPOINT_INTERVAL matches; only the latest
+    STATS_CHECKPOINT_KEEP_RECENT plus log-spaced older ones are retained.
+    When an already-processed match changes, the latest checkpoint whose fingerprint still matches the
+    database is restored and only the matches after it are replayed.
+    """
+
+    __tablename__ = "stats_tracker_checkpoints"
+
+    scope = Column(String, primary_key=True)
+    last_match_id = Column(Integer, primary_key=True)
+    match_count = Column(Integer, nullable=False)
+    fingerprint = Column(BigInteger, nullable=False)
+    state = Column(JSONB, nullable=False)  # StatsTracker.to_state() payload
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# Shared by every scope and never reset, so a generation value is never reused
+stats_generation_seq = Sequence("stats_generation_seq", metadata=Base.metadata)
+
+
+class StatsGeneration(Base):
+    """
+    Version of the data behind cached stats reads, per scope.
+
+    Scopes are "global", "league:<id>", "players" (names/avatars), "courts"
+    and "all", which moves with every other scope. Writers bump a scope in the
+    same transaction as the data it covers; see services/stats_cache.py.
+    "courts" is bumped by a trigger on courts (COURTS_GENERATION_TRIGGER_SQL).
+    """
+
+    __tablename__ = "stats_generations"
+
+    scope = Column(String, primary_key=True)
+    generation = Column(
+        BigInteger, server_default=stats_generation_seq.next_value(), nullable=False
+    )
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Bumps the "courts" (and "all") generation on every write to courts, whoever
+# makes it, like stats_cache.bump_generation
+COURTS_GENERATION_TRIGGER_SQL = (
+    """
+    CREATE OR REPLACE FUNCTION bump_courts_generation() RETURNS trigger AS $$
+    DECLARE
+        payload text;
+    BEGIN
+        WITH bumped AS (
+            INSERT INTO stats_generations (scope) VALUES ('all'), ('courts')
+            ON CONFLICT (scope) DO UPDATE
+                SET generation = nextval('stats_generation_seq'), updated_at = now()
+            RETURNING scope, generation
+        )
+        SELECT string_agg(scope || '=' || generation, ' ') INTO payload FROM bumped;
+        PERFORM pg_notify('stats_generations', payload);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_courts_bump_generation ON courts",
+    """
+    CREATE TRIGGER trg_courts_bump_generation
+    AFTER INSERT OR UPDATE OR DELETE ON courts
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_courts_generation()
+    """,
+)
+
+for _statement in COURTS_GENERATION_TRIGGER_SQL:
+    event.listen(Court.__table__, "after_create", DDL(_statement))
+
+
 class Setting(Base):
     """Application configuration."""
 
@@ -1171,6 +1381,52 @@ class PlayerLeagueStats(Base):
     )
 
 
+class LeagueLeaderboardEntry(Base):
+    """
+    Ranked league leaderboard ("All Seasons" view), rebuilt by the league stats job.
+
+    Rank order: wins, win_rate, avg_point_diff, ELO (all descending), then player_id.
+    """
+
+    __tablename__ = "league_leaderboard_entries"
+
+    league_id = Column(
+        Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    rank = Column(Integer, nullable=False, primary_key=True)  # 1-based
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    games = Column(Integer, nullable=False)
+    wins = Column(Integer, nullable=False)
+    points = Column(Integer, nullable=False)
+    win_rate = Column(Float, nullable=False)
+    avg_point_diff = Column(Float, nullable=False)
+
+    __table_args__ = (Index("idx_league_leaderboard_entries_player", "player_id"),)
+
+
+class SeasonLeaderboardEntry(Base):
+    """
+    Ranked season leaderboard, rebuilt by the league stats job.
+
+    Rank order: points, avg_point_diff, win_rate, ELO (all descending), then player_id.
+    """
+
+    __tablename__ = "season_leaderboard_entries"
+
+    season_id = Column(
+        Integer, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False, primary_key=True
+    )
+    rank = Column(Integer, nullable=False, primary_key=True)  # 1-based
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    games = Column(Integer, nullable=False)
+    wins = Column(Integer, nullable=False)
+    points = Column(Float, nullable=False)  # Season rating for season_rating seasons
+    win_rate = Column(Float, nullable=False)
+    avg_point_diff = Column(Float, nullable=False)
+
+    __table_args__ = (Index("idx_season_leaderboard_entries_player", "player_id"),)
+
+
 class PartnershipStatsLeague(Base):
     """How each player performs WITH each partner (league-specific stats)."""
 
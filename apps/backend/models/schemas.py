@@ -231,6 +231,7 @@ class MatchesQueryRequest(BaseModel):
 
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None  # From X-Next-Cursor; takes precedence over offset
     league_id: Optional[int] = None
     season_id: Optional[int] = None
     date_from: Optional[str] = None  # ISO date
@@ -242,6 +243,45 @@ class MatchesQueryRequest(BaseModel):
     sort_dir: str = "desc"  # 'asc' | 'desc'
 
 
+class MatchPairing(BaseModel):
+    """Two teams to preview (one or two players each)."""
+
+    team1: List[int] = Field(..., min_length=1, max_length=2)
+    team2: List[int] = Field(..., min_length=1, max_length=2)
+
+
+class MatchPreviewRequest(BaseModel):
+    """Pairings to preview, e.g. one match or a whole KOB round or signup pool."""
+
+    pairings: List[MatchPairing] = Field(..., min_length=1, max_length=1000)
+    season_id: Optional[int] = None  # Also preview season ratings (season-rating seasons)
+
+
+class RatingPreview(BaseModel):
+    """Team 1's win probability and per-player rating change for a win or a loss."""
+
+    team1_rating: float
+    team2_rating: float
+    expected_score: float
+    change_if_win: float
+    change_if_loss: float
+
+
+class MatchPreview(BaseModel):
+    """Preview of one pairing."""
+
+    team1: List[int]
+    team2: List[int]
+    elo: RatingPreview
+    season_rating: Optional[RatingPreview] = None
+
+
+class MatchPreviewResponse(BaseModel):
+    """Previews in request order."""
+
+    pairings: List[MatchPreview]
+
+
 class RankingsQueryRequest(BaseModel):
     """Body for rankings query endpoint."""
 
@@ -617,6 +657,7 @@ class PlayerUpdate(BaseModel):
         if not stripped:
             raise ValueError("full_name must not be empty or whitespace-only")
         return stripped
+
     gender: Optional[str] = None
     level: Optional[str] = None
     date_of_birth: Optional[str] = None  # ISO date string (YYYY-MM-DD)
@@ -808,6 +849,7 @@ class ConversationListResponse(BaseModel):
 
     items: List[ConversationResponse]
     total_count: int
+    next_cursor: Optional[str] = None
 
 
 class ThreadResponse(BaseModel):
@@ -816,6 +858,7 @@ class ThreadResponse(BaseModel):
     items: List[DirectMessageResponse]
     total_count: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class FriendCreate(BaseModel):
@@ -1250,6 +1293,7 @@ class NotificationListResponse(BaseModel):
     items: List[NotificationResponse]
     total_count: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class MarkAsReadRequest(BaseModel):
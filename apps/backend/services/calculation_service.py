@@ -3,12 +3,14 @@ ELO calculation service.
 Processes matches and computes all statistics.
 """
 
-from typing import List, Dict, Tuple, Optional
+from array import array
+from collections.abc import Mapping
+from typing import Iterable, Iterator, List, Dict, NamedTuple, Set, Tuple, Optional
 import json
 import logging
 
 from backend.utils.constants import INITIAL_ELO, USE_POINT_DIFFERENTIAL, K, SEASON_K
-from backend.database.models import Match, PartnershipStats, OpponentStats, EloHistory
+from backend.database.models import Match
 
 logger = logging.getLogger(__name__)
 
@@ -295,6 +297,24 @@ class PlayerStats:
 # StatsTracker Class
 # ============================================================================
 
+# Bump when the layout produced by StatsTracker.to_state() changes
+STATE_VERSION = 1
+
+
+def rating_params() -> List:
+    """Rating constants a persisted tracker state was computed with."""
+    return [K, SEASON_K, INITIAL_ELO, USE_POINT_DIFFERENTIAL]
+
+
+def _check_state_header(state: Dict) -> None:
+    """Reject states from another serializer version or other rating constants."""
+    version = state.get("v")
+    if version != STATE_VERSION:
+        raise ValueError(f"Unsupported tracker state version: {version!r}")
+    params = state.get("params")
+    if params != rating_params():
+        raise ValueError(f"Tracker state computed with different rating params: {params!r}")
+
 
 class StatsTracker:
     """Tracks statistics for all players across multiple matches."""
@@ -324,6 +344,146 @@ class StatsTracker:
         )
         self.is_season_rating = self.scoring_config.get("type") == "season_rating"
 
+    def to_state(self) -> Dict:
+        """
+        Serialize the per-player running state so a replay can be resumed later.
+
+        Only the state needed to continue processing is kept (ratings, counters,
+        partner/opponent dicts, point diffs). Rating histories are not included:
+        they are already persisted as elo_history rows.
+
+        Returns:
+            JSON-serializable dict: {"v": STATE_VERSION, "params": rating_params(),
+            "players": [...]} where each player entry is [player_id, elo, season_rating, game_count, win_count,
+            total_point_diff, partners, opponents] and partners/opponents are lists
+            of [other_id, games, wins, point_diff].
+        """
+        players = []
+        for player_id, stats in self.players.items():
+            partners = [
+                [
+                    partner_id,
+                    games,
+                    stats.wins_with.get(partner_id, 0),
+                    stats.point_diff_with.get(partner_id, 0),
+                ]
+                for partner_id, games in stats.games_with.items()
+            ]
+            opponents = [
+                [
+                    opponent_id,
+                    games,
+                    stats.wins_against.get(opponent_id, 0),
+                    stats.point_diff_against.get(opponent_id, 0),
+                ]
+                for opponent_id, games in stats.games_against.items()
+            ]
+            players.append(
+                [
+                    player_id,
+                    stats.elo,
+                    stats.season_rating,
+                    stats.game_count,
+                    stats.win_count,
+                    stats.total_point_diff,
+                    partners,
+                    opponents,
+                ]
+            )
+        return {"v": STATE_VERSION, "params": rating_params(), "players": players}
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict,
+        initial_ratings: Optional[Dict[int, float]] = None,
+        scoring_config: Optional[Dict] = None,
+    ) -> "StatsTracker":
+        """
+        Rebuild a tracker from a dict produced by to_state().
+
+        Raises:
+            ValueError: If the state was written by an unsupported serializer version
+                or with different rating constants (K, SEASON_K, INITIAL_ELO,
+                USE_POINT_DIFFERENTIAL)
+        """
+        _check_state_header(state)
+
+        tracker = cls(initial_ratings=initial_ratings, scoring_config=scoring_config)
+        for (
+            player_id,
+            elo,
+            season_rating,
+            game_count,
+            win_count,
+            total_point_diff,
+            partners,
+            opponents,
+        ) in state["players"]:
+            stats = tracker.get_player(player_id)
+            stats.elo = elo
+            stats.season_rating = season_rating
+            stats.game_count = game_count
+            stats.win_count = win_count
+            stats.total_point_diff = total_point_diff
+            for partner_id, games, wins, point_diff in partners:
+                stats.games_with[partner_id] = games
+                if wins:
+                    stats.wins_with[partner_id] = wins
+                stats.point_diff_with[partner_id] = point_diff
+            for opponent_id, games, wins, point_diff in opponents:
+                stats.games_against[opponent_id] = games
+                if wins:
+                    stats.wins_against[opponent_id] = wins
+                stats.point_diff_against[opponent_id] = point_diff
+        return tracker
+
+    def iter_partner_totals(
+        self, player_ids: Optional[Set[int]] = None
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (player_id, partner_id, games, wins, point_diff) for every partnership."""
+        for player_id, stats in self.players.items():
+            if player_ids is not None and player_id not in player_ids:
+                continue
+            for partner_id, games in stats.games_with.items():
+                yield (
+                    player_id,
+                    partner_id,
+                    games,
+                    stats.wins_with.get(partner_id, 0),
+                    stats.point_diff_with.get(partner_id, 0),
+                )
+
+    def iter_opponent_totals(
+        self, player_ids: Optional[Set[int]] = None
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (player_id, opponent_id, games, wins, point_diff) for every opponent pair."""
+        for player_id, stats in self.players.items():
+            if player_ids is not None and player_id not in player_ids:
+                continue
+            for opponent_id, games in stats.games_against.items():
+                yield (
+                    player_id,
+                    opponent_id,
+                    games,
+                    stats.wins_against.get(opponent_id, 0),
+                    stats.point_diff_against.get(opponent_id, 0),
+                )
+
+    def iter_elo_history(self) -> Iterator[Tuple[int, int, float, float, Optional[str]]]:
+        """Yield (player_id, match_id, elo_after, elo_change, date) for global ELO updates."""
+        for player_id, stats in self.players.items():
+            for match_id, elo_after, change, date in stats.match_elo_history:
+                yield player_id, match_id, elo_after, change, date
+
+    def iter_season_rating_history(
+        self,
+    ) -> Iterator[Tuple[int, int, float, float, Optional[str]]]:
+        """Yield (player_id, match_id, rating_after, rating_change, date) for season ratings."""
+        for player_id, stats in self.players.items():
+            for match_id, rating_after, change, date in stats.match_season_rating_history:
+                yield player_id, match_id, rating_after, change, date
+
     def get_player(self, player_id: int) -> PlayerStats:
         """Get or create a player's stats."""
         if player_id not in self.players:
@@ -528,76 +688,777 @@ class StatsTracker:
         return (global_deltas[0], global_deltas[1])
 
 
+# ============================================================================
+# CompactStatsTracker Class
+# ============================================================================
+
+
+class _PairCounters:
+    """
+    Partner or opponent counters for every (player, other) pair seen so far.
+
+    Pairs are addressed by a dense slot; games, wins and point differential are
+    kept in flat typed arrays indexed by that slot (COO-style accumulators).
+    The pair -> slot lookup is an open-addressing hash table in typed arrays, so
+    no Python objects are allocated per pair.
+    """
+
+    __slots__ = ("_keys", "_table", "_shift", "owner", "other", "games", "wins", "point_diff")
+
+    _INITIAL_BITS = 10
+    _HASH_MULTIPLIER = 0x9E3779B97F4A7C15  # Fibonacci hashing
+
+    def __init__(self):
+        self._allocate_table(self._INITIAL_BITS)
+        self.owner = array("i")
+        self.other = array("i")
+        self.games = array("i")
+        self.wins = array("i")
+        self.point_diff = array("i")
+
+    def _allocate_table(self, bits: int) -> None:
+        size = 1 << bits
+        self._shift = 64 - bits
+        self._keys = array("q", bytes(8 * size))  # pair key + 1, 0 = empty
+        self._table = array("i", bytes(4 * size))  # slot of the pair stored in the cell
+
+    def _find(self, key: int) -> int:
+        """Return the table cell holding key, or the empty cell where it belongs."""
+        keys = self._keys
+        mask = len(keys) - 1
+        cell = ((key * self._HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+        stored = keys[cell]
+        while stored and stored != key:
+            cell = (cell + 1) & mask
+            stored = keys[cell]
+        return cell
+
+    def _grow(self) -> None:
+        self._allocate_table(64 - self._shift + 1)
+        for slot, (owner, other) in enumerate(zip(self.owner, self.other)):
+            key = ((owner << 32) | other) + 1
+            cell = self._find(key)
+            self._keys[cell] = key
+            self._table[cell] = slot
+
+    def add(self, owner: int, other: int, games: int, wins: int, point_diff: int) -> None:
+        """Accumulate counters for a pair, allocating its slot on first use."""
+        key = ((owner << 32) | other) + 1
+        # Inlined _find(): this is the hot path of every replay
+        keys = self._keys
+        mask = len(keys) - 1
+        cell = ((key * self._HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+        stored = keys[cell]
+        while stored:
+            if stored == key:
+                slot = self._table[cell]
+                self.games[slot] += games
+                self.wins[slot] += wins
+                self.point_diff[slot] += point_diff
+                return
+            cell = (cell + 1) & mask
+            stored = keys[cell]
+
+        slot = len(self.owner)
+        self._keys[cell] = key
+        self._table[cell] = slot
+        self.owner.append(owner)
+        self.other.append(other)
+        self.games.append(games)
+        self.wins.append(wins)
+        self.point_diff.append(point_diff)
+        # Keep the load factor under 2/3 so probe sequences stay short
+        if 3 * (slot + 1) > 2 * len(self._keys):
+            self._grow()
+
+    def rows(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (owner, other, games, wins, point_diff) in slot order."""
+        return zip(self.owner, self.other, self.games, self.wins, self.point_diff)
+
+
+class _RatingHistory:
+    """Rating updates stored as parallel typed arrays instead of per-player tuples."""
+
+    __slots__ = ("player", "event", "rating_after", "change")
+
+    def __init__(self):
+        self.player = array("i")
+        self.event = array("i")  # index into CompactStatsTracker match events
+        self.rating_after = array("d")
+        self.change = array("d")
+
+    def append(self, player: int, event: int, rating_after: float, change: float) -> None:
+        self.player.append(player)
+        self.event.append(event)
+        self.rating_after.append(rating_after)
+        self.change.append(change)
+
+
+class CompactPlayerView:
+    """
+    Read-only PlayerStats-compatible view of one player in a CompactStatsTracker.
+
+    Scalar attributes are O(1) array reads. The per-pair dicts and history lists
+    are materialized on access by scanning the tracker, so bulk consumers should
+    use the tracker's iter_* methods instead.
+    """
+
+    __slots__ = ("_tracker", "_idx")
+
+    # Derived values share PlayerStats' implementation
+    win_rate = PlayerStats.win_rate
+    avg_point_diff = PlayerStats.avg_point_diff
+    points = PlayerStats.points
+
+    def __init__(self, tracker: "CompactStatsTracker", idx: int):
+        self._tracker = tracker
+        self._idx = idx
+
+    @property
+    def player_id(self) -> int:
+        return self._tracker._player_ids[self._idx]
+
+    @property
+    def elo(self) -> float:
+        return self._tracker._elo[self._idx]
+
+    @property
+    def season_rating(self) -> float:
+        return self._tracker._season_rating[self._idx]
+
+    @property
+    def initial_rating(self) -> Optional[float]:
+        return self._tracker.initial_ratings.get(self.player_id)
+
+    @property
+    def scoring_config(self) -> Dict:
+        return self._tracker.scoring_config
+
+    @property
+    def game_count(self) -> int:
+        return self._tracker._game_count[self._idx]
+
+    @property
+    def win_count(self) -> int:
+        return self._tracker._win_count[self._idx]
+
+    @property
+    def total_point_diff(self) -> int:
+        return self._tracker._total_point_diff[self._idx]
+
+    def _pair_dict(
+        self, counters: _PairCounters, values: array, skip_zero: bool
+    ) -> Dict[int, int]:
+        ids = self._tracker._player_ids
+        return {
+            ids[other]: value
+            for owner, other, value in zip(counters.owner, counters.other, values)
+            if owner == self._idx and (value or not skip_zero)
+        }
+
+    @property
+    def games_with(self) -> Dict[int, int]:
+        partners = self._tracker._partners
+        return self._pair_dict(partners, partners.games, skip_zero=False)
+
+    @property
+    def wins_with(self) -> Dict[int, int]:
+        partners = self._tracker._partners
+        return self._pair_dict(partners, partners.wins, skip_zero=True)
+
+    @property
+    def point_diff_with(self) -> Dict[int, int]:
+        partners = self._tracker._partners
+        return self._pair_dict(partners, partners.point_diff, skip_zero=False)
+
+    @property
+    def games_against(self) -> Dict[int, int]:
+        opponents = self._tracker._opponents
+        return self._pair_dict(opponents, opponents.games, skip_zero=False)
+
+    @property
+    def wins_against(self) -> Dict[int, int]:
+        opponents = self._tracker._opponents
+        return self._pair_dict(opponents, opponents.wins, skip_zero=True)
+
+    @property
+    def point_diff_against(self) -> Dict[int, int]:
+        opponents = self._tracker._opponents
+        return self._pair_dict(opponents, opponents.point_diff, skip_zero=False)
+
+    def _history(self, history: _RatingHistory) -> List[Tuple[int, float, float, Optional[str]]]:
+        tracker = self._tracker
+        return [
+            (tracker._match_ids[event], rating_after, change, tracker._match_dates[event])
+            for player, event, rating_after, change in zip(
+                history.player, history.event, history.rating_after, history.change
+            )
+            if player == self._idx
+        ]
+
+    @property
+    def match_elo_history(self) -> List[Tuple[int, float, float, Optional[str]]]:
+        return self._history(self._tracker._elo_history)
+
+    @property
+    def match_season_rating_history(self) -> List[Tuple[int, float, float, Optional[str]]]:
+        return self._history(self._tracker._season_rating_history)
+
+
+class _CompactPlayers(Mapping):
+    """Mapping of player_id -> CompactPlayerView, mirroring StatsTracker.players."""
+
+    def __init__(self, tracker: "CompactStatsTracker"):
+        self._tracker = tracker
+
+    def __getitem__(self, player_id: int) -> CompactPlayerView:
+        return CompactPlayerView(self._tracker, self._tracker._index[player_id])
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self._tracker._index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._tracker._index)
+
+    def __len__(self) -> int:
+        return len(self._tracker._index)
+
+
+class CompactStatsTracker:
+    """
+    Array-backed drop-in alternative to StatsTracker for large replays.
+
+    Player ids are interned into dense indices. Per-player totals live in typed
+    arrays, partner/opponent counters in flat per-pair arrays, and rating
+    history in parallel arrays referencing a shared per-match event table, so a
+    replay allocates a handful of arrays instead of dicts and tuples per player.
+
+    Produces the same match processing results, iter_* rows and to_state()
+    payload as StatsTracker, so the two can be swapped freely (including across
+    persisted states). `players` exposes read-only PlayerStats-like views.
+    """
+
+    def __init__(
+        self,
+        initial_ratings: Optional[Dict[int, float]] = None,
+        scoring_config: Optional[Dict] = None,
+    ):
+        """
+        Initialize CompactStatsTracker.
+
+        Args:
+            initial_ratings: Dict mapping player_id to initial season rating
+                (for Season Rating mode)
+            scoring_config: Scoring configuration dict
+        """
+        self.initial_ratings = initial_ratings or {}
+        self.scoring_config = (
+            scoring_config
+            if scoring_config is not None
+            else {
+                "type": "points_system",
+                "points_per_win": 3,
+                "points_per_loss": 1,
+            }
+        )
+        self.is_season_rating = self.scoring_config.get("type") == "season_rating"
+
+        self._index: Dict[int, int] = {}  # player_id -> dense index
+        self._player_ids = array("q")
+        self._elo = array("d")
+        self._season_rating = array("d")
+        self._game_count = array("i")
+        self._win_count = array("i")
+        self._total_point_diff = array("i")
+        self._partners = _PairCounters()
+        self._opponents = _PairCounters()
+
+        # One event per match that produced rating history
+        self._match_ids = array("q")
+        self._match_dates: List[Optional[str]] = []
+        self._elo_history = _RatingHistory()
+        self._season_rating_history = _RatingHistory()
+
+        self.players = _CompactPlayers(self)
+
+    def _intern(self, player_id: int) -> int:
+        """Return the dense index for a player, registering it on first sight."""
+        idx = self._index.get(player_id)
+        if idx is None:
+            idx = self._index[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._elo.append(INITIAL_ELO)
+            self._season_rating.append(self.initial_ratings.get(player_id, INITIAL_ELO))
+            self._game_count.append(0)
+            self._win_count.append(0)
+            self._total_point_diff.append(0)
+        return idx
+
+    def get_player(self, player_id: int) -> CompactPlayerView:
+        """Get or create a player's stats view."""
+        return CompactPlayerView(self, self._intern(player_id))
+
+    def to_state(self) -> Dict:
+        """Serialize running state in the same layout as StatsTracker.to_state()."""
+        ids = self._player_ids
+        partners: List[List[List[int]]] = [[] for _ in ids]
+        for owner, other, games, wins, point_diff in self._partners.rows():
+            partners[owner].append([ids[other], games, wins, point_diff])
+        opponents: List[List[List[int]]] = [[] for _ in ids]
+        for owner, other, games, wins, point_diff in self._opponents.rows():
+            opponents[owner].append([ids[other], games, wins, point_diff])
+
+        players = [
+            [
+                ids[idx],
+                self._elo[idx],
+                self._season_rating[idx],
+                self._game_count[idx],
+                self._win_count[idx],
+                self._total_point_diff[idx],
+                partners[idx],
+                opponents[idx],
+            ]
+            for idx in range(len(ids))
+        ]
+        return {"v": STATE_VERSION, "params": rating_params(), "players": players}
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict,
+        initial_ratings: Optional[Dict[int, float]] = None,
+        scoring_config: Optional[Dict] = None,
+    ) -> "CompactStatsTracker":
+        """
+        Rebuild a tracker from a dict produced by either tracker's to_state().
+
+        Raises:
+            ValueError: If the state was written by an unsupported serializer version
+                or with different rating constants (K, SEASON_K, INITIAL_ELO,
+                USE_POINT_DIFFERENTIAL)
+        """
+        _check_state_header(state)
+
+        tracker = cls(initial_ratings=initial_ratings, scoring_config=scoring_config)
+        # Intern every player first so pair entries can reference later players
+        for entry in state["players"]:
+            tracker._intern(entry[0])
+        for (
+            player_id,
+            elo,
+            season_rating,
+            game_count,
+            win_count,
+            total_point_diff,
+            partners,
+            opponents,
+        ) in state["players"]:
+            idx = tracker._index[player_id]
+            tracker._elo[idx] = elo
+            tracker._season_rating[idx] = season_rating
+            tracker._game_count[idx] = game_count
+            tracker._win_count[idx] = win_count
+            tracker._total_point_diff[idx] = total_point_diff
+            for partner_id, games, wins, point_diff in partners:
+                tracker._partners.add(idx, tracker._intern(partner_id), games, wins, point_diff)
+            for opponent_id, games, wins, point_diff in opponents:
+                tracker._opponents.add(idx, tracker._intern(opponent_id), games, wins, point_diff)
+        return tracker
+
+    def process_match(self, match: Match, skip_global_elo: bool = False) -> Tuple[float, float]:
+        """
+        Process a single match and update all relevant statistics.
+
+        Args:
+            match: Match ORM object containing match information
+            skip_global_elo: If True, skip global ELO calculation (for placeholder matches).
+                Season rating is still calculated.
+
+        Returns:
+            Tuple of (team1_elo_delta, team2_elo_delta)
+        """
+        teams = [[self._intern(pid) for pid in team] for team in match.player_ids]
+        winner = calculate_winner(match.team1_score, match.team2_score)
+        point_diff_team1 = match.team1_score - match.team2_score
+
+        self._record_team(teams[0], teams[1], point_diff_team1, winner == 1)
+        self._record_team(teams[1], teams[0], -point_diff_team1, winner == 2)
+
+        return self._update_elos(match, teams, winner, skip_global_elo)
+
+    def _record_team(
+        self, team: List[int], opponent_team: List[int], point_diff: int, won: bool
+    ) -> None:
+        """Record games, wins and point differentials for one team's players."""
+        win = 1 if won else 0
+        for idx in team:
+            self._game_count[idx] += 1
+            self._win_count[idx] += win
+            self._total_point_diff[idx] += point_diff
+
+            partner_idx = team[1] if idx == team[0] else team[0]
+            self._partners.add(idx, partner_idx, 1, win, point_diff)
+            for opponent_idx in opponent_team:
+                self._opponents.add(idx, opponent_idx, 1, win, point_diff)
+
+    def _team_deltas(
+        self, teams: List[List[int]], k_constant: float, normalized_score: float, ratings: array
+    ) -> List[float]:
+        """Calculate ELO deltas for both teams from a ratings array (see StatsTracker)."""
+        team_ratings = [sum(ratings[idx] for idx in team) / len(team) for team in teams]
+        k = k_factor(k_constant)
+        return [
+            elo_change(
+                k,
+                team_ratings[0],
+                expected_score(team_ratings[0], team_ratings[1]),
+                normalized_score,
+            ),
+            elo_change(
+                k,
+                team_ratings[1],
+                expected_score(team_ratings[1], team_ratings[0]),
+                1 - normalized_score,
+            ),
+        ]
+
+    def _apply_deltas(
+        self,
+        teams: List[List[int]],
+        deltas: List[float],
+        ratings: array,
+        history: _RatingHistory,
+        event: Optional[int],
+    ) -> None:
+        for team_idx, team in enumerate(teams):
+            for idx in team:
+                ratings[idx] += deltas[team_idx]
+                if event is not None:
+                    history.append(idx, event, ratings[idx], deltas[team_idx])
+
+    def _update_elos(
+        self, match: Match, teams: List[List[int]], winner: int, skip_global_elo: bool
+    ) -> Tuple[float, float]:
+        """Apply global ELO and (in Season Rating mode) season rating changes."""
+        normalized = normalize_score(match.team1_score, match.team2_score, winner)
+
+        event = None
+        if match.id is not None and (not skip_global_elo or self.is_season_rating):
+            event = len(self._match_ids)
+            self._match_ids.append(match.id)
+            self._match_dates.append(match.session.date if match.session else None)
+
+        global_deltas = [0.0, 0.0]
+        if not skip_global_elo:
+            global_deltas = self._team_deltas(teams, K, normalized, self._elo)
+            self._apply_deltas(teams, global_deltas, self._elo, self._elo_history, event)
+
+        if self.is_season_rating:
+            season_deltas = self._team_deltas(teams, SEASON_K, normalized, self._season_rating)
+            self._apply_deltas(
+                teams, season_deltas, self._season_rating, self._season_rating_history, event
+            )
+
+        return (global_deltas[0], global_deltas[1])
+
+    def _iter_pairs(
+        self, counters: _PairCounters, player_ids: Optional[Set[int]]
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        ids = self._player_ids
+        for owner, other, games, wins, point_diff in counters.rows():
+            player_id = ids[owner]
+            if player_ids is not None and player_id not in player_ids:
+                continue
+            yield player_id, ids[other], games, wins, point_diff
+
+    def iter_partner_totals(
+        self, player_ids: Optional[Set[int]] = None
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (player_id, partner_id, games, wins, point_diff) for every partnership."""
+        return self._iter_pairs(self._partners, player_ids)
+
+    def iter_opponent_totals(
+        self, player_ids: Optional[Set[int]] = None
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (player_id, opponent_id, games, wins, point_diff) for every opponent pair."""
+        return self._iter_pairs(self._opponents, player_ids)
+
+    def _iter_history(
+        self, history: _RatingHistory
+    ) -> Iterator[Tuple[int, int, float, float, Optional[str]]]:
+        ids = self._player_ids
+        for idx, event, rating_after, change in zip(
+            history.player, history.event, history.rating_after, history.change
+        ):
+            yield ids[idx], self._match_ids[event], rating_after, change, self._match_dates[event]
+
+    def iter_elo_history(self) -> Iterator[Tuple[int, int, float, float, Optional[str]]]:
+        """Yield (player_id, match_id, elo_after, elo_change, date) for global ELO updates."""
+        return self._iter_history(self._elo_history)
+
+    def iter_season_rating_history(
+        self,
+    ) -> Iterator[Tuple[int, int, float, float, Optional[str]]]:
+        """Yield (player_id, match_id, rating_after, rating_change, date) for season ratings."""
+        return self._iter_history(self._season_rating_history)
+
+
+# ============================================================================
+# Stats Rows
+# ============================================================================
+# Plain rows written by the stats bulk writer. Field order matches the column
+# order of the corresponding global tables (partnership_stats, opponent_stats,
+# elo_history), so rows can be streamed to Postgres as-is.
+
+
+class PartnershipRow(NamedTuple):
+    player_id: int
+    partner_id: int
+    games: int
+    wins: int
+    points: int
+    win_rate: float
+    avg_point_diff: float
+
+
+class OpponentRow(NamedTuple):
+    player_id: int
+    opponent_id: int
+    games: int
+    wins: int
+    points: int
+    win_rate: float
+    avg_point_diff: float
+
+
+class EloHistoryRow(NamedTuple):
+    player_id: int
+    match_id: int
+    date: str
+    elo_after: float
+    elo_change: float
+
+
 # ============================================================================
 # Main Processing Function
 # ============================================================================
 
 
 def _build_partnership_stats(
-    tracker: StatsTracker,
+    tracker: "StatsTracker | CompactStatsTracker",
     scoring_config: Dict,
-) -> List[PartnershipStats]:
-    """Build PartnershipStats ORM instances from tracked player data."""
+    player_ids: Optional[Set[int]] = None,
+) -> List[PartnershipRow]:
+    """
+    Build partnership stats rows from tracked player data.
+
+    If player_ids is given, only rows for those players are built.
+    """
     results = []
-    for player_id, stats in tracker.players.items():
-        for partner_id, games in stats.games_with.items():
-            wins = stats.wins_with.get(partner_id, 0)
-            losses = games - wins
-            total_pt_diff = stats.point_diff_with.get(partner_id, 0)
-            results.append(
-                PartnershipStats(
-                    player_id=player_id,
-                    partner_id=partner_id,
-                    games=games,
-                    wins=wins,
-                    points=calculate_points(wins, losses, scoring_config),
-                    win_rate=round(wins / games, 3) if games else 0,
-                    avg_point_diff=round(total_pt_diff / games, 1) if games else 0,
-                )
+    for player_id, partner_id, games, wins, total_pt_diff in tracker.iter_partner_totals(
+        player_ids
+    ):
+        losses = games - wins
+        results.append(
+            PartnershipRow(
+                player_id=player_id,
+                partner_id=partner_id,
+                games=games,
+                wins=wins,
+                points=calculate_points(wins, losses, scoring_config),
+                win_rate=round(wins / games, 3) if games else 0,
+                avg_point_diff=round(total_pt_diff / games, 1) if games else 0,
             )
+        )
     return results
 
 
 def _build_opponent_stats(
-    tracker: StatsTracker,
+    tracker: "StatsTracker | CompactStatsTracker",
     scoring_config: Dict,
-) -> List[OpponentStats]:
-    """Build OpponentStats ORM instances from tracked player data."""
+    player_ids: Optional[Set[int]] = None,
+) -> List[OpponentRow]:
+    """
+    Build opponent stats rows from tracked player data.
+
+    If player_ids is given, only rows for those players are built.
+    """
     results = []
-    for player_id, stats in tracker.players.items():
-        for opponent_id, games in stats.games_against.items():
-            wins = stats.wins_against.get(opponent_id, 0)
-            losses = games - wins
-            total_pt_diff = stats.point_diff_against.get(opponent_id, 0)
-            results.append(
-                OpponentStats(
-                    player_id=player_id,
-                    opponent_id=opponent_id,
-                    games=games,
-                    wins=wins,
-                    points=calculate_points(wins, losses, scoring_config),
-                    win_rate=round(wins / games, 3) if games else 0,
-                    avg_point_diff=round(total_pt_diff / games, 1) if games else 0,
-                )
+    for player_id, opponent_id, games, wins, total_pt_diff in tracker.iter_opponent_totals(
+        player_ids
+    ):
+        losses = games - wins
+        results.append(
+            OpponentRow(
+                player_id=player_id,
+                opponent_id=opponent_id,
+                games=games,
+                wins=wins,
+                points=calculate_points(wins, losses, scoring_config),
+                win_rate=round(wins / games, 3) if games else 0,
+                avg_point_diff=round(total_pt_diff / games, 1) if games else 0,
             )
+        )
     return results
 
 
-def _build_elo_history(tracker: StatsTracker) -> List[EloHistory]:
-    """Build EloHistory ORM instances from tracked player data (global ELO only)."""
-    results = []
-    for player_id, stats in tracker.players.items():
-        for match_id, elo_after, change, date in stats.match_elo_history:
-            results.append(
-                EloHistory(
-                    player_id=player_id,
-                    match_id=match_id,
-                    date=date or "",
-                    elo_after=round(elo_after, 1),
-                    elo_change=round(change, 1),
-                )
-            )
-    return results
+def _build_elo_history(tracker: "StatsTracker | CompactStatsTracker") -> List[EloHistoryRow]:
+    """Build ELO history rows from tracked player data (global ELO only)."""
+    return [
+        EloHistoryRow(
+            player_id=player_id,
+            match_id=match_id,
+            date=date or "",
+            elo_after=round(elo_after, 1),
+            elo_change=round(change, 1),
+        )
+        for player_id, match_id, elo_after, change, date in tracker.iter_elo_history()
+    ]
+
+
+def build_stats_from_tracker(
+    tracker: "StatsTracker | CompactStatsTracker",
+    scoring_config: Optional[Dict] = None,
+    player_ids: Optional[Set[int]] = None,
+) -> Tuple[List[PartnershipRow], List[OpponentRow], List[EloHistoryRow]]:
+    """
+    Build global stats rows from a tracker.
+
+    Args:
+        tracker: StatsTracker (or CompactStatsTracker) that has processed the matches
+        scoring_config: Optional scoring configuration dict
+        player_ids: If given, partnership/opponent rows are limited to these players
+
+    Returns:
+        Tuple of (PartnershipRow list, OpponentRow list, EloHistoryRow list)
+    """
+    config = scoring_config or {}
+    return (
+        _build_partnership_stats(tracker, config, player_ids),
+        _build_opponent_stats(tracker, config, player_ids),
+        _build_elo_history(tracker),
+    )
+
+
+def replay_matches(
+    match_list: List[Match],
+    tracker: Optional["StatsTracker | CompactStatsTracker"] = None,
+    initial_ratings: Optional[Dict[int, float]] = None,
+    scoring_config: Optional[Dict] = None,
+) -> "StatsTracker | CompactStatsTracker":
+    """
+    Feed matches through a StatsTracker in order.
+
+    Args:
+        match_list: List of Match ORM objects, in processing order
+        tracker: Optional existing tracker to continue from (e.g. restored via
+            StatsTracker.from_state). A new tracker is created if omitted.
+        initial_ratings: Initial season ratings for a newly created tracker
+        scoring_config: Scoring configuration for a newly created tracker
+
+    Returns:
+        The tracker after all matches have been applied
+    """
+    if tracker is None:
+        tracker = StatsTracker(initial_ratings=initial_ratings, scoring_config=scoring_config)
+    for match in match_list:
+        # Skip global ELO for placeholder matches (ranked_intent=True but is_ranked=False)
+        skip_global_elo = not match.is_ranked
+        tracker.process_match(match, skip_global_elo=skip_global_elo)
+    return tracker
+
+
+def replay_league_matches(
+    match_list: List[Match],
+    league_tracker: StatsTracker,
+    season_trackers: Dict[int, StatsTracker],
+    session_season_ids: Dict[int, int],
+) -> None:
+    """
+    Feed each league match once into the league tracker and its season's tracker.
+
+    Global ELO is not part of any league or season output, so it is skipped in
+    both scopes; season ratings are still updated by season-rating trackers.
+
+    Args:
+        match_list: List of Match ORM objects, in processing order
+        league_tracker: Tracker accumulating league-wide stats
+        season_trackers: Trackers keyed by season ID (seasons without one are skipped)
+        session_season_ids: Mapping of session ID to season ID
+    """
+    for match in match_list:
+        league_tracker.process_match(match, skip_global_elo=True)
+        season_id = session_season_ids.get(match.session_id) if match.session_id else None
+        season_tracker = season_trackers.get(season_id)
+        if season_tracker is not None:
+            season_tracker.process_match(match, skip_global_elo=True)
+
+
+def retained_checkpoint_counts(
+    total_count: int, checkpoint_interval: int, keep_recent: int
+) -> Set[int]:
+    """
+    Match counts of the checkpoints worth keeping once total_count matches exist.
+
+    Keeps the keep_recent latest checkpoints plus log-spaced older ones: for
+    every power of two, the latest checkpoint number that is a multiple of it.
+    That leaves about keep_recent + log2(N) checkpoints out of N. A checkpoint
+    dropped from the set never re-enters it as total_count grows, so pruning
+    whatever falls outside the set is safe.
+
+    Args:
+        total_count: Number of matches replayed so far
+        checkpoint_interval: Matches between consecutive checkpoints
+        keep_recent: Number of latest checkpoints always kept
+
+    Returns:
+        Set of match counts (multiples of checkpoint_interval)
+    """
+    latest = total_count // checkpoint_interval
+    numbers = set(range(max(latest - keep_recent + 1, 1), latest + 1))
+    shift = 0
+    while latest >> shift:
+        numbers.add((latest >> shift) << shift)
+        shift += 1
+    return {number * checkpoint_interval for number in numbers}
+
+
+def iter_replay_checkpoints(
+    match_list: Iterable[Match],
+    tracker: "StatsTracker | CompactStatsTracker",
+    checkpoint_interval: int,
+    processed_count: int = 0,
+    retained_counts: Optional[Set[int]] = None,
+) -> Iterator[Tuple[int, int, Dict]]:
+    """
+    Feed matches through a tracker, yielding snapshots of its state along the way.
+
+    The replay advances as the generator is consumed, so each snapshot can be
+    persisted and dropped before the next one is taken; exhaust it to process
+    every match. Checkpoints are aligned to the absolute match count
+    (processed_count plus matches replayed here), so resumed and full replays
+    produce the same checkpoint boundaries.
+
+    Args:
+        match_list: Match ORM objects or ReplayMatch tuples (any iterable), in
+            processing order
+        tracker: Tracker to continue from
+        checkpoint_interval: Snapshot after every N-th match
+        processed_count: Number of matches the tracker has already processed
+        retained_counts: If given, only snapshot at these match counts (see
+            retained_checkpoint_counts)
+
+    Yields:
+        (last_match_id, match_count, state) tuples, where state is the
+        to_state() payload after last_match_id was applied
+    """
+    for position, match in enumerate(match_list, start=processed_count + 1):
+        tracker.process_match(match, skip_global_elo=not match.is_ranked)
+        if position % checkpoint_interval == 0 and (
+            retained_counts is None or position in retained_counts
+        ):
+            yield match.id, position, tracker.to_state()
 
 
 def process_matches(
@@ -605,9 +1466,9 @@ def process_matches(
     player_id_map: Optional[Dict[str, int]] = None,
     initial_ratings: Optional[Dict[int, float]] = None,
     scoring_config: Optional[Dict] = None,
-) -> Tuple[List[PartnershipStats], List[OpponentStats], List[EloHistory]]:
+) -> Tuple[List[PartnershipRow], List[OpponentRow], List[EloHistoryRow]]:
     """
-    Process a list of matches and return computed statistics as ORM instances.
+    Process a list of matches and return computed statistics as rows.
 
     Args:
         match_list: List of Match ORM objects (from database.models)
@@ -617,19 +1478,311 @@ def process_matches(
 
     Returns:
         Tuple of:
-        - list of PartnershipStats instances
-        - list of OpponentStats instances
-        - list of EloHistory instances
+        - list of PartnershipRow
+        - list of OpponentRow
+        - list of EloHistoryRow
+    """
+    tracker = replay_matches(
+        match_list, initial_ratings=initial_ratings, scoring_config=scoring_config
+    )
+
+    return build_stats_from_tracker(tracker, scoring_config)
+
+
+# ============================================================================
+# Out-of-process Replay
+# ============================================================================
+#
+# The functions below take only plain, picklable inputs (ReplayMatch tuples,
+# JSON text, config dicts) and yield compact results, so they can run in a
+# separate process (see replay_process) as well as inline.
+
+
+class ReplaySession(NamedTuple):
+    date: Optional[str]
+
+
+class ReplayMatch(NamedTuple):
+    """The Match fields a tracker reads, as a plain tuple (Match's attribute interface)."""
+
+    id: int
+    player_ids: Tuple[Tuple[int, int], Tuple[int, int]]
+    team1_score: int
+    team2_score: int
+    is_ranked: bool
+    session_id: Optional[int]
+    session: Optional[ReplaySession]
+
+
+class ReplayCheckpoint(NamedTuple):
+    last_match_id: int
+    match_count: int
+    state_json: str
+
+
+class ReplayRows(NamedTuple):
+    """A chunk of output rows; kind is one of "partnerships", "opponents",
+    "elo_history" or "player_global"."""
+
+    kind: str
+    rows: list
+
+
+class GlobalReplaySummary(NamedTuple):
+    player_count: int
+    state_json: str
+
+
+class SeasonSetup(NamedTuple):
+    scoring_config: Dict
+    is_season_rating: bool
+    initial_ratings: Dict[int, float]
+
+
+class SeasonStatsRows(NamedTuple):
+    partnerships: List[tuple]
+    opponents: List[tuple]
+    rating_history: List[tuple]
+    players: List[tuple]
+
+
+class LeagueStatsRows(NamedTuple):
+    partnerships: List[tuple]
+    opponents: List[tuple]
+    players: List[tuple]
+    player_count: int
+    seasons: Dict[int, SeasonStatsRows]
+
+
+class UnusableStateError(ValueError):
+    """A persisted tracker state could not be restored (see StatsTracker.from_state)."""
+
+
+# Rows per ReplayRows chunk; keeps each message small enough to unpickle quickly
+REPLAY_ROWS_CHUNK_SIZE = 20000
+
+
+def replay_match_from_row(row) -> ReplayMatch:
+    """
+    Build a ReplayMatch from a row of (id, team1_player1_id, team1_player2_id,
+    team2_player1_id, team2_player2_id, team1_score, team2_score, is_ranked,
+    session_id, session_date).
     """
-    tracker = StatsTracker(initial_ratings=initial_ratings, scoring_config=scoring_config)
+    session_id = row[8]
+    return ReplayMatch(
+        id=row[0],
+        player_ids=((row[1], row[2]), (row[3], row[4])),
+        team1_score=row[5],
+        team2_score=row[6],
+        is_ranked=row[7],
+        session_id=session_id,
+        session=ReplaySession(row[9]) if session_id is not None else None,
+    )
+
+
+def player_global_rows(
+    tracker: "StatsTracker | CompactStatsTracker", player_ids: Optional[Set[int]] = None
+) -> List[Tuple[int, float, int, int]]:
+    """(player_id, elo, game_count, win_count) rows for player_ids (default: every player)."""
+    ids = tracker.players.keys() if player_ids is None else player_ids
+    rows = []
+    for player_id in ids:
+        stats = tracker.players[player_id]
+        rows.append((player_id, round(stats.elo, 1), stats.game_count, stats.win_count))
+    return rows
+
+
+def _iter_row_chunks(kind: str, rows: list) -> Iterator[ReplayRows]:
+    for start in range(0, len(rows), REPLAY_ROWS_CHUNK_SIZE):
+        yield ReplayRows(kind, rows[start : start + REPLAY_ROWS_CHUNK_SIZE])
+
+
+def _record_players(match_list: Iterable[ReplayMatch], player_ids: Set[int]) -> Iterator:
+    """Pass matches through, adding their players to player_ids."""
     for match in match_list:
-        # Skip global ELO for placeholder matches (ranked_intent=True but is_ranked=False)
-        skip_global_elo = not match.is_ranked
-        tracker.process_match(match, skip_global_elo=skip_global_elo)
+        for team in match.player_ids:
+            player_ids.update(team)
+        yield match
+
+
+def iter_global_replay(
+    match_list: Iterable[ReplayMatch],
+    state_json: Optional[str],
+    checkpoint_interval: int,
+    processed_count: int,
+    retained_counts: Set[int],
+    touched_only: bool = False,
+    compact: bool = False,
+) -> Iterator["ReplayCheckpoint | ReplayRows | GlobalReplaySummary"]:
+    """
+    Continue a global replay from a serialized state and stream its results.
 
-    config = scoring_config or {}
-    return (
-        _build_partnership_stats(tracker, config),
-        _build_opponent_stats(tracker, config),
-        _build_elo_history(tracker),
+    Yields ReplayCheckpoint items while replaying (see iter_replay_checkpoints),
+    then ReplayRows chunks for every output table, then one GlobalReplaySummary.
+
+    Args:
+        match_list: Matches to apply, in processing order (consumed once, so it
+            can be a stream)
+        state_json: to_state() JSON of the tracker to continue from, or None to
+            start from scratch
+        checkpoint_interval: Snapshot after every N-th match
+        processed_count: Number of matches state_json already reflects
+        retained_counts: Match counts to snapshot at (see retained_checkpoint_counts)
+        touched_only: Limit partnership/opponent/player rows to players in match_list
+        compact: Use CompactStatsTracker instead of StatsTracker
+
+    Raises:
+        UnusableStateError: If state_json cannot be restored
+    """
+    tracker_cls = CompactStatsTracker if compact else StatsTracker
+    if state_json is None:
+        tracker = tracker_cls()
+    else:
+        try:
+            tracker = tracker_cls.from_state(json.loads(state_json))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise UnusableStateError(str(exc)) from exc
+
+    player_ids = None
+    if touched_only:
+        player_ids = set()
+        match_list = _record_players(match_list, player_ids)
+
+    for last_match_id, match_count, state in iter_replay_checkpoints(
+        match_list, tracker, checkpoint_interval, processed_count, retained_counts
+    ):
+        yield ReplayCheckpoint(last_match_id, match_count, json.dumps(state))
+
+    partnerships, opponents, elo_history = build_stats_from_tracker(tracker, player_ids=player_ids)
+    yield from _iter_row_chunks("partnerships", partnerships)
+    yield from _iter_row_chunks("opponents", opponents)
+    yield from _iter_row_chunks("elo_history", elo_history)
+    yield from _iter_row_chunks("player_global", player_global_rows(tracker, player_ids))
+    yield GlobalReplaySummary(len(tracker.players), json.dumps(tracker.to_state()))
+
+
+def build_season_stats_rows(
+    tracker: "StatsTracker | CompactStatsTracker",
+    season_id: int,
+    scoring_config: Dict,
+    is_season_rating: bool,
+) -> SeasonStatsRows:
+    """
+    Build a season's stats rows from its tracker, in the column order of the
+    *_season tables (season_id follows the player/pair key).
+    """
+
+    def pair_rows(totals) -> List[tuple]:
+        rows = []
+        for player_id, other_id, games, wins, total_pt_diff in totals:
+            losses = games - wins
+            win_rate = wins / games if games > 0 else 0
+            avg_pt_diff = total_pt_diff / games if games > 0 else 0
+            rows.append(
+                (
+                    player_id,
+                    other_id,
+                    season_id,
+                    games,
+                    wins,
+                    calculate_points(wins, losses, scoring_config),
+                    round(win_rate, 3),
+                    round(avg_pt_diff, 1),
+                )
+            )
+        return rows
+
+    rating_history = []
+    if is_season_rating:
+        rating_history = [
+            (
+                player_id,
+                season_id,
+                match_id,
+                d or "",
+                round(rating_after, 2),
+                round(rating_change, 2),
+            )
+            for (
+                player_id,
+                match_id,
+                rating_after,
+                rating_change,
+                d,
+            ) in tracker.iter_season_rating_history()
+        ]
+
+    players = [
+        (
+            player_id,
+            season_id,
+            player_stats.game_count,
+            player_stats.win_count,
+            player_stats.points,
+            round(player_stats.win_rate, 3),
+            round(player_stats.avg_point_diff, 1),
+        )
+        for player_id, player_stats in tracker.players.items()
+    ]
+    return SeasonStatsRows(
+        pair_rows(tracker.iter_partner_totals()),
+        pair_rows(tracker.iter_opponent_totals()),
+        rating_history,
+        players,
+    )
+
+
+def create_season_tracker(setup: SeasonSetup) -> StatsTracker:
+    """Create an empty tracker for a season from its SeasonSetup."""
+    return StatsTracker(
+        initial_ratings=setup.initial_ratings if setup.is_season_rating else None,
+        scoring_config=setup.scoring_config,
+    )
+
+
+def iter_league_stats(
+    match_list: List[ReplayMatch],
+    league_id: int,
+    league_scoring_config: Dict,
+    season_setups: Dict[int, SeasonSetup],
+    session_season_ids: Dict[int, int],
+) -> Iterator[LeagueStatsRows]:
+    """
+    Replay a league's matches (see replay_league_matches) and yield its stats rows.
+
+    Yields a single LeagueStatsRows whose league rows follow the *_league table
+    column order (league_id after the player/pair key) and which has one
+    SeasonStatsRows per season in season_setups.
+    """
+    season_trackers = {sid: create_season_tracker(setup) for sid, setup in season_setups.items()}
+    league_tracker = StatsTracker(scoring_config=league_scoring_config)
+    replay_league_matches(match_list, league_tracker, season_trackers, session_season_ids)
+    partnerships, opponents, _ = build_stats_from_tracker(league_tracker, league_scoring_config)
+
+    players = [
+        (
+            player_id,
+            league_id,
+            player_stats.game_count,
+            player_stats.win_count,
+            player_stats.points,
+            round(player_stats.win_rate, 3),
+            round(player_stats.avg_point_diff, 1),
+        )
+        for player_id, player_stats in league_tracker.players.items()
+    ]
+    yield LeagueStatsRows(
+        partnerships=[(*ps[:2], league_id, *ps[2:]) for ps in partnerships],
+        opponents=[(*os[:2], league_id, *os[2:]) for os in opponents],
+        players=players,
+        player_count=len(league_tracker.players),
+        seasons={
+            sid: build_season_stats_rows(
+                tracker,
+                sid,
+                season_setups[sid].scoring_config,
+                season_setups[sid].is_season_rating,
+            )
+            for sid, tracker in season_trackers.items()
+        },
     )
@@ -0,0 +1,207 @@
+"""
+In-memory spatial index over listed (approved, active) courts.
+
+Courts with coordinates are bucketed into a GRID_DEGREES lat/lng grid. A radius
+query visits only the cells overlapping the radius' bounding box and computes
+exact haversine distances for the courts in them; nearest-first queries run
+radius queries outward from NEAREST_START_MILES, doubling until enough courts
+match. Courts without coordinates are kept aside (by name) for listings that
+put them last.
+
+Entries carry the fields court listings filter and display on, so nearby
+lookups need no database round trip. The index is tagged with the "courts"
+stats generation, which a trigger on courts moves on every write (see
+COURTS_GENERATION_TRIGGER_SQL); each process rebuilds its copy on the first
+lookup after a change.
+"""
+
+import math
+from collections import defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models import Court, Location
+from backend.services import stats_cache
+from backend.utils.geo_utils import calculate_distance_miles
+
+# Cell size of the grid, in degrees (~35 miles north-south)
+GRID_DEGREES = 0.5
+# First radius tried by nearest-first queries; doubled until enough courts match
+NEAREST_START_MILES = 10.0
+_EARTH_RADIUS_MILES = 3959.0
+# Beyond this every court on Earth is in range
+_HALF_CIRCUMFERENCE_MILES = math.pi * _EARTH_RADIUS_MILES
+
+
+class CourtEntry(NamedTuple):
+    """A listed court's location, filterable attributes and summary fields."""
+
+    id: int
+    name: str
+    slug: Optional[str]
+    address: Optional[str]
+    location_id: str
+    region_id: Optional[str]
+    surface_type: Optional[str]
+    average_rating: Optional[float]
+    review_count: Optional[int]
+    is_free: Optional[bool]
+    has_lights: Optional[bool]
+    has_restrooms: Optional[bool]
+    has_parking: Optional[bool]
+    nets_provided: Optional[bool]
+    latitude: Optional[float]
+    longitude: Optional[float]
+
+
+_COLUMNS = round(360 / GRID_DEGREES)
+
+
+def _column(lng: float) -> int:
+    """Grid column of a longitude, wrapped so -180 and 180 share a column."""
+    return (math.floor(lng / GRID_DEGREES) + _COLUMNS // 2) % _COLUMNS - _COLUMNS // 2
+
+
+def _cell(lat: float, lng: float) -> Tuple[int, int]:
+    return math.floor(lat / GRID_DEGREES), _column(lng)
+
+
+class CourtIndex:
+    """Grid index over a fixed set of courts (rebuilt, never updated in place)."""
+
+    def __init__(self, generation: Optional[int], entries: List[CourtEntry]):
+        self.generation = generation
+        self.by_id: Dict[int, CourtEntry] = {e.id: e for e in entries}
+        self._cells: Dict[Tuple[int, int], List[CourtEntry]] = defaultdict(list)
+        unlocated = []
+        for entry in entries:
+            if entry.latitude is None or entry.longitude is None:
+                unlocated.append(entry)
+            else:
+                self._cells[_cell(entry.latitude, entry.longitude)].append(entry)
+        self._cells = dict(self._cells)
+        self.unlocated = sorted(unlocated, key=lambda e: e.name)
+        self.located_count = len(entries) - len(unlocated)
+
+    def _candidate_cells(self, lat: float, lng: float, radius_miles: float):
+        """Cells that can hold a court within radius_miles of (lat, lng)."""
+        if radius_miles >= _HALF_CIRCUMFERENCE_MILES:
+            return self._cells.values()
+        # Bounding box of the radius (exact for great-circle distance)
+        angular = radius_miles / _EARTH_RADIUS_MILES
+        lat_span = math.degrees(angular)
+        lat_lo, lat_hi = lat - lat_span, lat + lat_span
+        cos_lat = math.cos(math.radians(lat))
+        if lat_lo <= -90 or lat_hi >= 90 or math.sin(angular) >= cos_lat:
+            lng_lo, lng_hi = -180.0, 180.0  # reaches a pole: every longitude
+        else:
+            lng_span = math.degrees(math.asin(math.sin(angular) / cos_lat))
+            lng_lo, lng_hi = lng - lng_span, lng + lng_span
+
+        row_lo = math.floor(max(lat_lo, -90.0) / GRID_DEGREES)
+        row_hi = math.floor(min(lat_hi, 90.0) / GRID_DEGREES)
+        col_lo = math.floor(lng_lo / GRID_DEGREES)
+        col_count = min(math.floor(lng_hi / GRID_DEGREES) - col_lo + 1, _COLUMNS)
+        if (row_hi - row_lo + 1) * col_count > len(self._cells):
+            # Cheaper to look at every occupied cell
+            return self._cells.values()
+
+        cells = []
+        for row in range(row_lo, row_hi + 1):
+            for col in range(col_lo, col_lo + col_count):
+                # Columns past +-180 degrees wrap across the antimeridian
+                bucket = self._cells.get((row, _column(col * GRID_DEGREES)))
+                if bucket:
+                    cells.append(bucket)
+        return cells
+
+    def within(
+        self,
+        lat: float,
+        lng: float,
+        radius_miles: float,
+        predicate: Optional[Callable[[CourtEntry], bool]] = None,
+    ) -> List[Tuple[float, CourtEntry]]:
+        """(distance_miles, entry) for courts within radius_miles, nearest first."""
+        found = []
+        for bucket in self._candidate_cells(lat, lng, radius_miles):
+            for entry in bucket:
+                if predicate is not None and not predicate(entry):
+                    continue
+                distance = calculate_distance_miles(lat, lng, entry.latitude, entry.longitude)
+                if distance <= radius_miles:
+                    found.append((distance, entry))
+        found.sort(key=lambda item: (item[0], item[1].id))
+        return found
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        limit: int,
+        predicate: Optional[Callable[[CourtEntry], bool]] = None,
+    ) -> List[Tuple[float, CourtEntry]]:
+        """
+        Up to limit (distance_miles, entry) pairs, nearest first.
+
+        Everything within a radius has been found once that radius' query
+        returns limit courts, so the search widens until it does (or covers
+        the globe).
+        """
+        if limit <= 0 or not self._cells:
+            return []
+        radius = NEAREST_START_MILES
+        while True:
+            found = self.within(lat, lng, radius, predicate)
+            if len(found) >= limit or radius >= _HALF_CIRCUMFERENCE_MILES:
+                return found[:limit]
+            radius *= 2
+
+
+_index: Optional[CourtIndex] = None
+
+
+async def get_court_index(session: AsyncSession) -> CourtIndex:
+    """The court index, rebuilt only when the "courts" generation has moved."""
+    global _index
+    # Read before the courts: a write in between tags the index older than its
+    # data, which only costs one more rebuild
+    generation = await stats_cache.current_generation(session, stats_cache.COURTS_SCOPE)
+    index = _index
+    if index is not None and generation is not None and index.generation == generation:
+        return index
+
+    result = await session.execute(
+        select(
+            Court.id,
+            Court.name,
+            Court.slug,
+            Court.address,
+            Court.location_id,
+            Location.region_id,
+            Court.surface_type,
+            Court.average_rating,
+            Court.review_count,
+            Court.is_free,
+            Court.has_lights,
+            Court.has_restrooms,
+            Court.has_parking,
+            Court.nets_provided,
+            Court.latitude,
+            Court.longitude,
+        )
+        .outerjoin(Location, Court.location_id == Location.id)
+        .where(and_(Court.status == "approved", Court.is_active == True))  # noqa: E712
+    )
+    index = CourtIndex(generation, [CourtEntry(*row) for row in result.all()])
+    if generation is not None:
+        _index = index
+    return index
+
+
+def reset() -> None:
+    """Drop the index (used by tests)."""
+    global _index
+    _index = None
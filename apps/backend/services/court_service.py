@@ -25,6 +25,7 @@ from backend.database.models import (
     CourtTag,
     Location,
     Match,
+    MatchParticipant,
     Player,
     Session,
     SessionStatus,
@@ -559,44 +560,23 @@ async def get_court_leaderboard(
     Counts matches played at the court (via sessions) and calculates win rate.
     Returns ranked list of players with match_count, win_count, win_rate.
     """
-    # Build a union of all player appearances in matches at this court.
-    # Each match has 4 player slots across two teams; a player "wins" if
-    # they're on the winning team.
-    player_slots = [
-        (Match.team1_player1_id, 1),
-        (Match.team1_player2_id, 1),
-        (Match.team2_player1_id, 2),
-        (Match.team2_player2_id, 2),
-    ]
-
-    selects = []
-    for col, winning_team in player_slots:
-        selects.append(
-            select(
-                Match.id.label("match_id"),
-                col.label("player_id"),
-                case((Match.winner == winning_team, 1), else_=0).label("is_win"),
-            )
-            .join(Session, Session.id == Match.session_id)
-            .where(
-                Session.court_id == court_id,
-                Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
-                col.isnot(None),
-            )
-        )
-
-    player_match = selects[0].union_all(*selects[1:])
-
-    sub = player_match.subquery()
-
+    # One participant row per player per match at this court; a player
+    # "wins" if they're on the winning team.
+    is_win = case((Match.winner == MatchParticipant.team, 1), else_=0)
     q = (
         select(
-            sub.c.player_id,
-            func.count(sub.c.match_id).label("match_count"),
-            func.sum(sub.c.is_win).label("win_count"),
+            MatchParticipant.player_id,
+            func.count(MatchParticipant.match_id).label("match_count"),
+            func.sum(is_win).label("win_count"),
+        )
+        .join(Match, Match.id == MatchParticipant.match_id)
+        .join(Session, Session.id == MatchParticipant.session_id)
+        .where(
+            Session.court_id == court_id,
+            Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
         )
-        .group_by(sub.c.player_id)
-        .order_by(func.count(sub.c.match_id).desc())
+        .group_by(MatchParticipant.player_id)
+        .order_by(func.count(MatchParticipant.match_id).desc())
         .limit(limit)
     )
 
@@ -7,6 +7,7 @@ marking messages as read, and unread count queries.
 
 import json
 import logging
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +19,7 @@ from backend.services import friend_service, notification_service
 from backend.services.notification_service import notification_to_dict
 from backend.services.websocket_manager import get_websocket_manager
 from backend.utils.datetime_utils import utcnow
+from backend.utils.pagination import after_cursor, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +121,7 @@ async def get_conversations(
     player_id: int,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Get the conversation list for a player, sorted by most recent message.
@@ -130,10 +133,14 @@ async def get_conversations(
         session: Database session
         player_id: Current player's ID
         limit: Max conversations to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored with a cursor)
+        cursor: next_cursor of the previous page; returns the conversations after it
 
     Returns:
-        Dict with conversations list and total_count
+        Dict with conversations list, total_count and next_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
     # Subquery: for each message, determine the "other" player_id
     other_player = case(
@@ -153,7 +160,7 @@ async def get_conversations(
             func.row_number()
             .over(
                 partition_by=other_player,
-                order_by=DirectMessage.created_at.desc(),
+                order_by=(DirectMessage.created_at.desc(), DirectMessage.id.desc()),
             )
             .label("rn"),
         )
@@ -174,11 +181,14 @@ async def get_conversations(
     total_result = await session.execute(count_q)
     total_count = total_result.scalar_one() or 0
 
-    # Fetch paginated conversations joined with player info
+    # Fetch paginated conversations joined with player info, one extra to
+    # tell whether more follow
     OtherPlayer = aliased(Player)
+    sort_key = [latest.c.created_at, latest.c.msg_id]
     conversations_q = (
         select(
             latest.c.other_player_id,
+            latest.c.msg_id,
             latest.c.message_text,
             latest.c.sender_player_id,
             latest.c.created_at,
@@ -186,13 +196,20 @@ async def get_conversations(
             OtherPlayer.profile_picture_url,
         )
         .join(OtherPlayer, OtherPlayer.id == latest.c.other_player_id)
-        .order_by(latest.c.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        .order_by(*(col.desc() for col in sort_key))
+        .limit(limit + 1)
     )
+    if cursor:
+        conversations_q = conversations_q.where(
+            after_cursor(sort_key, decode_cursor(cursor, datetime.fromisoformat, int))
+        )
+    else:
+        conversations_q = conversations_q.offset(offset)
 
     result = await session.execute(conversations_q)
     rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     # Get unread counts per conversation partner (messages TO me that are unread)
     unread_q = (
@@ -229,7 +246,8 @@ async def get_conversations(
             }
         )
 
-    return {"items": conversations, "total_count": total_count}
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].msg_id) if has_more else None
+    return {"items": conversations, "total_count": total_count, "next_cursor": next_cursor}
 
 
 async def get_thread(
@@ -238,6 +256,7 @@ async def get_thread(
     other_player_id: int,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Get messages in a thread between two players, newest first.
@@ -247,10 +266,14 @@ async def get_thread(
         player_id: Current player's ID
         other_player_id: The other player's ID
         limit: Max messages to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored with a cursor)
+        cursor: next_cursor of the previous page; returns the (older) messages after it
 
     Returns:
-        Dict with messages list, total_count, and has_more
+        Dict with messages list, total_count, has_more and next_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
     base_filter = or_(
         and_(
@@ -268,20 +291,34 @@ async def get_thread(
     total_result = await session.execute(count_q)
     total_count = total_result.scalar_one() or 0
 
-    # Fetch messages (newest first for pagination, frontend reverses for display)
+    # Fetch messages (newest first for pagination, frontend reverses for display),
+    # one extra to tell whether more follow
+    sort_key = [DirectMessage.created_at, DirectMessage.id]
     messages_q = (
         select(DirectMessage)
         .where(base_filter)
-        .order_by(DirectMessage.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        .order_by(*(col.desc() for col in sort_key))
+        .limit(limit + 1)
     )
+    if cursor:
+        messages_q = messages_q.where(
+            after_cursor(sort_key, decode_cursor(cursor, datetime.fromisoformat, int))
+        )
+    else:
+        messages_q = messages_q.offset(offset)
     result = await session.execute(messages_q)
-    messages = [_dm_to_dict(dm) for dm in result.scalars().all()]
-
-    has_more = (offset + len(messages)) < total_count
+    dms = result.scalars().all()
+    has_more = len(dms) > limit
+    dms = dms[:limit]
+    messages = [_dm_to_dict(dm) for dm in dms]
 
-    return {"items": messages, "total_count": total_count, "has_more": has_more}
+    next_cursor = encode_cursor(dms[-1].created_at, dms[-1].id) if has_more else None
+    return {
+        "items": messages,
+        "total_count": total_count,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
 
 
 async def mark_thread_read(
@@ -0,0 +1,228 @@
+"""
+Batch ELO backtesting: replay the match history under many rating
+configurations at once and score each one's predictions.
+
+The match stream is encoded once into arrays (encode_matches). backtest_elo
+then keeps ratings as a players x configs matrix, so each match costs a few
+vector operations over all configurations instead of one StatsTracker replay
+per configuration. Before applying a match it records every configuration's
+predicted team 1 win probability, and scores those predictions against the
+result: log loss, Brier score, accuracy and calibration.
+
+Replays follow StatsTracker's global ELO: a team's rating is the mean of its
+players, both teammates move by the team delta, ties score 0.5 and unranked
+(placeholder) matches are skipped. Everyone starts at the same rating, so the
+initial rating (INITIAL_ELO) only shifts all ratings by a constant and never
+changes a prediction; it is not a parameter here.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.services import stats_calc_data
+from backend.utils.constants import K, USE_POINT_DIFFERENTIAL
+
+# Predictions are scored in blocks of this many matches (bounds memory to
+# block x configs floats however long the history is)
+BACKTEST_BLOCK_SIZE = 4096
+# Probabilities are clipped to [eps, 1 - eps] for log loss
+_LOG_LOSS_EPS = 1e-15
+
+
+class EloConfig(NamedTuple):
+    """One rating configuration to backtest."""
+
+    k: float = K
+    use_point_differential: bool = USE_POINT_DIFFERENTIAL
+
+
+class EncodedMatches(NamedTuple):
+    """A match stream as arrays, in replay order."""
+
+    match_ids: np.ndarray  # (M,) match IDs
+    player_ids: np.ndarray  # (P,) player ID of each rating row
+    seats: np.ndarray  # (M, 4) rating rows: team 1 player 1, player 2, team 2 ...
+    outcome: np.ndarray  # (M,) team 1 result: 1.0 win, 0.0 loss, 0.5 tie
+    margin_score: np.ndarray  # (M,) team 1 score with point differential
+
+
+def elo_config_grid(
+    k_values: Iterable[float], use_point_differential: Sequence[bool] = (False, True)
+) -> List[EloConfig]:
+    """Every combination of the given K-factors and point-differential settings."""
+    return [EloConfig(k, pd) for pd in use_point_differential for k in k_values]
+
+
+def _margin_scores(team1: np.ndarray, team2: np.ndarray, outcome: np.ndarray) -> np.ndarray:
+    """Vectorized calculation_service.normalize_score with point differential on."""
+    winning = np.where(outcome == 1.0, team1, team2).astype(float)
+    adjusted1 = team1 + (10 - winning)
+    adjusted2 = team2 + (10 - winning)
+    total = adjusted1 + adjusted2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(total != 0, adjusted1 / total, outcome)
+    return np.where(outcome == 0.5, 0.5, scores)
+
+
+def encode_matches(matches: Iterable) -> EncodedMatches:
+    """
+    Encode ranked matches as arrays for backtest_elo.
+
+    Args:
+        matches: Match ORM objects or ReplayMatch tuples, in replay order;
+            unranked matches are dropped
+
+    Returns:
+        EncodedMatches
+    """
+    match_ids, seat_ids, scores = [], [], []
+    for match in matches:
+        if not match.is_ranked:
+            continue
+        (p1, p2), (p3, p4) = match.player_ids
+        match_ids.append(match.id)
+        seat_ids.append((p1, p2, p3, p4))
+        scores.append((match.team1_score, match.team2_score))
+
+    seat_array = np.array(seat_ids, dtype=np.int64).reshape(-1, 4)
+    player_ids, rows = np.unique(seat_array, return_inverse=True)
+    score_array = np.array(scores, dtype=float).reshape(-1, 2)
+    team1, team2 = score_array[:, 0], score_array[:, 1]
+    outcome = np.select([team1 > team2, team1 < team2], [1.0, 0.0], 0.5)
+    return EncodedMatches(
+        match_ids=np.array(match_ids, dtype=np.int64),
+        player_ids=player_ids,
+        seats=rows.reshape(-1, 4),
+        outcome=outcome,
+        margin_score=_margin_scores(team1, team2, outcome),
+    )
+
+
+async def load_backtest_matches_async(
+    session: AsyncSession, season_id: Optional[int] = None, league_id: Optional[int] = None
+) -> EncodedMatches:
+    """Load and encode the stat-eligible match stream (optionally one season or league)."""
+    matches = await stats_calc_data.load_replay_matches_async(
+        session, season_id=season_id, league_id=league_id
+    )
+    return encode_matches(matches)
+
+
+def backtest_elo(
+    encoded: EncodedMatches,
+    configs: Sequence[EloConfig],
+    warmup: int = 0,
+    calibration_bins: int = 10,
+) -> List[Dict]:
+    """
+    Replay encoded matches under every configuration and score the predictions.
+
+    Args:
+        encoded: Matches from encode_matches
+        configs: Configurations to evaluate
+        warmup: Leading matches that are replayed but not scored, while
+            ratings are still uninformative
+        calibration_bins: Equal-width predicted-probability bins for calibration
+
+    Returns:
+        One dict per config, in order: k, use_point_differential, matches
+        (scored), log_loss, brier, accuracy (decisive matches only),
+        calibration_error (count-weighted mean |predicted - observed| over
+        bins) and calibration ([{predicted, observed, count}] per non-empty bin)
+    """
+    if not configs:
+        return []
+    n_configs = len(configs)
+    k = np.array([c.k for c in configs], dtype=float)
+    margin_weight = np.array([c.use_point_differential for c in configs], dtype=float)
+
+    # Ratings relative to the shared initial rating
+    ratings = np.zeros((len(encoded.player_ids), n_configs))
+    seats, outcome, margin = encoded.seats, encoded.outcome, encoded.margin_score
+    n_matches = len(seats)
+
+    log_loss = np.zeros(n_configs)
+    brier = np.zeros(n_configs)
+    correct = np.zeros(n_configs)
+    decisive = 0
+    bin_offsets = np.arange(n_configs)[None, :] * calibration_bins
+    bin_count = np.zeros(n_configs * calibration_bins)
+    bin_predicted = np.zeros(n_configs * calibration_bins)
+    bin_observed = np.zeros(n_configs * calibration_bins)
+
+    for start in range(0, n_matches, BACKTEST_BLOCK_SIZE):
+        end = min(start + BACKTEST_BLOCK_SIZE, n_matches)
+        predicted = np.empty((end - start, n_configs))
+        for i in range(start, end):
+            a, b, c, d = seats[i]
+            team_gap = (ratings[c] + ratings[d] - ratings[a] - ratings[b]) / 2
+            p = 1 / (1 + 10 ** (team_gap / 400))
+            predicted[i - start] = p
+            target = outcome[i] + margin_weight * (margin[i] - outcome[i])
+            delta = k * (target - p)
+            ratings[a] += delta
+            ratings[b] += delta
+            ratings[c] -= delta
+            ratings[d] -= delta
+
+        # Score the block (minus any warmup matches in it)
+        skip = max(warmup - start, 0)
+        if skip >= end - start:
+            continue
+        p = predicted[skip:]
+        y = outcome[start + skip : end, None]
+        clipped = np.clip(p, _LOG_LOSS_EPS, 1 - _LOG_LOSS_EPS)
+        log_loss -= (y * np.log(clipped) + (1 - y) * np.log(1 - clipped)).sum(axis=0)
+        brier += ((p - y) ** 2).sum(axis=0)
+        is_decisive = y[:, 0] != 0.5
+        decisive += int(is_decisive.sum())
+        correct += ((p[is_decisive] > 0.5) == (y[is_decisive] == 1.0)).sum(axis=0)
+
+        bins = np.minimum((p * calibration_bins).astype(int), calibration_bins - 1)
+        index = (bins + bin_offsets).ravel()
+        size = n_configs * calibration_bins
+        bin_count += np.bincount(index, minlength=size)
+        bin_predicted += np.bincount(index, weights=p.ravel(), minlength=size)
+        bin_observed += np.bincount(
+            index, weights=np.broadcast_to(y, p.shape).ravel(), minlength=size
+        )
+
+    scored = max(n_matches - warmup, 0)
+    bin_count = bin_count.reshape(n_configs, calibration_bins)
+    bin_predicted = bin_predicted.reshape(n_configs, calibration_bins)
+    bin_observed = bin_observed.reshape(n_configs, calibration_bins)
+
+    results = []
+    for j, config in enumerate(configs):
+        calibration = []
+        calibration_error = 0.0
+        for counted, predicted_sum, observed_sum in zip(
+            bin_count[j], bin_predicted[j], bin_observed[j]
+        ):
+            if not counted:
+                continue
+            mean_predicted = predicted_sum / counted
+            mean_observed = observed_sum / counted
+            calibration_error += counted * abs(mean_predicted - mean_observed)
+            calibration.append(
+                {
+                    "predicted": float(mean_predicted),
+                    "observed": float(mean_observed),
+                    "count": int(counted),
+                }
+            )
+        results.append(
+            {
+                "k": config.k,
+                "use_point_differential": config.use_point_differential,
+                "matches": scored,
+                "log_loss": float(log_loss[j] / scored) if scored else None,
+                "brier": float(brier[j] / scored) if scored else None,
+                "accuracy": float(correct[j] / decisive) if decisive else None,
+                "calibration_error": float(calibration_error / scored) if scored else None,
+                "calibration": calibration,
+            }
+        )
+    return results
@@ -15,6 +15,7 @@ from backend.services.data_service import (
     get_session_match_player_user_ids,
 )
 from backend.utils.datetime_utils import utcnow
+from backend.utils.pagination import after_cursor, decode_cursor, encode_cursor
 import json
 import logging
 
@@ -221,6 +222,7 @@ async def get_user_notifications(
     limit: int = 50,
     offset: int = 0,
     unread_only: bool = False,
+    cursor: Optional[str] = None,
 ) -> Dict:
     """
     Fetch user notifications with pagination.
@@ -229,14 +231,19 @@ async def get_user_notifications(
         session: Database session
         user_id: ID of the user
         limit: Maximum number of notifications to return (default: 50)
-        offset: Number of notifications to skip (default: 0)
+        offset: Number of notifications to skip (default: 0, ignored with a cursor)
         unread_only: If True, only return unread notifications (default: False)
+        cursor: next_cursor of the previous page; returns the notifications after it
 
     Returns:
         Dict containing:
             - items: List of notification dicts (ordered by created_at DESC)
             - total_count: Total number of notifications matching the criteria
             - has_more: Boolean indicating if there are more notifications
+            - next_cursor: Cursor for the next page (None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
     # Build query
     query = select(Notification).where(Notification.user_id == user_id)
@@ -249,20 +256,29 @@ async def get_user_notifications(
     total_result = await session.execute(count_query)
     total_count = total_result.scalar_one() or 0
 
-    # Get paginated notifications
-    query = query.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
+    # Get paginated notifications, one extra to tell whether more follow
+    sort_key = [Notification.created_at, Notification.id]
+    if cursor:
+        query = query.where(
+            after_cursor(sort_key, decode_cursor(cursor, datetime.fromisoformat, int))
+        )
+    else:
+        query = query.offset(offset)
+    query = query.order_by(*(col.desc() for col in sort_key)).limit(limit + 1)
     result = await session.execute(query)
     notifications = result.scalars().all()
+    has_more = len(notifications) > limit
+    notifications = notifications[:limit]
 
     # Convert to dicts
     notification_dicts = [notification_to_dict(notif) for notif in notifications]
 
-    has_more = (offset + len(notification_dicts)) < total_count
-
+    last = notifications[-1] if notifications else None
     return {
         "items": notification_dicts,
         "total_count": total_count,
         "has_more": has_more,
+        "next_cursor": encode_cursor(last.created_at, last.id) if has_more else None,
     }
 
 
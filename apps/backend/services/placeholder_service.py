@@ -15,8 +15,9 @@ from typing import Optional
 from backend.utils.constants import APP_NAME
 from backend.utils.slugify import slugify
 
-from sqlalchemy import select, and_, or_, func, update, delete
+from sqlalchemy import select, and_, func, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.database.models import (
     Player,
@@ -24,6 +25,7 @@ from backend.database.models import (
     InviteStatus,
     LeagueMember,
     Match,
+    MatchParticipant,
     League,
     SessionParticipant,
     NotificationType,
@@ -292,10 +294,8 @@ async def delete_placeholder(
 
     unknown_id = unknown_player.id
 
-    # Find all matches referencing this placeholder (any of the 4 FK columns)
-    match_condition = or_(*(getattr(Match, col) == player_id for col in MATCH_PLAYER_FK_COLS))
-    count_result = await session.execute(select(func.count(Match.id)).where(match_condition))
-    affected_count = count_result.scalar() or 0
+    # Count matches referencing this placeholder (in any of the 4 FK columns)
+    affected_count = await _count_matches_for_player(session, player_id)
 
     # Reassign each FK column and mark affected matches as unranked
     for col_name in MATCH_PLAYER_FK_COLS:
@@ -369,8 +369,11 @@ async def _count_matches_for_player(
     Returns:
         Number of matches involving this player
     """
-    condition = or_(*(getattr(Match, col) == player_id for col in MATCH_PLAYER_FK_COLS))
-    result = await session.execute(select(func.count(Match.id)).where(condition))
+    result = await session.execute(
+        select(func.count(MatchParticipant.match_id)).where(
+            MatchParticipant.player_id == player_id
+        )
+    )
     return result.scalar() or 0
 
 
@@ -381,7 +384,7 @@ async def _batch_count_matches(
     """
     Batch-count matches for multiple players in a single query.
 
-    Uses UNION ALL of the 4 FK columns, then GROUP BY player_id.
+    Reads match_participants (one row per player per match), grouped by player_id.
 
     Args:
         session: Database session
@@ -393,21 +396,11 @@ async def _batch_count_matches(
     if not player_ids:
         return {}
 
-    from sqlalchemy import union_all
-
-    # Build a subquery that unions all 4 FK columns
-    subqueries = []
-    for col_name in MATCH_PLAYER_FK_COLS:
-        col = getattr(Match, col_name)
-        subqueries.append(
-            select(col.label("player_id"), Match.id.label("match_id")).where(col.in_(player_ids))
-        )
-
-    combined = union_all(*subqueries).subquery()
-    pid_col = combined.c.player_id
-    mid_col = combined.c.match_id
-
-    stmt = select(pid_col, func.count(func.distinct(mid_col))).group_by(pid_col)
+    stmt = (
+        select(MatchParticipant.player_id, func.count(MatchParticipant.match_id))
+        .where(MatchParticipant.player_id.in_(player_ids))
+        .group_by(MatchParticipant.player_id)
+    )
     result = await session.execute(stmt)
     return {row[0]: row[1] for row in result.all()}
 
@@ -546,13 +539,15 @@ async def merge_placeholder_into_player(
         MergeConflictError: If any match contains both placeholder and target
     """
     # 1. Reject if placeholder and target both appear in any match
-    placeholder_condition = or_(
-        *(getattr(Match, col) == placeholder_id for col in MATCH_PLAYER_FK_COLS)
-    )
-    target_condition = or_(
-        *(getattr(Match, col) == target_player_id for col in MATCH_PLAYER_FK_COLS)
+    target_participant = aliased(MatchParticipant)
+    conflict_stmt = (
+        select(MatchParticipant.match_id)
+        .join(target_participant, target_participant.match_id == MatchParticipant.match_id)
+        .where(
+            MatchParticipant.player_id == placeholder_id,
+            target_participant.player_id == target_player_id,
+        )
     )
-    conflict_stmt = select(Match.id).where(and_(placeholder_condition, target_condition))
     conflict_result = await session.execute(conflict_stmt)
     conflicting_match_ids = [row[0] for row in conflict_result.all()]
 
@@ -664,13 +659,11 @@ async def flip_ranked_status_for_resolved_matches(
         Count of matches flipped from unranked to ranked
     """
     # Find all unranked matches involving this player
-    match_condition = or_(
-        Match.team1_player1_id == player_id,
-        Match.team1_player2_id == player_id,
-        Match.team2_player1_id == player_id,
-        Match.team2_player2_id == player_id,
+    stmt = (
+        select(Match)
+        .join(MatchParticipant, MatchParticipant.match_id == Match.id)
+        .where(MatchParticipant.player_id == player_id, Match.is_ranked.is_(False))
     )
-    stmt = select(Match).where(and_(match_condition, Match.is_ranked.is_(False)))
     result = await session.execute(stmt)
     matches = result.scalars().all()
 
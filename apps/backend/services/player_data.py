@@ -37,6 +37,7 @@ from backend.database.models import (
     PlayerGlobalStats,
     Court,
 )
+from backend.services import stats_cache
 
 
 # ---------------------------------------------------------------------------
@@ -441,6 +442,9 @@ async def upsert_user_player(
             await session.execute(
                 update(Player).where(Player.user_id == user_id).values(**update_values)
             )
+            if "full_name" in update_values or "nickname" in update_values:
+                # Names are part of cached stats reads
+                await stats_cache.bump_generation(session, stats_cache.PLAYERS_SCOPE)
             await session.commit()
             await session.refresh(player)
 
@@ -0,0 +1,133 @@
+"""
+In-memory ratings snapshot for previewing matches before they are played.
+
+Holds every player's global ELO (player_global_stats) and, per season-rating
+season, their season rating (player_season_stats), each tagged with the stats
+generation it was read at (see stats_cache). A lookup compares that tag with
+the scope's current generation - answered from memory while the NOTIFY feed is
+attached - and reloads only after a stats job (or another writer) has moved
+it. Previews then cost a few dict lookups and one ELO formula per pairing, with
+no database round trip.
+"""
+
+from typing import Dict, NamedTuple, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models import PlayerGlobalStats, PlayerSeasonStats, ScoringSystem, Season
+from backend.services import stats_cache
+from backend.services.calculation_service import elo_change, expected_score
+from backend.utils.constants import INITIAL_ELO, SEASON_INITIAL_RATING, SEASON_K, K
+
+
+class RatingsSnapshot(NamedTuple):
+    """Ratings of one scope as of a stats generation."""
+
+    generation: Optional[int]
+    ratings: Dict[int, float]
+    initial_rating: float  # For players without stats yet
+    k: float
+
+    def team_rating(self, player_ids: Sequence[int]) -> float:
+        """Mean rating of a team, as StatsTracker rates teams."""
+        return sum(self.ratings.get(pid, self.initial_rating) for pid in player_ids) / len(
+            player_ids
+        )
+
+    def preview(self, team1: Sequence[int], team2: Sequence[int]) -> Dict:
+        """
+        Team 1's win probability and rating swing against team 2.
+
+        Returns:
+            Dict with team1_rating, team2_rating, expected_score (team 1's),
+            change_if_win and change_if_loss (per team 1 player; team 2 players
+            move by the opposite amount). These are for a straight win or loss;
+            with USE_POINT_DIFFERENTIAL on, closer results move ratings less.
+        """
+        rating1 = self.team_rating(team1)
+        rating2 = self.team_rating(team2)
+        expected = expected_score(rating1, rating2)
+        return {
+            "team1_rating": rating1,
+            "team2_rating": rating2,
+            "expected_score": expected,
+            "change_if_win": elo_change(self.k, rating1, expected, 1.0),
+            "change_if_loss": elo_change(self.k, rating1, expected, 0.0),
+        }
+
+
+class _SeasonEntry(NamedTuple):
+    league_id: int
+    generation: Optional[int]
+    snapshot: Optional[RatingsSnapshot]  # None: the season doesn't use season ratings
+
+
+_global: Optional[RatingsSnapshot] = None
+_seasons: Dict[int, _SeasonEntry] = {}
+
+
+async def get_global_ratings(session: AsyncSession) -> RatingsSnapshot:
+    """Every player's global ELO, reloaded only when GLOBAL_SCOPE has moved."""
+    global _global
+    # Read before the ratings: if a job finishes in between, the snapshot is
+    # tagged older than its data and merely reloads once more
+    generation = await stats_cache.current_generation(session, stats_cache.GLOBAL_SCOPE)
+    snapshot = _global
+    if snapshot is not None and generation is not None and snapshot.generation == generation:
+        return snapshot
+
+    result = await session.execute(
+        select(PlayerGlobalStats.player_id, PlayerGlobalStats.current_rating)
+    )
+    snapshot = RatingsSnapshot(generation, dict(result.all()), INITIAL_ELO, K)
+    if generation is not None:
+        _global = snapshot
+    return snapshot
+
+
+async def get_season_ratings(session: AsyncSession, season_id: int) -> Optional[RatingsSnapshot]:
+    """
+    Season ratings of a season, reloaded only when its league's scope has moved.
+
+    Returns:
+        RatingsSnapshot, or None if the season doesn't exist or doesn't use
+        season ratings
+    """
+    entry = _seasons.get(season_id)
+    if entry is not None:
+        generation = await stats_cache.current_generation(
+            session, stats_cache.league_scope(entry.league_id)
+        )
+        if generation is not None and entry.generation == generation:
+            return entry.snapshot
+
+    season = (
+        await session.execute(
+            select(Season.league_id, Season.scoring_system).where(Season.id == season_id)
+        )
+    ).one_or_none()
+    if season is None:
+        return None
+    generation = await stats_cache.current_generation(
+        session, stats_cache.league_scope(season.league_id)
+    )
+
+    snapshot = None
+    if season.scoring_system == ScoringSystem.SEASON_RATING.value:
+        result = await session.execute(
+            select(PlayerSeasonStats.player_id, PlayerSeasonStats.points).where(
+                PlayerSeasonStats.season_id == season_id
+            )
+        )
+        snapshot = RatingsSnapshot(generation, dict(result.all()), SEASON_INITIAL_RATING, SEASON_K)
+    if generation is not None:
+        _seasons[season_id] = _SeasonEntry(season.league_id, generation, snapshot)
+    return snapshot
+
+
+def reset() -> None:
+    """Drop all snapshots (used by tests)."""
+    global _global
+    _global = None
+    _seasons.clear()
@@ -0,0 +1,168 @@
+"""
+Run CPU-bound stats replays outside the API process's event loop.
+
+Large replays run in a dedicated child process (spawned, so nothing from the
+parent's event loop or DB pool is inherited). Inputs and outputs are plain
+picklable values: matches are streamed to the child in chunks as they are
+loaded, and every item the replay generator yields is sent back as its own
+message, so neither side holds or unpickles a huge payload in one go and the
+parent can persist results (e.g. checkpoints) while the replay is still
+running. Pipe I/O happens in threads, so the event loop keeps serving requests.
+
+Small replays (the common incremental case) run inline, where starting a
+process would cost more than the replay itself.
+"""
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import weakref
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+# Replays over at least this many matches run in a child process
+REPLAY_PROCESS_MIN_MATCHES = int(os.getenv("STATS_REPLAY_PROCESS_MIN_MATCHES", "5000"))
+# Maximum number of replay processes running at once
+MAX_REPLAY_PROCESSES = max(1, int(os.getenv("STATS_REPLAY_PROCESSES", "2")))
+_ITEM, _DONE, _ERROR = "item", "done", "error"
+
+_mp_context = multiprocessing.get_context("spawn")
+# One semaphore per event loop (asyncio primitives are bound to a loop)
+_process_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _recv_items(conn) -> Iterator:
+    """Yield the items of each chunk the parent sends, until it sends _DONE."""
+    while True:
+        kind, chunk = conn.recv()
+        if kind == _DONE:
+            return
+        yield from chunk
+
+
+def _child_main(conn) -> None:
+    """Child process entry point: receive the job, stream back what it yields."""
+    try:
+        fn, args = conn.recv()
+        for item in fn(_recv_items(conn), *args):
+            conn.send((_ITEM, item))
+        conn.send((_DONE, None))
+    except BaseException as exc:
+        # Report everything, including SystemExit/KeyboardInterrupt, to the parent
+        try:
+            conn.send((_ERROR, exc))
+        except Exception:
+            conn.send((_ERROR, RuntimeError(f"{type(exc).__name__}: {exc}")))
+    finally:
+        conn.close()
+
+
+async def _iter_in_process(
+    fn: Callable, chunks: AsyncIterable[List], args: tuple
+) -> AsyncIterator[Any]:
+    loop = asyncio.get_running_loop()
+    slots = _process_slots.setdefault(loop, asyncio.Semaphore(MAX_REPLAY_PROCESSES))
+    async with slots:
+        parent_conn, child_conn = _mp_context.Pipe()
+        process = _mp_context.Process(target=_child_main, args=(child_conn,), daemon=True)
+        await loop.run_in_executor(None, process.start)
+        child_conn.close()
+
+        async def feed() -> None:
+            # Runs alongside the receive loop below, so the child's output never
+            # backs up while input is still being sent
+            await loop.run_in_executor(None, parent_conn.send, (fn, args))
+            async for chunk in chunks:
+                await loop.run_in_executor(None, parent_conn.send, (_ITEM, chunk))
+            await loop.run_in_executor(None, parent_conn.send, (_DONE, None))
+
+        def on_feed_done(task: asyncio.Task) -> None:
+            # A failed loader leaves the child waiting for input; stop it so recv() ends
+            if not task.cancelled() and task.exception() is not None:
+                process.terminate()
+
+        feeder = asyncio.create_task(feed())
+        feeder.add_done_callback(on_feed_done)
+        try:
+            while True:
+                try:
+                    kind, payload = await loop.run_in_executor(None, parent_conn.recv)
+                except EOFError:
+                    if feeder.done() and not feeder.cancelled() and feeder.exception():
+                        raise feeder.exception()
+                    raise RuntimeError(
+                        f"Replay process exited unexpectedly (exit code {process.exitcode})"
+                    )
+                if kind == _ITEM:
+                    yield payload
+                elif kind == _DONE:
+                    # Surface loader errors; the child only finishes after its input did
+                    await feeder
+                    return
+                else:
+                    raise payload
+        finally:
+            if not feeder.done():
+                feeder.cancel()
+            # Waits for a cancelled feeder to unwind; its exception (if any) is either
+            # already raised above or secondary to the one being raised
+            await asyncio.gather(feeder, return_exceptions=True)
+            parent_conn.close()
+            if process.is_alive():
+                process.terminate()
+            await loop.run_in_executor(None, process.join)
+
+
+async def iter_replay(fn: Callable[..., Iterator], items: List, *args) -> AsyncIterator[Any]:
+    """
+    Iterate fn(items, *args), in a child process when items is large.
+
+    See iter_replay_stream; items is sent as a single chunk.
+    """
+
+    async def single_chunk():
+        yield items
+
+    async with contextlib.aclosing(
+        iter_replay_stream(fn, single_chunk(), len(items), *args)
+    ) as stream:
+        async for item in stream:
+            yield item
+
+
+async def iter_replay_stream(
+    fn: Callable[..., Iterator], chunks: AsyncIterable[List], count: int, *args
+) -> AsyncIterator[Any]:
+    """
+    Iterate fn(<items of chunks>, *args), in a child process when count is large.
+
+    fn must be a module-level generator function that accepts any iterable as its
+    first argument, and items/args/yielded values must be picklable. Exceptions
+    raised by fn, or by chunks while it is being consumed, are re-raised here.
+
+    Args:
+        fn: Generator function (e.g. calculation_service.iter_global_replay)
+        chunks: Lists of work items (e.g. ReplayMatch tuples), in order
+        count: Expected number of items; only used to choose inline vs process
+        *args: Remaining arguments for fn
+
+    Yields:
+        Whatever fn yields, in order
+    """
+    if count < REPLAY_PROCESS_MIN_MATCHES:
+        # Small enough to hold at once
+        items = [item async for chunk in chunks for item in chunk]
+        for item in fn(items, *args):
+            yield item
+        return
+
+    logger.info("Running %s over ~%s items in a replay process", fn.__name__, count)
+    # aclosing: stop the child promptly if the caller stops iterating early
+    async with contextlib.aclosing(_iter_in_process(fn, chunks, args)) as stream:
+        async for item in stream:
+            yield item
@@ -38,6 +38,7 @@ __all__ = [
     "get_session_match_player_user_ids",
 ]
 
+from backend.services import stats_cache
 from backend.services.session_geo_service import resolve_session_geo
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,6 +53,7 @@ from backend.database.models import (
     Player,
     Session,
     Match,
+    MatchParticipant,
     SessionParticipant,
     EloHistory,
     SeasonRatingHistory,
@@ -71,6 +73,29 @@ SESSION_CODE_LENGTH = 8
 SESSION_CODE_MAX_ATTEMPTS = 10
 
 
+async def _bump_league_generations(session: AsyncSession, season_ids=(), session_ids=()) -> None:
+    """
+    Invalidate cached reads (league match lists) of the leagues these seasons or
+    sessions belong to. Call before committing the change.
+    """
+    season_ids = [season_id for season_id in season_ids if season_id]
+    if not season_ids and not session_ids:
+        return
+    result = await session.execute(
+        select(Season.league_id)
+        .where(
+            or_(
+                Season.id.in_(season_ids),
+                Season.id.in_(select(Session.season_id).where(Session.id.in_(session_ids))),
+            )
+        )
+        .distinct()
+    )
+    scopes = [stats_cache.league_scope(league_id) for league_id in result.scalars()]
+    if scopes:
+        await stats_cache.bump_generation(session, *scopes)
+
+
 # ============================================================================
 # Session read operations
 # ============================================================================
@@ -191,20 +216,9 @@ async def get_open_sessions_for_user(
     Includes league and non-league sessions. Ordered by session date desc, then updated_at desc.
     """
     # Subquery: session IDs where player has at least one match
-    match_sess = (
-        select(Match.session_id)
-        .where(
-            and_(
-                Match.session_id.isnot(None),
-                or_(
-                    Match.team1_player1_id == player_id,
-                    Match.team1_player2_id == player_id,
-                    Match.team2_player1_id == player_id,
-                    Match.team2_player2_id == player_id,
-                ),
-            )
-        )
-        .distinct()
+    match_sess = select(MatchParticipant.session_id).where(
+        MatchParticipant.player_id == player_id,
+        MatchParticipant.session_id.isnot(None),
     )
 
     # Subquery: session IDs where player is in session_participants
@@ -261,35 +275,20 @@ async def get_open_sessions_for_user(
     count_result = await db_session.execute(count_q)
     match_counts = {r.session_id: r.match_count for r in count_result.all()}
 
-    # Match count per session for this specific player
-    player_match_filter = or_(
-        Match.team1_player1_id == player_id,
-        Match.team1_player2_id == player_id,
-        Match.team2_player1_id == player_id,
-        Match.team2_player2_id == player_id,
-    )
+    # Match count per session for this specific player; a session appears
+    # here iff the player has at least one match in it
     user_count_q = (
-        select(Match.session_id, func.count(Match.id).label("user_match_count"))
-        .where(Match.session_id.in_(session_ids))
-        .where(player_match_filter)
-        .group_by(Match.session_id)
+        select(
+            MatchParticipant.session_id,
+            func.count(MatchParticipant.match_id).label("user_match_count"),
+        )
+        .where(MatchParticipant.player_id == player_id)
+        .where(MatchParticipant.session_id.in_(session_ids))
+        .group_by(MatchParticipant.session_id)
     )
     user_count_result = await db_session.execute(user_count_q)
     user_match_counts = {r.session_id: r.user_match_count for r in user_count_result.all()}
-
-    # Session IDs where this player has at least one match
-    match_sess_ids_q = (
-        select(Match.session_id)
-        .where(
-            and_(
-                Match.session_id.isnot(None),
-                player_match_filter,
-            )
-        )
-        .distinct()
-    )
-    match_sess_ids_result = await db_session.execute(match_sess_ids_q)
-    session_ids_with_match = {row[0] for row in match_sess_ids_result.all()}
+    session_ids_with_match = set(user_match_counts)
 
     out = []
     for r in rows:
@@ -736,6 +735,7 @@ async def lock_in_session(
         .where(Session.id == session_id)
         .values(status=new_status, updated_by=updated_by, updated_at=func.now())
     )
+    await _bump_league_generations(session, season_ids=[season_id])
     await session.commit()
 
     if result.rowcount == 0:
@@ -833,6 +833,9 @@ async def update_session(
 
     update_values["updated_at"] = func.now()
     await session.execute(update(Session).where(Session.id == session_id).values(**update_values))
+    await _bump_league_generations(
+        session, season_ids=[session_obj.season_id, update_values.get("season_id")]
+    )
     await session.commit()
 
     result = await session.execute(
@@ -899,6 +902,7 @@ async def delete_session(session: AsyncSession, session_id: int) -> bool:
         league_id = season_result.scalar_one_or_none()
 
     await session.execute(delete(Session).where(Session.id == session_id))
+    await _bump_league_generations(session, season_ids=[season_id])
     await session.commit()
 
     if was_submitted and match_ids:
@@ -1156,6 +1160,7 @@ async def create_match_async(
         await session.execute(
             update(Session).where(Session.id == session_id).values(updated_at=func.now())
         )
+        await _bump_league_generations(session, session_ids=[session_id])
 
     await session.commit()
     await session.refresh(new_match)
@@ -1227,6 +1232,8 @@ async def update_match_async(
             .where(Session.id == match.session_id)
             .values(updated_by=updated_by, updated_at=func.now())
         )
+    if match.session_id:
+        await _bump_league_generations(session, session_ids=[match.session_id])
 
     await session.commit()
     return True
@@ -1255,6 +1262,7 @@ async def delete_match_async(session: AsyncSession, match_id: int) -> bool:
         await session.execute(
             update(Session).where(Session.id == match_session_id).values(updated_at=func.now())
         )
+        await _bump_league_generations(session, session_ids=[match_session_id])
 
     await session.commit()
     return result.rowcount > 0
@@ -1337,17 +1345,10 @@ async def remove_session_participant(
     (cannot remove a player who has played in the session).
     """
     match_check = await db_session.execute(
-        select(Match.id)
+        select(MatchParticipant.match_id)
         .where(
-            and_(
-                Match.session_id == session_id,
-                or_(
-                    Match.team1_player1_id == player_id,
-                    Match.team1_player2_id == player_id,
-                    Match.team2_player1_id == player_id,
-                    Match.team2_player2_id == player_id,
-                ),
-            )
+            MatchParticipant.player_id == player_id,
+            MatchParticipant.session_id == session_id,
         )
         .limit(1)
     )
@@ -1419,17 +1420,10 @@ async def can_user_add_match_to_session(
     if session_obj.get("created_by") == player_id:
         return True
     match_q = (
-        select(Match.id)
+        select(MatchParticipant.match_id)
         .where(
-            and_(
-                Match.session_id == session_id,
-                or_(
-                    Match.team1_player1_id == player_id,
-                    Match.team1_player2_id == player_id,
-                    Match.team2_player1_id == player_id,
-                    Match.team2_player2_id == player_id,
-                ),
-            )
+            MatchParticipant.player_id == player_id,
+            MatchParticipant.session_id == session_id,
         )
         .limit(1)
     )
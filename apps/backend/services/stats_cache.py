@@ -0,0 +1,333 @@
+"""
+Read-through cache for stats endpoints, keyed by stats generation.
+
+Stats only change when something writes them - the stats jobs, plus match and
+profile edits for the views that show those - so instead of expiring cached
+reads after a guessed TTL, every cached read is keyed by the current generation
+of the scopes its data comes from (see StatsGeneration). Writers call
+bump_generation() in the transaction that changes the data; from then on reads
+build new keys, and entries for old generations age out.
+
+Two tiers, both holding the encoded JSON response:
+- an in-process LRU, bounded by STATS_CACHE_MAX_BYTES
+- Redis (through redis_service), shared by all replicas; skipped when Redis is down
+
+Concurrent misses for the same key within a process share one load, so a burst
+of viewers after a session submission costs one DB read per view.
+
+Each process learns new generations from NOTIFYs on the stats queue's LISTEN
+connection (attach_generation_feed). While that connection is down, generations
+are read from the database on every lookup instead. Scopes that have never been
+bumped have no generation, and reads depending on them are not cached.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models import Season, StatsGeneration, stats_generation_seq
+from backend.services import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Budget for the in-process tier (approximate: counts characters of encoded JSON)
+STATS_CACHE_MAX_BYTES = int(os.getenv("STATS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Redis entries never go stale (their keys carry the generation); the expiry only
+# reclaims entries of superseded generations
+STATS_CACHE_REDIS_EXPIRY_SECONDS = int(os.getenv("STATS_CACHE_REDIS_EXPIRY_SECONDS", "86400"))
+REDIS_KEY_PREFIX = "stats_cache:"
+
+# Global ELO, partnership and opponent stats
+GLOBAL_SCOPE = "global"
+# Player names and avatars
+PLAYERS_SCOPE = "players"
+# Listed courts; bumped by a trigger on courts (see court_index)
+COURTS_SCOPE = "courts"
+# Bumped along with every other scope, for reads that span all of them
+ALL_SCOPE = "all"
+
+# NOTIFY channel carrying "<scope>=<generation>" pairs when generations move
+STATS_GENERATION_CHANNEL = "stats_generations"
+
+_UNCACHEABLE = (None, "[]", "{}")
+# Handed to waiters when the load they were waiting on failed
+_RETRY = object()
+
+
+def league_scope(league_id: int) -> str:
+    """Scope of a league's stats, its seasons' stats and its matches."""
+    return f"league:{league_id}"
+
+
+class _LruCache:
+    """Size-bounded LRU of encoded JSON bodies."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[str]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: str) -> None:
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = body
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+_local = _LruCache(STATS_CACHE_MAX_BYTES)
+# Latest generation seen per scope; only trusted while the NOTIFY feed is attached
+_generations: Dict[str, int] = {}
+_feed_live = False
+# Seasons never move between leagues
+_season_leagues: Dict[int, int] = {}
+# In-flight loads by cache key, per event loop (futures are bound to a loop)
+_in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def bump_generation(session: AsyncSession, *scopes: str) -> None:
+    """
+    Move scopes (and ALL_SCOPE) to new generations, invalidating reads keyed by them.
+
+    Runs in the caller's transaction, so the new generations - and the NOTIFY
+    announcing them - become visible together with the data they cover.
+    """
+    # Sorted so concurrent bumps lock rows in the same order
+    scopes = sorted({*scopes, ALL_SCOPE})
+    result = await session.execute(
+        pg_insert(StatsGeneration)
+        .values([{"scope": scope} for scope in scopes])
+        .on_conflict_do_update(
+            index_elements=[StatsGeneration.scope],
+            # Drawn once the row is locked, so a scope's generations increase in
+            # commit order
+            set_={"generation": stats_generation_seq.next_value(), "updated_at": func.now()},
+        )
+        .returning(StatsGeneration.scope, StatsGeneration.generation)
+    )
+    payload = " ".join(f"{scope}={generation}" for scope, generation in result.all())
+    await session.execute(select(func.pg_notify(STATS_GENERATION_CHANNEL, payload)))
+
+
+def _remember_generation(scope: str, generation: int) -> None:
+    if generation > _generations.get(scope, 0):
+        _generations[scope] = generation
+
+
+def _on_generation_notification(connection, pid, channel, payload) -> None:
+    """asyncpg LISTEN callback: record the announced generations."""
+    for item in payload.split():
+        scope, _, generation = item.rpartition("=")
+        _remember_generation(scope, int(generation))
+
+
+async def attach_generation_feed(driver_connection) -> None:
+    """Track generations from NOTIFYs received on an asyncpg LISTEN connection."""
+    global _feed_live
+    await driver_connection.add_listener(STATS_GENERATION_CHANNEL, _on_generation_notification)
+    # Generations remembered before now may have missed a notification
+    _generations.clear()
+    _feed_live = True
+
+
+async def detach_generation_feed(driver_connection) -> None:
+    """Stop trusting remembered generations; lookups go to the database again."""
+    global _feed_live
+    _feed_live = False
+    _generations.clear()
+    if not driver_connection.is_closed():
+        await driver_connection.remove_listener(
+            STATS_GENERATION_CHANNEL, _on_generation_notification
+        )
+
+
+async def _current_generations(
+    session: AsyncSession, scopes: Sequence[str]
+) -> Optional[List[int]]:
+    """Generations of scopes, or None if any of them has never been bumped."""
+    generations = {}
+    missing = []
+    for scope in scopes:
+        if _feed_live and scope in _generations:
+            generations[scope] = _generations[scope]
+        else:
+            missing.append(scope)
+
+    if missing:
+        result = await session.execute(
+            select(StatsGeneration.scope, StatsGeneration.generation).where(
+                StatsGeneration.scope.in_(missing)
+            )
+        )
+        loaded = dict(result.all())
+        if len(loaded) < len(missing):
+            return None
+        for scope, generation in loaded.items():
+            if _feed_live:
+                # A newer generation may have been announced while we were reading
+                _remember_generation(scope, generation)
+                generation = _generations.get(scope, generation)
+            generations[scope] = generation
+
+    return [generations[scope] for scope in scopes]
+
+
+async def current_generation(session: AsyncSession, scope: str) -> Optional[int]:
+    """
+    Current generation of scope, or None if it has never been bumped.
+
+    Answered from memory while the NOTIFY feed is attached.
+    """
+    generations = await _current_generations(session, [scope])
+    return generations[0] if generations else None
+
+
+async def _uncacheable(session: AsyncSession, exc: Exception) -> None:
+    """Give up on caching this read after a failed lookup; the read itself goes ahead."""
+    logger.warning(f"Stats cache lookup failed, reading through: {exc}")
+    await session.rollback()
+
+
+async def _season_league_id(session: AsyncSession, season_id: int) -> Optional[int]:
+    league_id = _season_leagues.get(season_id)
+    if league_id is None:
+        result = await session.execute(select(Season.league_id).where(Season.id == season_id))
+        league_id = result.scalar_one_or_none()
+        if league_id is not None:
+            _season_leagues[season_id] = league_id
+    return league_id
+
+
+async def stats_scopes(
+    session: AsyncSession, season_id=None, league_id=None, elo: bool = False
+) -> Optional[List[str]]:
+    """
+    Scopes a season's or league's stats read depends on.
+
+    Includes PLAYERS_SCOPE (reads show names), plus GLOBAL_SCOPE with elo=True
+    for reads that show ELO ratings or changes. Without either id the read
+    spans everything (ALL_SCOPE).
+
+    Returns:
+        List of scopes, or None (don't cache) for ids that are malformed or do
+        not exist, or when the season lookup fails
+    """
+    try:
+        if season_id is not None:
+            league_id = await _season_league_id(session, int(season_id))
+            if league_id is None:
+                return None
+        elif league_id is None:
+            return [ALL_SCOPE]
+        scopes = [league_scope(int(league_id)), PLAYERS_SCOPE]
+    except (TypeError, ValueError):
+        return None
+    except Exception as e:
+        await _uncacheable(session, e)
+        return None
+    if elo:
+        scopes.append(GLOBAL_SCOPE)
+    return scopes
+
+
+def _encode(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    # Same encoding as FastAPI's JSONResponse
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+async def get_json(
+    session: AsyncSession,
+    key: str,
+    scopes: Optional[Sequence[str]],
+    loader: Callable[[], Awaitable[Any]],
+) -> Optional[str]:
+    """
+    Return loader()'s result encoded as JSON, from cache while its scopes are unchanged.
+
+    Args:
+        session: Database session, used to look up generations
+        key: Identifies the read and its arguments, e.g. "rankings:season=3"
+        scopes: Scopes the read depends on (see stats_scopes); None disables caching
+        loader: Performs the read. Runs at most once per key and generation at a
+            time in this process; concurrent callers wait for its result
+
+    Returns:
+        JSON text, or None when loader returns None. None and empty results are
+        not cached: they are cheap to recompute, and some readers return them
+        on errors.
+    """
+    generations = None
+    if scopes:
+        try:
+            generations = await _current_generations(session, scopes)
+        except Exception as e:
+            await _uncacheable(session, e)
+    if generations is None:
+        return _encode(await loader())
+    cache_key = key + "@" + ",".join(f"{s}={g}" for s, g in zip(scopes, generations))
+
+    body = _local.get(cache_key)
+    if body is not None:
+        return body
+
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.setdefault(loop, {})
+    pending = in_flight.get(cache_key)
+    if pending is not None:
+        # shield: a waiter being cancelled must not cancel the shared result
+        body = await asyncio.shield(pending)
+        if body is not _RETRY:
+            return body
+        return _encode(await loader())
+
+    future = loop.create_future()
+    in_flight[cache_key] = future
+    body = _RETRY
+    try:
+        body = await redis_service.redis_get(REDIS_KEY_PREFIX + cache_key)
+        if body is None:
+            body = _encode(await loader())
+            if body not in _UNCACHEABLE:
+                await redis_service.redis_set(
+                    REDIS_KEY_PREFIX + cache_key, body, STATS_CACHE_REDIS_EXPIRY_SECONDS
+                )
+        if body not in _UNCACHEABLE:
+            _local.put(cache_key, body)
+        return body
+    finally:
+        del in_flight[cache_key]
+        future.set_result(body)
+
+
+def reset() -> None:
+    """Forget everything this process has cached (used by tests)."""
+    _local.clear()
+    _generations.clear()
+    _season_leagues.clear()
@@ -2,29 +2,38 @@
 Stats calculation pipeline: bulk ops and recalculation.
 
 Extracted from stats_data.py.  Covers:
-- load_stat_eligible_matches_async
+- load_stat_eligible_matches_async / load_replay_matches_async
 - delete_*_stats_async helpers
-- Bulk insert/upsert helpers (insert_elo_history_async, upsert_player_global_stats_async, etc.)
-- calculate_global_stats_async
-- _calculate_season_stats_from_matches (internal helper)
+- Bulk COPY/upsert helpers (insert_elo_history_async, upsert_partnership_stats_async, etc.)
+- calculate_global_stats_async (incremental append, checkpoint replay, full rebuild)
+- _calculate_season_stats_from_matches / _write_season_stats_async (internal helpers)
 - calculate_league_stats_async
 - calculate_season_stats_async
+- Leaderboard rebuilds (league/season ranked entries, refreshed with their stats)
+- ELO series rebuilds (per-player sparse timelines, refreshed with EloHistory)
+- Per-match rating results (MatchStats, copied from EloHistory / SeasonRatingHistory)
 - register_stats_queue_callbacks
 """
 
 from __future__ import annotations
 
-from typing import Dict, Generator, List, Optional, TypeVar
+import asyncio
+import logging
+from array import array as int_array
+from contextlib import aclosing, nullcontext
+from typing import AsyncIterator, Dict, Generator, List, Optional, Sequence, Tuple, TypeVar
 
 __all__ = [
     "delete_global_stats_async",
     "delete_season_stats_async",
     "delete_league_stats_async",
     "load_stat_eligible_matches_async",
+    "load_replay_matches_async",
     "delete_all_stats_async",
     "insert_elo_history_async",
     "insert_season_rating_history_async",
-    "upsert_player_global_stats_async",
+    "upsert_partnership_stats_async",
+    "upsert_opponent_stats_async",
     "insert_partnership_stats_async",
     "insert_opponent_stats_async",
     "insert_partnership_stats_season_async",
@@ -35,36 +44,77 @@ __all__ = [
     "calculate_global_stats_async",
     "calculate_league_stats_async",
     "calculate_season_stats_async",
+    "ranked_player_stats_query",
     "register_stats_queue_callbacks",
 ]
 
-from sqlalchemy import and_, delete, func, or_, select
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import (
+    BigInteger,
+    Text,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    aggregate_order_by,
+    array,
+    distinct_on,
+    insert as pg_insert,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, defer, selectinload
 
 from backend.database.models import (
     EloHistory,
     LeagueConfig,
+    LeagueLeaderboardEntry,
     LeagueMember,
     Match,
+    MatchStats,
     OpponentStats,
     OpponentStatsSeason,
     OpponentStatsLeague,
     PartnershipStats,
     PartnershipStatsSeason,
     PartnershipStatsLeague,
+    PlayerEloSeries,
     PlayerGlobalStats,
     PlayerLeagueStats,
     PlayerSeasonStats,
     Season,
+    SeasonLeaderboardEntry,
     SeasonRatingHistory,
     ScoringSystem,
     Session,
     SessionStatus,
+    StatsTrackerCheckpoint,
+    StatsTrackerState,
 )
-from backend.services import calculation_service
-from backend.utils.constants import INITIAL_ELO
+from backend.services import calculation_service, replay_process, stats_cache
+from backend.utils.constants import (
+    INITIAL_ELO,
+    SEASON_INITIAL_RATING,
+    STATS_CHECKPOINT_INTERVAL,
+    STATS_CHECKPOINT_KEEP_RECENT,
+    STATS_MATCH_LOAD_CHUNK_SIZE,
+    USE_COMPACT_STATS_TRACKER,
+)
+
+logger = logging.getLogger(__name__)
+
+# StatsTrackerState scope key for the global ELO / partnership / opponent stats
+GLOBAL_STATE_SCOPE = "global"
 
 
 # ---------------------------------------------------------------------------
@@ -73,10 +123,23 @@ from backend.utils.constants import INITIAL_ELO
 
 
 async def delete_global_stats_async(session: AsyncSession) -> None:
-    """Delete all global stats (EloHistory, PartnershipStats, OpponentStats)."""
+    """
+    Delete all global stats (EloHistory and its series, PartnershipStats, OpponentStats).
+
+    Also drops the persisted global tracker state and checkpoints, since they
+    describe these rows, and clears the global ELO results on MatchStats.
+    """
     await session.execute(delete(EloHistory))
+    await session.execute(delete(PlayerEloSeries))
+    await session.execute(update(MatchStats).values({name: None for name in MATCH_ELO_COLUMNS}))
     await session.execute(delete(PartnershipStats))
     await session.execute(delete(OpponentStats))
+    await session.execute(
+        delete(StatsTrackerState).where(StatsTrackerState.scope == GLOBAL_STATE_SCOPE)
+    )
+    await session.execute(
+        delete(StatsTrackerCheckpoint).where(StatsTrackerCheckpoint.scope == GLOBAL_STATE_SCOPE)
+    )
 
 
 async def delete_season_stats_async(session: AsyncSession, season_id: int) -> None:
@@ -90,9 +153,13 @@ async def delete_season_stats_async(session: AsyncSession, season_id: int) -> No
     await session.execute(
         delete(SeasonRatingHistory).where(SeasonRatingHistory.season_id == season_id)
     )
+    await _sync_match_season_ratings_async(session, season_id)
     await session.execute(
         delete(PlayerSeasonStats).where(PlayerSeasonStats.season_id == season_id)
     )
+    await session.execute(
+        delete(SeasonLeaderboardEntry).where(SeasonLeaderboardEntry.season_id == season_id)
+    )
 
 
 async def delete_league_stats_async(session: AsyncSession, league_id: int) -> None:
@@ -106,10 +173,28 @@ async def delete_league_stats_async(session: AsyncSession, league_id: int) -> No
     await session.execute(
         delete(PlayerLeagueStats).where(PlayerLeagueStats.league_id == league_id)
     )
+    await session.execute(
+        delete(LeagueLeaderboardEntry).where(LeagueLeaderboardEntry.league_id == league_id)
+    )
+
+
+def _stat_eligible_conditions() -> list:
+    """WHERE conditions selecting stat-eligible matches (requires an outer join to Session)."""
+    return [
+        Match.ranked_intent.is_(True),
+        or_(
+            Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
+            Session.id.is_(None),
+        ),
+    ]
 
 
 async def load_stat_eligible_matches_async(
-    session: AsyncSession, season_id: Optional[int] = None, league_id: Optional[int] = None
+    session: AsyncSession,
+    season_id: Optional[int] = None,
+    league_id: Optional[int] = None,
+    after_match_id: Optional[int] = None,
+    up_to_match_id: Optional[int] = None,
 ) -> List[Match]:
     """
     Load stat-eligible matches from database.
@@ -121,23 +206,59 @@ async def load_stat_eligible_matches_async(
         session: Database session
         season_id: Optional season ID to filter by
         league_id: Optional league ID to filter by
+        after_match_id: Optional exclusive lower bound on match ID
+        up_to_match_id: Optional inclusive upper bound on match ID
 
     Returns:
         List of Match objects
     """
-    conditions = [
-        Match.ranked_intent.is_(True),
-        or_(
-            Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
-            Session.id.is_(None),
-        ),
-    ]
+    query = _stat_eligible_matches_query(
+        select(Match), season_id, league_id, after_match_id, up_to_match_id
+    ).options(selectinload(Match.session))
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
+# Columns read into calculation_service.ReplayMatch (see replay_match_from_row)
+_REPLAY_MATCH_COLUMNS = (
+    Match.id,
+    Match.team1_player1_id,
+    Match.team1_player2_id,
+    Match.team2_player1_id,
+    Match.team2_player2_id,
+    Match.team1_score,
+    Match.team2_score,
+    Match.is_ranked,
+    Match.session_id,
+    Session.date,
+)
 
-    query = (
-        select(Match)
-        .outerjoin(Session, Match.session_id == Session.id)
-        .options(selectinload(Match.session))
-    )
+
+async def load_replay_matches_async(
+    session: AsyncSession, season_id: Optional[int] = None, league_id: Optional[int] = None
+) -> List[calculation_service.ReplayMatch]:
+    """
+    Load stat-eligible matches as plain ReplayMatch tuples (no ORM objects).
+
+    Same filters and order as load_stat_eligible_matches_async; the tuples can be
+    handed to a replay process.
+    """
+    query = _stat_eligible_matches_query(select(*_REPLAY_MATCH_COLUMNS), season_id, league_id)
+    result = await session.execute(query)
+    return [calculation_service.replay_match_from_row(row) for row in result]
+
+
+def _stat_eligible_matches_query(
+    query,
+    season_id: Optional[int] = None,
+    league_id: Optional[int] = None,
+    after_match_id: Optional[int] = None,
+    up_to_match_id: Optional[int] = None,
+):
+    """Restrict a select over Match to stat-eligible matches in ID order."""
+    conditions = _stat_eligible_conditions()
+
+    query = query.select_from(Match).outerjoin(Session, Match.session_id == Session.id)
 
     if league_id is not None:
         query = query.outerjoin(Season, Session.season_id == Season.id)
@@ -146,9 +267,282 @@ async def load_stat_eligible_matches_async(
     if season_id is not None:
         conditions.append(Session.season_id == season_id)
 
-    query = query.where(and_(*conditions)).order_by(Match.id.asc())
-    result = await session.execute(query)
-    return list(result.scalars().all())
+    if after_match_id is not None:
+        conditions.append(Match.id > after_match_id)
+
+    if up_to_match_id is not None:
+        conditions.append(Match.id <= up_to_match_id)
+
+    return query.where(and_(*conditions)).order_by(Match.id.asc())
+
+
+async def _stream_matches_with_hashes_async(
+    session: AsyncSession,
+    after_match_id: Optional[int] = None,
+    db_lock: Optional[asyncio.Lock] = None,
+) -> AsyncIterator[Tuple[List[calculation_service.ReplayMatch], List[int]]]:
+    """
+    Stream stat-eligible matches (as ReplayMatch tuples) with their fingerprint hashes.
+
+    Rows come from a server-side cursor, STATS_MATCH_LOAD_CHUNK_SIZE at a time,
+    selecting only the columns a replay reads, so neither ORM objects nor the
+    full match list are ever built. The hashes come from the same query as the
+    rows, so fingerprints summed from them describe exactly the matches a replay
+    consumed, even if matches change concurrently.
+
+    Args:
+        session: Database session
+        after_match_id: Optional exclusive lower bound on match ID
+        db_lock: Held around each database round trip, for callers that use the
+            session for other statements while the stream is open
+
+    Yields:
+        (matches, hashes) chunks, in match ID order
+    """
+    lock = db_lock or nullcontext()
+    query = _stat_eligible_matches_query(
+        select(*_REPLAY_MATCH_COLUMNS, _match_fingerprint_hash()), after_match_id=after_match_id
+    ).execution_options(yield_per=STATS_MATCH_LOAD_CHUNK_SIZE)
+    async with lock:
+        result = await session.stream(query)
+    try:
+        while True:
+            async with lock:
+                rows = await result.fetchmany(STATS_MATCH_LOAD_CHUNK_SIZE)
+            if not rows:
+                return
+            yield (
+                [calculation_service.replay_match_from_row(row) for row in rows],
+                [int(row[-1]) for row in rows],
+            )
+    finally:
+        async with lock:
+            await result.close()
+
+
+async def _count_stat_eligible_matches_async(
+    session: AsyncSession, after_match_id: Optional[int] = None
+) -> int:
+    """Count stat-eligible matches, optionally only those with id > after_match_id."""
+    conditions = _stat_eligible_conditions()
+    if after_match_id is not None:
+        conditions.append(Match.id > after_match_id)
+    result = await session.execute(
+        select(func.count())
+        .select_from(Match)
+        .outerjoin(Session, Match.session_id == Session.id)
+        .where(and_(*conditions))
+    )
+    return result.scalar_one()
+
+
+def _match_fingerprint_hash():
+    """Per-match hash over every input the global replay reads (requires a join to Session)."""
+    return func.hashtext(
+        func.concat_ws(
+            ":",
+            Match.id,
+            Match.team1_player1_id,
+            Match.team1_player2_id,
+            Match.team2_player1_id,
+            Match.team2_player2_id,
+            Match.team1_score,
+            Match.team2_score,
+            Match.is_ranked,
+            Session.date,
+        )
+    ).cast(BigInteger)
+
+
+async def _fingerprint_stat_eligible_matches_async(
+    session: AsyncSession, prefix_up_to_match_id: Optional[int] = None
+) -> Dict:
+    """
+    Summarize stat-eligible matches with a count and an order-independent hash.
+
+    The hash covers every input the global replay reads (match ID, players,
+    scores, is_ranked, session date), so editing, deleting or re-eligibility of
+    any match changes it. It is computed in Postgres without loading rows.
+
+    Args:
+        session: Database session
+        prefix_up_to_match_id: If given, also summarize only matches with
+            id <= this value (the "prefix")
+
+    Returns:
+        Dict with count, hash, max_id and, when requested, prefix_count and prefix_hash
+    """
+    match_hash = _match_fingerprint_hash()
+    columns = [func.count(), func.coalesce(func.sum(match_hash), 0), func.max(Match.id)]
+    if prefix_up_to_match_id is not None:
+        in_prefix = Match.id <= prefix_up_to_match_id
+        columns += [
+            func.count().filter(in_prefix),
+            func.coalesce(func.sum(match_hash).filter(in_prefix), 0),
+        ]
+
+    query = (
+        select(*columns)
+        .select_from(Match)
+        .outerjoin(Session, Match.session_id == Session.id)
+        .where(and_(*_stat_eligible_conditions()))
+    )
+    row = (await session.execute(query)).one()
+
+    fingerprint = {"count": row[0], "hash": int(row[1]), "max_id": row[2]}
+    if prefix_up_to_match_id is not None:
+        fingerprint["prefix_count"] = row[3]
+        fingerprint["prefix_hash"] = int(row[4])
+    return fingerprint
+
+
+def _jsonb(json_text: str):
+    """Bind already-serialized JSON as JSONB, so the state is not re-parsed here."""
+    return cast(literal(json_text, Text), JSONB)
+
+
+async def _load_state_json_async(session: AsyncSession, state_column, *conditions) -> str:
+    """Load a persisted tracker state as JSON text (parsed by whoever restores it)."""
+    result = await session.execute(select(state_column.cast(Text)).where(*conditions))
+    return result.scalar_one()
+
+
+async def _save_tracker_state_async(
+    session: AsyncSession,
+    scope: str,
+    state_json: str,
+    fingerprint: Dict,
+) -> None:
+    """Upsert the persisted tracker state (to_state() JSON) for a scope."""
+    stmt = pg_insert(StatsTrackerState).values(
+        scope=scope,
+        last_match_id=fingerprint["max_id"],
+        match_count=fingerprint["count"],
+        fingerprint=fingerprint["hash"],
+        state=_jsonb(state_json),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope"],
+        set_=dict(
+            last_match_id=stmt.excluded.last_match_id,
+            match_count=stmt.excluded.match_count,
+            fingerprint=stmt.excluded.fingerprint,
+            state=stmt.excluded.state,
+            updated_at=func.now(),
+        ),
+    )
+    await session.execute(stmt)
+
+
+async def _prefix_fingerprints_async(
+    session: AsyncSession, boundaries: List[int]
+) -> List[Tuple[int, int]]:
+    """
+    Fingerprint the stat-eligible matches with id <= each boundary in one scan.
+
+    Matches are grouped into buckets between consecutive boundaries with
+    width_bucket, and the per-bucket counts/hashes are summed cumulatively.
+
+    Args:
+        session: Database session
+        boundaries: Match IDs in ascending order
+
+    Returns:
+        List of (count, hash) tuples, one per boundary
+    """
+    if not boundaries:
+        return []
+
+    # Threshold b + 1 puts a match with id == b into the bucket before it
+    bucket = func.width_bucket(Match.id, array([b + 1 for b in boundaries]))
+    query = (
+        select(bucket, func.count(), func.sum(_match_fingerprint_hash()))
+        .select_from(Match)
+        .outerjoin(Session, Match.session_id == Session.id)
+        .where(and_(*_stat_eligible_conditions(), Match.id <= boundaries[-1]))
+        .group_by(bucket)
+    )
+    per_bucket = {row[0]: (row[1], int(row[2])) for row in await session.execute(query)}
+
+    results = []
+    count, total_hash = 0, 0
+    for idx in range(len(boundaries)):
+        bucket_count, bucket_hash = per_bucket.get(idx, (0, 0))
+        count += bucket_count
+        total_hash += bucket_hash
+        results.append((count, total_hash))
+    return results
+
+
+async def _save_checkpoint_async(
+    session: AsyncSession,
+    scope: str,
+    last_match_id: int,
+    match_count: int,
+    fingerprint: int,
+    state_json: str,
+) -> None:
+    """Upsert one tracker checkpoint (state given as to_state() JSON)."""
+    stmt = pg_insert(StatsTrackerCheckpoint).values(
+        scope=scope,
+        last_match_id=last_match_id,
+        match_count=match_count,
+        fingerprint=fingerprint,
+        state=_jsonb(state_json),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope", "last_match_id"],
+        set_=dict(
+            match_count=stmt.excluded.match_count,
+            fingerprint=stmt.excluded.fingerprint,
+            state=stmt.excluded.state,
+            created_at=func.now(),
+        ),
+    )
+    await session.execute(stmt)
+
+
+async def _find_resume_checkpoint_async(
+    session: AsyncSession, scope: str
+) -> Optional[StatsTrackerCheckpoint]:
+    """
+    Find the latest checkpoint that still agrees with the database.
+
+    Checkpoints are checked oldest first; the first mismatch marks the earliest
+    affected match, so nothing after it can be trusted.
+
+    Returns:
+        The checkpoint to resume from, or None if a full replay is required
+    """
+    headers_result = await session.execute(
+        select(
+            StatsTrackerCheckpoint.last_match_id,
+            StatsTrackerCheckpoint.match_count,
+            StatsTrackerCheckpoint.fingerprint,
+        )
+        .where(StatsTrackerCheckpoint.scope == scope)
+        .order_by(StatsTrackerCheckpoint.last_match_id.asc())
+    )
+    headers = headers_result.all()
+    fingerprints = await _prefix_fingerprints_async(session, [h[0] for h in headers])
+
+    resume_match_id = None
+    for (last_match_id, match_count, fingerprint), db_fingerprint in zip(headers, fingerprints):
+        if db_fingerprint != (match_count, fingerprint):
+            break
+        resume_match_id = last_match_id
+    if resume_match_id is None:
+        return None
+
+    result = await session.execute(
+        select(StatsTrackerCheckpoint)
+        .options(defer(StatsTrackerCheckpoint.state))
+        .where(
+            StatsTrackerCheckpoint.scope == scope,
+            StatsTrackerCheckpoint.last_match_id == resume_match_id,
+        )
+    )
+    return result.scalar_one()
 
 
 async def delete_all_stats_async(session: AsyncSession) -> None:
@@ -161,6 +555,8 @@ async def delete_all_stats_async(session: AsyncSession) -> None:
     await session.execute(delete(PartnershipStatsSeason))
     await session.execute(delete(OpponentStatsSeason))
     await session.execute(delete(PlayerSeasonStats))
+    await session.execute(delete(LeagueLeaderboardEntry))
+    await session.execute(delete(SeasonLeaderboardEntry))
 
 
 T = TypeVar("T")
@@ -172,178 +568,533 @@ def _chunks(lst: List[T], n: int) -> Generator[List[T], None, None]:
         yield lst[i : i + n]
 
 
-async def insert_elo_history_async(
-    session: AsyncSession, elo_history_list: List[EloHistory]
+# Column order of the tuples accepted by the bulk writers below
+ELO_HISTORY_COLUMNS = ("player_id", "match_id", "date", "elo_after", "elo_change")
+SEASON_RATING_HISTORY_COLUMNS = (
+    "player_id",
+    "season_id",
+    "match_id",
+    "date",
+    "rating_after",
+    "rating_change",
+)
+# Match seats, as in Match.<seat>_id and MatchStats.<seat>_elo_after
+MATCH_SEATS = ("team1_player1", "team1_player2", "team2_player1", "team2_player2")
+MATCH_ELO_COLUMNS = (
+    "team1_elo_change",
+    "team2_elo_change",
+    *(f"{seat}_elo_after" for seat in MATCH_SEATS),
+)
+MATCH_RATING_COLUMNS = ("team1_rating_change", "team2_rating_change")
+# Value columns shared by the pair stats tables and player season/league stats
+STATS_VALUE_COLUMNS = ("games", "wins", "points", "win_rate", "avg_point_diff")
+PLAYER_GLOBAL_STATS_COLUMNS = ("player_id", "current_rating", "total_games", "total_wins")
+
+
+async def _asyncpg_connection(session: AsyncSession):
+    """Return the asyncpg connection under the session, or None for other drivers."""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if not hasattr(driver_connection, "copy_records_to_table"):
+        return None
+    return driver_connection
+
+
+async def _copy_rows_async(
+    session: AsyncSession, table_name: str, columns: Sequence[str], rows: List[tuple]
 ) -> None:
-    """Bulk insert ELO history records in chunks."""
-    if not elo_history_list:
+    """
+    Stream tuples into a table with binary COPY on the session's connection.
+
+    Runs inside the session's transaction. Falls back to chunked executemany
+    INSERTs when the session is not backed by asyncpg.
+    """
+    if not rows:
         return
-    for chunk in _chunks(elo_history_list, 1000):
-        session.add_all(chunk)
+    # Pending ORM changes must reach the connection before rows bypass the session
+    await session.flush()
+    driver_connection = await _asyncpg_connection(session)
+    if driver_connection is not None:
+        await driver_connection.copy_records_to_table(
+            table_name, records=rows, columns=list(columns)
+        )
+        return
+
+    target = table(table_name, *[column(name) for name in columns])
+    for chunk in _chunks(rows, 1000):
+        await session.execute(insert(target), [dict(zip(columns, row)) for row in chunk])
+
+
+async def _merge_rows_via_staging_async(
+    session: AsyncSession,
+    model,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    rows: List[tuple],
+    scope: Optional[list] = None,
+) -> int:
+    """
+    Write only the difference between tuples and the stored rows of a table.
+
+    Rows are COPYed into a temporary staging table and merged with a single
+    INSERT ... ON CONFLICT DO UPDATE that skips keys whose values are
+    unchanged. When scope is given (a list of WHERE conditions on model; an
+    empty list means the whole table), stored rows in that scope whose key is
+    not among the tuples are deleted, so the scope ends up equal to rows.
+
+    Args:
+        session: Database session
+        model: Target ORM model
+        columns: Column names, in tuple order
+        key_columns: Columns of the target's primary key or unique constraint
+        rows: Tuples ordered as columns
+        scope: Optional conditions selecting the rows that rows replaces
+
+    Returns:
+        Number of rows inserted, updated or deleted
+    """
+    target = model.__table__
+    if not rows:
+        if scope is None:
+            return 0
+        result = await session.execute(delete(model).where(*scope))
+        return result.rowcount
+
+    staging_name = f"staging_{target.name}"
+    column_list = ", ".join(columns)
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE {staging_name} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {target.name} WITH NO DATA"
+        )
+    )
+    await _copy_rows_async(session, staging_name, columns, rows)
+    staging = table(staging_name, *[column(name) for name in columns])
+
+    written = 0
+    if scope is not None:
+        key_matches = and_(*(staging.c[name] == target.c[name] for name in key_columns))
+        result = await session.execute(
+            delete(model).where(*scope, ~select(1).where(key_matches).exists())
+        )
+        written += result.rowcount
+
+    value_columns = [name for name in columns if name not in key_columns]
+    stmt = pg_insert(model).from_select(list(columns), select(staging))
+    set_ = {name: stmt.excluded[name] for name in value_columns}
+    if "updated_at" in target.c:
+        set_["updated_at"] = func.now()
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_=set_,
+        where=or_(
+            *(target.c[name].is_distinct_from(stmt.excluded[name]) for name in value_columns)
+        ),
+    )
+    result = await session.execute(stmt)
+    written += result.rowcount
+    await session.execute(text(f"DROP TABLE {staging_name}"))
+    return written
+
+
+async def insert_elo_history_async(
+    session: AsyncSession, elo_history_list: List[calculation_service.EloHistoryRow]
+) -> None:
+    """Bulk insert ELO history rows (ordered as ELO_HISTORY_COLUMNS) via COPY."""
+    await _copy_rows_async(
+        session, EloHistory.__tablename__, ELO_HISTORY_COLUMNS, elo_history_list
+    )
 
 
 async def insert_season_rating_history_async(
-    session: AsyncSession, season_rating_history_list: List[SeasonRatingHistory]
+    session: AsyncSession, season_rating_history_list: List[tuple]
 ) -> None:
-    """Bulk insert season rating history records in chunks."""
-    if not season_rating_history_list:
-        return
-    for chunk in _chunks(season_rating_history_list, 1000):
-        session.add_all(chunk)
+    """Bulk insert season rating history rows (SEASON_RATING_HISTORY_COLUMNS order) via COPY."""
+    await _copy_rows_async(
+        session,
+        SeasonRatingHistory.__tablename__,
+        SEASON_RATING_HISTORY_COLUMNS,
+        season_rating_history_list,
+    )
+
+
+async def _upsert_player_global_stats_rows(session: AsyncSession, rows: List[tuple]) -> int:
+    """Upsert PlayerGlobalStats rows (PLAYER_GLOBAL_STATS_COLUMNS order), skipping unchanged."""
+    return await _merge_rows_via_staging_async(
+        session, PlayerGlobalStats, PLAYER_GLOBAL_STATS_COLUMNS, ("player_id",), rows
+    )
+
+
+async def _sync_pair_stats_async(
+    session: AsyncSession,
+    model,
+    other_column: str,
+    pair_stats: List[tuple],
+    scope_column: Optional[str] = None,
+    scope_id: Optional[int] = None,
+) -> int:
+    """
+    Make a pair stats table, or one league's/season's slice of it, equal to pair_stats.
+
+    Rows are (player_id, other_id[, scope_id], *STATS_VALUE_COLUMNS).
+
+    Returns:
+        Number of rows inserted, updated or deleted
+    """
+    key_columns = ("player_id", other_column) + ((scope_column,) if scope_column else ())
+    scope = [model.__table__.c[scope_column] == scope_id] if scope_column else []
+    return await _merge_rows_via_staging_async(
+        session, model, (*key_columns, *STATS_VALUE_COLUMNS), key_columns, pair_stats, scope
+    )
+
+
+async def _sync_player_stats_async(
+    session: AsyncSession, model, scope_column: str, scope_id: int, rows: List[tuple]
+) -> int:
+    """
+    Make one league's/season's player stats equal to rows.
 
+    Rows are (player_id, scope_id, *STATS_VALUE_COLUMNS).
+
+    Returns:
+        Number of rows inserted, updated or deleted
+    """
+    key_columns = ("player_id", scope_column)
+    return await _merge_rows_via_staging_async(
+        session,
+        model,
+        (*key_columns, *STATS_VALUE_COLUMNS),
+        key_columns,
+        rows,
+        [model.__table__.c[scope_column] == scope_id],
+    )
+
+
+# Leaderboard sort keys (all descending), matching the rankings sort helpers in
+# stats_read_data: league leaderboards use the "All Seasons" order, season
+# leaderboards rank by points. ELO breaks remaining ties, then player_id.
+LEADERBOARD_ORDER_COLUMNS = {
+    "league_id": ("wins", "win_rate", "avg_point_diff"),
+    "season_id": ("points", "avg_point_diff", "win_rate"),
+}
+
+
+def ranked_player_stats_query(stats_model, scope_column: str, scope_id: int):
+    """
+    Select one league's/season's player stats with their leaderboard rank.
 
-async def upsert_player_global_stats_async(
-    session: AsyncSession, elo_history_list: List[EloHistory], matches: List[Match]
+    Columns: scope_id, rank, player_id, *STATS_VALUE_COLUMNS (the leaderboard
+    entry columns), in no particular row order.
+
+    Args:
+        stats_model: PlayerLeagueStats or PlayerSeasonStats
+        scope_column: "league_id" or "season_id"
+        scope_id: League or season ID
+    """
+    columns = stats_model.__table__.c
+    rating = PlayerGlobalStats.current_rating
+    elo = case((or_(rating.is_(None), rating == 0), INITIAL_ELO), else_=func.round(rating))
+    order_by = [columns[name].desc() for name in LEADERBOARD_ORDER_COLUMNS[scope_column]]
+    return (
+        select(
+            columns[scope_column],
+            func.row_number()
+            .over(order_by=[*order_by, elo.desc(), columns.player_id])
+            .label("rank"),
+            columns.player_id,
+            *(columns[name] for name in STATS_VALUE_COLUMNS),
+        )
+        .outerjoin(PlayerGlobalStats, PlayerGlobalStats.player_id == columns.player_id)
+        .where(columns[scope_column] == scope_id)
+    )
+
+
+async def _rebuild_leaderboard_async(
+    session: AsyncSession, entry_model, stats_model, scope_column: str, scope_id: int
 ) -> None:
     """
-    Update PlayerGlobalStats based on elo_history and match data.
+    Rebuild one league's/season's leaderboard from its player stats.
 
-    Calculates:
-    - current_rating: Latest elo_after from elo_history (INITIAL_ELO if none)
-    - total_games: Count of matches participated in
-    - total_wins: Count of matches won
+    Ranks are assigned in SQL when the stats are written, so reading a
+    leaderboard is a range scan over (scope, rank).
     """
-    if not elo_history_list and not matches:
-        return
+    await session.execute(
+        delete(entry_model).where(entry_model.__table__.c[scope_column] == scope_id)
+    )
+    await session.execute(
+        insert(entry_model).from_select(
+            [scope_column, "rank", "player_id", *STATS_VALUE_COLUMNS],
+            ranked_player_stats_query(stats_model, scope_column, scope_id),
+        )
+    )
 
-    player_latest_elo: Dict[int, float] = {}
-    for elo_record in elo_history_list:
-        player_latest_elo[elo_record.player_id] = elo_record.elo_after
-
-    player_games: Dict[int, int] = {}
-    player_wins: Dict[int, int] = {}
-
-    for match in matches:
-        team1_ids = [match.team1_player1_id, match.team1_player2_id]
-        team2_ids = [match.team2_player1_id, match.team2_player2_id]
-        all_pids = [pid for pid in team1_ids + team2_ids if pid is not None]
-        for pid in all_pids:
-            player_games[pid] = player_games.get(pid, 0) + 1
-        if match.winner == 1:
-            for pid in team1_ids:
-                if pid is not None:
-                    player_wins[pid] = player_wins.get(pid, 0) + 1
-        elif match.winner == 2:
-            for pid in team2_ids:
-                if pid is not None:
-                    player_wins[pid] = player_wins.get(pid, 0) + 1
-
-    all_pids = set(player_latest_elo.keys()) | set(player_games.keys())
-    rows = [
-        {
-            "player_id": pid,
-            "current_rating": player_latest_elo.get(pid, INITIAL_ELO),
-            "total_games": player_games.get(pid, 0),
-            "total_wins": player_wins.get(pid, 0),
-        }
-        for pid in all_pids
-    ]
-    if rows:
-        stmt = pg_insert(PlayerGlobalStats).values(rows)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["player_id"],
-            set_=dict(
-                current_rating=stmt.excluded.current_rating,
-                total_games=stmt.excluded.total_games,
-                total_wins=stmt.excluded.total_wins,
-                updated_at=func.now(),
+
+async def _rebuild_elo_series_async(
+    session: AsyncSession, player_ids: Optional[Sequence[int]] = None
+) -> None:
+    """
+    Rebuild PlayerEloSeries from EloHistory for player_ids, or for every player.
+
+    Each series keeps the player's ELO at the end of every date (after their
+    last match that day, matches being replayed in ID order), minus dates
+    where it ended where the previous one did.
+    """
+    scope = [] if player_ids is None else [EloHistory.player_id.in_(player_ids)]
+    end_of_day = (
+        select(EloHistory.player_id, EloHistory.date, EloHistory.elo_after)
+        .where(*scope)
+        .ext(distinct_on(EloHistory.player_id, EloHistory.date))
+        .order_by(EloHistory.player_id, EloHistory.date, EloHistory.match_id.desc())
+        .subquery()
+    )
+    previous = (
+        func.lag(end_of_day.c.elo_after)
+        .over(partition_by=end_of_day.c.player_id, order_by=end_of_day.c.date)
+        .label("previous")
+    )
+    days = select(end_of_day, previous).subquery()
+    series = (
+        select(
+            days.c.player_id,
+            func.jsonb_agg(
+                aggregate_order_by(
+                    func.jsonb_build_array(days.c.date, days.c.elo_after), days.c.date
+                )
             ),
+            func.count(),
         )
-        await session.execute(stmt)
+        .where(or_(days.c.previous.is_(None), days.c.previous != days.c.elo_after))
+        .group_by(days.c.player_id)
+    )
+
+    series_scope = [] if player_ids is None else [PlayerEloSeries.player_id.in_(player_ids)]
+    await session.execute(delete(PlayerEloSeries).where(*series_scope))
+    await session.execute(
+        insert(PlayerEloSeries).from_select(["player_id", "points", "point_count"], series)
+    )
+
+
+async def _upsert_match_stats_async(session: AsyncSession, query, columns: Sequence[str]) -> None:
+    """Upsert MatchStats columns from query (match_id, *columns), skipping unchanged rows."""
+    target = MatchStats.__table__
+    stmt = pg_insert(MatchStats).from_select(["match_id", *columns], query)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["match_id"],
+        set_={**{name: stmt.excluded[name] for name in columns}, "updated_at": func.now()},
+        where=or_(*(target.c[name].is_distinct_from(stmt.excluded[name]) for name in columns)),
+    )
+    await session.execute(stmt)
+
+
+def _join_seat_history(query, history_model, *conditions):
+    """
+    Outer-join one history_model row per seat of Match onto query.
+
+    Returns:
+        Tuple of (query, {seat: history alias})
+    """
+    seats = {}
+    for seat in MATCH_SEATS:
+        history = aliased(history_model)
+        query = query.outerjoin(
+            history,
+            and_(
+                history.match_id == Match.id,
+                history.player_id == getattr(Match, f"{seat}_id"),
+                *(condition(history) for condition in conditions),
+            ),
+        )
+        seats[seat] = history
+    return query, seats
+
+
+def _team_value(seats: Dict, team: int, column: str):
+    """A team's delta: teammates move by the same amount, so either seat's row will do."""
+    return func.coalesce(
+        getattr(seats[f"team{team}_player1"], column),
+        getattr(seats[f"team{team}_player2"], column),
+    )
+
+
+async def _sync_match_elo_async(
+    session: AsyncSession, after_match_id: Optional[int] = None
+) -> None:
+    """
+    Copy global ELO results from EloHistory onto MatchStats.
+
+    Covers every match after after_match_id (all matches when None), so
+    matches that no longer have ELO rows are reset to NULL.
+    """
+    query, seats = _join_seat_history(select(Match.id).select_from(Match), EloHistory)
+    query = query.with_only_columns(
+        Match.id,
+        _team_value(seats, 1, "elo_change"),
+        _team_value(seats, 2, "elo_change"),
+        *(seats[seat].elo_after for seat in MATCH_SEATS),
+    )
+    if after_match_id is not None:
+        query = query.where(Match.id > after_match_id)
+    await _upsert_match_stats_async(session, query, MATCH_ELO_COLUMNS)
+
+
+async def _sync_match_season_ratings_async(session: AsyncSession, season_id: int) -> None:
+    """Copy a season's rating changes from SeasonRatingHistory onto MatchStats."""
+    query, seats = _join_seat_history(
+        select(Match.id).select_from(Match).join(Session, Match.session_id == Session.id),
+        SeasonRatingHistory,
+        lambda history: history.season_id == season_id,
+    )
+    query = query.with_only_columns(
+        Match.id,
+        _team_value(seats, 1, "rating_change"),
+        _team_value(seats, 2, "rating_change"),
+    ).where(Session.season_id == season_id)
+    await _upsert_match_stats_async(session, query, MATCH_RATING_COLUMNS)
+
+
+async def upsert_partnership_stats_async(
+    session: AsyncSession, partnerships: List[calculation_service.PartnershipRow]
+) -> int:
+    """Insert or update global partnership stats keyed by (player_id, partner_id)."""
+    return await _merge_rows_via_staging_async(
+        session,
+        PartnershipStats,
+        ("player_id", "partner_id", *STATS_VALUE_COLUMNS),
+        ("player_id", "partner_id"),
+        partnerships,
+    )
+
+
+async def upsert_opponent_stats_async(
+    session: AsyncSession, opponents: List[calculation_service.OpponentRow]
+) -> int:
+    """Insert or update global opponent stats keyed by (player_id, opponent_id)."""
+    return await _merge_rows_via_staging_async(
+        session,
+        OpponentStats,
+        ("player_id", "opponent_id", *STATS_VALUE_COLUMNS),
+        ("player_id", "opponent_id"),
+        opponents,
+    )
 
 
 async def insert_partnership_stats_async(
-    session: AsyncSession, partnerships: List[PartnershipStats]
+    session: AsyncSession, partnerships: List[calculation_service.PartnershipRow]
 ) -> None:
-    """Bulk insert partnership stats in chunks."""
-    if not partnerships:
-        return
-    for chunk in _chunks(partnerships, 1000):
-        session.add_all(chunk)
+    """Bulk insert global partnership stats rows via COPY."""
+    await _copy_rows_async(
+        session,
+        PartnershipStats.__tablename__,
+        ("player_id", "partner_id", *STATS_VALUE_COLUMNS),
+        partnerships,
+    )
 
 
 async def insert_opponent_stats_async(
-    session: AsyncSession, opponents: List[OpponentStats]
+    session: AsyncSession, opponents: List[calculation_service.OpponentRow]
 ) -> None:
-    """Bulk insert opponent stats in chunks."""
-    if not opponents:
-        return
-    for chunk in _chunks(opponents, 1000):
-        session.add_all(chunk)
+    """Bulk insert global opponent stats rows via COPY."""
+    await _copy_rows_async(
+        session,
+        OpponentStats.__tablename__,
+        ("player_id", "opponent_id", *STATS_VALUE_COLUMNS),
+        opponents,
+    )
 
 
 async def insert_partnership_stats_season_async(
-    session: AsyncSession, partnerships: List[PartnershipStatsSeason]
+    session: AsyncSession, partnerships: List[tuple]
 ) -> None:
-    """Bulk insert season-specific partnership stats in chunks."""
-    if not partnerships:
-        return
-    for chunk in _chunks(partnerships, 1000):
-        session.add_all(chunk)
+    """
+    Bulk insert season-specific partnership stats via COPY.
+
+    Rows are (player_id, partner_id, season_id, games, wins, points, win_rate,
+    avg_point_diff).
+    """
+    await _copy_rows_async(
+        session,
+        PartnershipStatsSeason.__tablename__,
+        ("player_id", "partner_id", "season_id", *STATS_VALUE_COLUMNS),
+        partnerships,
+    )
 
 
 async def insert_opponent_stats_season_async(
-    session: AsyncSession, opponents: List[OpponentStatsSeason]
+    session: AsyncSession, opponents: List[tuple]
 ) -> None:
-    """Bulk insert season-specific opponent stats in chunks."""
-    if not opponents:
-        return
-    for chunk in _chunks(opponents, 1000):
-        session.add_all(chunk)
+    """
+    Bulk insert season-specific opponent stats via COPY.
+
+    Rows are (player_id, opponent_id, season_id, games, wins, points, win_rate,
+    avg_point_diff).
+    """
+    await _copy_rows_async(
+        session,
+        OpponentStatsSeason.__tablename__,
+        ("player_id", "opponent_id", "season_id", *STATS_VALUE_COLUMNS),
+        opponents,
+    )
 
 
 async def insert_partnership_stats_league_async(
-    session: AsyncSession, partnerships: List[PartnershipStatsLeague]
+    session: AsyncSession, partnerships: List[tuple]
 ) -> None:
-    """Bulk insert league-specific partnership stats in chunks."""
-    if not partnerships:
-        return
-    for chunk in _chunks(partnerships, 1000):
-        session.add_all(chunk)
+    """
+    Bulk insert league-specific partnership stats via COPY.
+
+    Rows are (player_id, partner_id, league_id, games, wins, points, win_rate,
+    avg_point_diff).
+    """
+    await _copy_rows_async(
+        session,
+        PartnershipStatsLeague.__tablename__,
+        ("player_id", "partner_id", "league_id", *STATS_VALUE_COLUMNS),
+        partnerships,
+    )
 
 
 async def insert_opponent_stats_league_async(
-    session: AsyncSession, opponents: List[OpponentStatsLeague]
+    session: AsyncSession, opponents: List[tuple]
 ) -> None:
-    """Bulk insert league-specific opponent stats in chunks."""
-    if not opponents:
-        return
-    for chunk in _chunks(opponents, 1000):
-        session.add_all(chunk)
+    """
+    Bulk insert league-specific opponent stats via COPY.
+
+    Rows are (player_id, opponent_id, league_id, games, wins, points, win_rate,
+    avg_point_diff).
+    """
+    await _copy_rows_async(
+        session,
+        OpponentStatsLeague.__tablename__,
+        ("player_id", "opponent_id", "league_id", *STATS_VALUE_COLUMNS),
+        opponents,
+    )
 
 
 async def upsert_player_season_stats_async(
     session: AsyncSession, tracker: "calculation_service.StatsTracker", season_id: int
-) -> None:
-    """Upsert player season stats from a StatsTracker."""
-    player_stats_list = [
-        {
-            "player_id": player_id,
-            "season_id": season_id,
-            "games": player_stats.game_count,
-            "wins": player_stats.win_count,
-            "points": player_stats.points,
-            "win_rate": round(player_stats.win_rate, 3),
-            "avg_point_diff": round(player_stats.avg_point_diff, 1),
-        }
+) -> int:
+    """
+    Replace a season's player stats with those of a StatsTracker.
+
+    Only changed rows are written; players no longer in the tracker are removed.
+
+    Returns:
+        Number of rows inserted, updated or deleted
+    """
+    rows = [
+        (
+            player_id,
+            season_id,
+            player_stats.game_count,
+            player_stats.win_count,
+            player_stats.points,
+            round(player_stats.win_rate, 3),
+            round(player_stats.avg_point_diff, 1),
+        )
         for player_id, player_stats in tracker.players.items()
     ]
-    if not player_stats_list:
-        return
-
-    stmt = pg_insert(PlayerSeasonStats).values(player_stats_list)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["player_id", "season_id"],
-        set_=dict(
-            games=stmt.excluded.games,
-            wins=stmt.excluded.wins,
-            points=stmt.excluded.points,
-            win_rate=stmt.excluded.win_rate,
-            avg_point_diff=stmt.excluded.avg_point_diff,
-            updated_at=func.now(),
-        ),
-    )
-    await session.execute(stmt)
+    return await _sync_player_stats_async(session, PlayerSeasonStats, "season_id", season_id, rows)
 
 
 # ---------------------------------------------------------------------------
@@ -351,54 +1102,299 @@ async def upsert_player_season_stats_async(
 # ---------------------------------------------------------------------------
 
 
-async def calculate_global_stats_async(session: AsyncSession) -> Dict:
+async def calculate_global_stats_async(session: AsyncSession, full_rebuild: bool = False) -> Dict:
     """
     Calculate global stats from all ranked matches.
 
-    Deletes existing global stats, processes all ranked matches in-memory,
-    then inserts fresh stats — all within one transaction.
+    By default, resumes from the persisted global tracker state and applies only
+    matches newer than the last processed one. When an already-processed match
+    was edited, deleted, or became (in)eligible since the state was saved, the
+    latest checkpoint taken before the earliest affected match is restored and
+    only the matches after it are replayed. Falls back to a full rebuild when
+    no usable state or checkpoint exists.
+
+    Args:
+        session: Database session
+        full_rebuild: If True, always replay every match from scratch
+
+    Stats rows are diffed against what is stored and only changed keys are
+    inserted, updated or deleted.
 
     Returns:
-        Dict with player_count and match_count.
+        Dict with player_count, match_count and rows_written (stats rows
+        inserted, updated or deleted).
     """
-    matches = await load_stat_eligible_matches_async(session)
-    if not matches:
-        await delete_global_stats_async(session)
-        await session.commit()
-        return {"player_count": 0, "match_count": 0}
+    checkpoint = None
+    if not full_rebuild:
+        result = await _apply_new_global_matches_async(session)
+        if result is not None:
+            return result
+        checkpoint = await _find_resume_checkpoint_async(session, GLOBAL_STATE_SCOPE)
+    return await _replay_global_stats_async(session, checkpoint)
 
-    partnerships, opponents, elo_history_list = calculation_service.process_matches(matches)
 
-    await delete_global_stats_async(session)
-    await insert_elo_history_async(session, elo_history_list)
-    await insert_partnership_stats_async(session, partnerships)
-    await insert_opponent_stats_async(session, opponents)
-    await upsert_player_global_stats_async(session, elo_history_list, matches)
+async def _replay_global_stats_async(
+    session: AsyncSession, checkpoint: Optional[StatsTrackerCheckpoint] = None
+) -> Dict:
+    """
+    Replay global stats from a checkpoint, or from scratch if none is given.
+
+    EloHistory rows after the checkpoint and all partnership/opponent rows are
+    diffed against the replayed ones and only changed keys are written, and new
+    checkpoints are taken along the way — all within one transaction.
+    """
+    stale_checkpoints = [StatsTrackerCheckpoint.scope == GLOBAL_STATE_SCOPE]
+    if checkpoint is None:
+        after_match_id, processed_count, base_hash, state_json = None, 0, 0, None
+        elo_history_scope = []
+        await session.execute(
+            delete(StatsTrackerState).where(StatsTrackerState.scope == GLOBAL_STATE_SCOPE)
+        )
+    else:
+        after_match_id = checkpoint.last_match_id
+        processed_count = checkpoint.match_count
+        base_hash = checkpoint.fingerprint
+        state_json = await _load_state_json_async(
+            session,
+            StatsTrackerCheckpoint.state,
+            StatsTrackerCheckpoint.scope == GLOBAL_STATE_SCOPE,
+            StatsTrackerCheckpoint.last_match_id == after_match_id,
+        )
+        elo_history_scope = [EloHistory.match_id > after_match_id]
+        stale_checkpoints.append(StatsTrackerCheckpoint.last_match_id > after_match_id)
+        logger.info(
+            "Replaying global stats from checkpoint at match %s (%s matches skipped)",
+            after_match_id,
+            processed_count,
+        )
+    await session.execute(delete(StatsTrackerCheckpoint).where(*stale_checkpoints))
+
+    expected_count = await _count_stat_eligible_matches_async(session, after_match_id)
+    try:
+        rows, summary, fingerprint = await _run_global_replay_async(
+            session, after_match_id, expected_count, state_json, processed_count, base_hash
+        )
+    except calculation_service.UnusableStateError as exc:
+        # Raised before any checkpoint was written
+        logger.warning("Unusable global checkpoint, rebuilding: %s", exc)
+        return await _replay_global_stats_async(session)
+
+    rows_written = await _merge_rows_via_staging_async(
+        session,
+        EloHistory,
+        ELO_HISTORY_COLUMNS,
+        ("player_id", "match_id"),
+        rows["elo_history"],
+        elo_history_scope,
+    )
+    rows_written += await _sync_pair_stats_async(
+        session, PartnershipStats, "partner_id", rows["partnerships"]
+    )
+    rows_written += await _sync_pair_stats_async(
+        session, OpponentStats, "opponent_id", rows["opponents"]
+    )
+    rows_written += await _upsert_player_global_stats_rows(session, rows["player_global"])
+    # Replays are rare enough (edits to processed matches) to rebuild every series
+    await _rebuild_elo_series_async(session)
+    await _sync_match_elo_async(session, after_match_id)
+    if fingerprint["count"]:
+        await _save_tracker_state_async(
+            session, GLOBAL_STATE_SCOPE, summary.state_json, fingerprint
+        )
+    await stats_cache.bump_generation(session, stats_cache.GLOBAL_SCOPE)
     await session.commit()
+    logger.info("Global stats replay wrote %s rows", rows_written)
 
-    unique_players = {
-        pid
-        for match in matches
-        for pid in [
-            match.team1_player1_id,
-            match.team1_player2_id,
-            match.team2_player1_id,
-            match.team2_player2_id,
-        ]
+    return {
+        "player_count": summary.player_count,
+        "match_count": fingerprint["count"],
+        "rows_written": rows_written,
     }
-    return {"player_count": len(unique_players), "match_count": len(matches)}
 
 
-async def _calculate_season_stats_from_matches(
-    session: AsyncSession, season_id: int, season_matches: List[Match]
-) -> Dict:
+async def _run_global_replay_async(
+    session: AsyncSession,
+    after_match_id: Optional[int],
+    expected_count: int,
+    state_json: Optional[str],
+    processed_count: int,
+    base_hash: int,
+    touched_only: bool = False,
+) -> Tuple[Dict[str, list], "calculation_service.GlobalReplaySummary", Dict]:
     """
-    Helper: calculate season stats from a pre-loaded list of matches.
+    Run calculation_service.iter_global_replay, persisting checkpoints as they arrive.
+
+    Matches after after_match_id are streamed from the database straight into
+    the replay (see _stream_matches_with_hashes_async); large replays run in a
+    replay process (see replay_process), so the event loop only moves rows and
+    writes results. Checkpoint fingerprints are running sums of the hashes
+    loaded with the matches, starting from base_hash (the fingerprint of the
+    processed_count matches state_json reflects). Checkpoints outside the
+    retention set are pruned afterwards.
 
-    Used internally by calculate_league_stats_async.
+    Args:
+        expected_count: Number of matches the stream is expected to yield; picks
+            inline vs process and which checkpoints to take
 
     Returns:
-        Dict with player_count and match_count.
+        Tuple of (rows by ReplayRows kind, GlobalReplaySummary, fingerprint dict
+        (count, hash, max_id) describing everything the replayed tracker has
+        processed, for _save_tracker_state_async)
+
+    Raises:
+        calculation_service.UnusableStateError: If state_json cannot be restored
+    """
+    retained_counts = calculation_service.retained_checkpoint_counts(
+        processed_count + expected_count, STATS_CHECKPOINT_INTERVAL, STATS_CHECKPOINT_KEEP_RECENT
+    )
+    # prefix_hashes[i] is the fingerprint after the first i streamed matches
+    prefix_hashes = int_array("q", [base_hash])
+    last_match_id = after_match_id
+    db_lock = asyncio.Lock()
+
+    async def match_chunks():
+        nonlocal last_match_id
+        stream = _stream_matches_with_hashes_async(session, after_match_id, db_lock)
+        async with aclosing(stream) as chunks:
+            async for matches, hashes in chunks:
+                # Extended before the chunk is handed over, so every checkpoint
+                # that comes back already has its hash
+                for match_hash in hashes:
+                    prefix_hashes.append(prefix_hashes[-1] + match_hash)
+                last_match_id = matches[-1].id
+                yield matches
+
+    rows: Dict[str, list] = {
+        "partnerships": [],
+        "opponents": [],
+        "elo_history": [],
+        "player_global": [],
+    }
+    summary = None
+
+    replay = replay_process.iter_replay_stream(
+        calculation_service.iter_global_replay,
+        match_chunks(),
+        expected_count,
+        state_json,
+        STATS_CHECKPOINT_INTERVAL,
+        processed_count,
+        retained_counts,
+        touched_only,
+        USE_COMPACT_STATS_TRACKER,
+    )
+    async with aclosing(replay) as items:
+        async for item in items:
+            if isinstance(item, calculation_service.ReplayCheckpoint):
+                async with db_lock:
+                    await _save_checkpoint_async(
+                        session,
+                        GLOBAL_STATE_SCOPE,
+                        item.last_match_id,
+                        item.match_count,
+                        prefix_hashes[item.match_count - processed_count],
+                        item.state_json,
+                    )
+            elif isinstance(item, calculation_service.ReplayRows):
+                rows[item.kind].extend(item.rows)
+            else:
+                summary = item
+
+    total_count = processed_count + len(prefix_hashes) - 1
+    # Matches may have changed since they were counted; keep what the real total retains
+    retained_counts = calculation_service.retained_checkpoint_counts(
+        total_count, STATS_CHECKPOINT_INTERVAL, STATS_CHECKPOINT_KEEP_RECENT
+    )
+    await session.execute(
+        delete(StatsTrackerCheckpoint).where(
+            StatsTrackerCheckpoint.scope == GLOBAL_STATE_SCOPE,
+            StatsTrackerCheckpoint.match_count.not_in(retained_counts),
+        )
+    )
+    fingerprint = {"count": total_count, "hash": prefix_hashes[-1], "max_id": last_match_id}
+    return rows, summary, fingerprint
+
+
+async def _apply_new_global_matches_async(session: AsyncSession) -> Optional[Dict]:
+    """
+    Apply only newly eligible matches on top of the persisted global tracker state.
+
+    Returns:
+        Dict with player_count, match_count and rows_written, or None if earlier
+        matches have to be replayed (nothing has been written in that case).
+    """
+    state_result = await session.execute(
+        select(
+            StatsTrackerState.last_match_id,
+            StatsTrackerState.match_count,
+            StatsTrackerState.fingerprint,
+            func.jsonb_array_length(StatsTrackerState.state["players"]),
+        ).where(StatsTrackerState.scope == GLOBAL_STATE_SCOPE)
+    )
+    state_row = state_result.one_or_none()
+    if state_row is None:
+        return None
+    last_match_id, match_count, state_fingerprint, player_count = state_row
+
+    fingerprint = await _fingerprint_stat_eligible_matches_async(
+        session, prefix_up_to_match_id=last_match_id
+    )
+    if (
+        fingerprint["prefix_count"] != match_count
+        or fingerprint["prefix_hash"] != state_fingerprint
+    ):
+        logger.info("Processed matches changed since last global stats run; replaying")
+        return None
+
+    if fingerprint["count"] == match_count:
+        return {"player_count": player_count, "match_count": match_count, "rows_written": 0}
+
+    state_json = await _load_state_json_async(
+        session, StatsTrackerState.state, StatsTrackerState.scope == GLOBAL_STATE_SCOPE
+    )
+    try:
+        rows, summary, new_fingerprint = await _run_global_replay_async(
+            session,
+            last_match_id,
+            fingerprint["count"] - match_count,
+            state_json,
+            match_count,
+            state_fingerprint,
+            touched_only=True,
+        )
+    except calculation_service.UnusableStateError as exc:
+        logger.warning("Unusable global tracker state, replaying: %s", exc)
+        return None
+
+    await insert_elo_history_async(session, rows["elo_history"])
+    rows_written = len(rows["elo_history"])
+    rows_written += await upsert_partnership_stats_async(session, rows["partnerships"])
+    rows_written += await upsert_opponent_stats_async(session, rows["opponents"])
+    rows_written += await _upsert_player_global_stats_rows(session, rows["player_global"])
+    await _rebuild_elo_series_async(session, sorted({row[0] for row in rows["elo_history"]}))
+    await _sync_match_elo_async(session, last_match_id)
+    await _save_tracker_state_async(
+        session, GLOBAL_STATE_SCOPE, summary.state_json, new_fingerprint
+    )
+    await stats_cache.bump_generation(session, stats_cache.GLOBAL_SCOPE)
+    await session.commit()
+    logger.info("Global stats update wrote %s rows", rows_written)
+
+    return {
+        "player_count": summary.player_count,
+        "match_count": new_fingerprint["count"],
+        "rows_written": rows_written,
+    }
+
+
+async def _season_setup_async(
+    session: AsyncSession, season_id: int, season_matches: Sequence
+) -> "calculation_service.SeasonSetup":
+    """
+    Load what a season's tracker is configured with (scoring and initial ratings).
+
+    Raises:
+        ValueError: If the season does not exist
     """
     season_result = await session.execute(select(Season).where(Season.id == season_id))
     season = season_result.scalar_one_or_none()
@@ -417,146 +1413,116 @@ async def _calculate_season_stats_from_matches(
         )
         all_league_member_ids = [row[0] for row in league_members_result.all()]
         for pid in all_league_member_ids:
-            initial_ratings[pid] = 100.0
+            initial_ratings[pid] = SEASON_INITIAL_RATING
 
         # Also set initial rating for any match participants not in league_members
         # (e.g. guest/substitute players) so they don't start at 1200
         for match in season_matches:
-            for pid in (
-                match.team1_player1_id,
-                match.team1_player2_id,
-                match.team2_player1_id,
-                match.team2_player2_id,
-            ):
-                if pid and pid not in initial_ratings:
-                    initial_ratings[pid] = 100.0
-
-    if not season_matches:
-        await delete_season_stats_async(session, season_id)
-        return {"player_count": 0, "match_count": 0}
-
-    tracker = calculation_service.StatsTracker(
-        initial_ratings=initial_ratings if is_season_rating else None,
-        scoring_config=scoring_config,
-    )
-    for match in season_matches:
-        tracker.process_match(match)
-
-    partnership_season_list = []
-    for player_id, player_stats in tracker.players.items():
-        for partner_id, games in player_stats.games_with.items():
-            wins = player_stats.wins_with.get(partner_id, 0)
-            losses = games - wins
-            win_rate = wins / games if games > 0 else 0
-            points = calculation_service.calculate_points(wins, losses, scoring_config)
-            total_pt_diff = player_stats.point_diff_with.get(partner_id, 0)
-            avg_pt_diff = total_pt_diff / games if games > 0 else 0
-            partnership_season_list.append(
-                PartnershipStatsSeason(
-                    player_id=player_id,
-                    partner_id=partner_id,
-                    season_id=season_id,
-                    games=games,
-                    wins=wins,
-                    points=points,
-                    win_rate=round(win_rate, 3),
-                    avg_point_diff=round(avg_pt_diff, 1),
-                )
-            )
+            for team in match.player_ids:
+                for pid in team:
+                    if pid and pid not in initial_ratings:
+                        initial_ratings[pid] = SEASON_INITIAL_RATING
 
-    opponent_season_list = []
-    for player_id, player_stats in tracker.players.items():
-        for opponent_id, games in player_stats.games_against.items():
-            wins = player_stats.wins_against.get(opponent_id, 0)
-            losses = games - wins
-            win_rate = wins / games if games > 0 else 0
-            points = calculation_service.calculate_points(wins, losses, scoring_config)
-            total_pt_diff = player_stats.point_diff_against.get(opponent_id, 0)
-            avg_pt_diff = total_pt_diff / games if games > 0 else 0
-            opponent_season_list.append(
-                OpponentStatsSeason(
-                    player_id=player_id,
-                    opponent_id=opponent_id,
-                    season_id=season_id,
-                    games=games,
-                    wins=wins,
-                    points=points,
-                    win_rate=round(win_rate, 3),
-                    avg_point_diff=round(avg_pt_diff, 1),
-                )
-            )
+    return calculation_service.SeasonSetup(scoring_config, is_season_rating, initial_ratings)
 
-    season_rating_history_list = []
-    if is_season_rating:
-        for player_id, player_stats in tracker.players.items():
-            for (
-                match_id,
-                rating_after,
-                rating_change,
-                d,
-            ) in player_stats.match_season_rating_history:
-                season_rating_history_list.append(
-                    SeasonRatingHistory(
-                        player_id=player_id,
-                        season_id=season_id,
-                        match_id=match_id,
-                        date=d or "",
-                        rating_after=round(rating_after, 2),
-                        rating_change=round(rating_change, 2),
-                    )
-                )
 
-    await delete_season_stats_async(session, season_id)
-    await insert_partnership_stats_season_async(session, partnership_season_list)
-    await insert_opponent_stats_season_async(session, opponent_season_list)
+async def _calculate_season_stats_from_matches(
+    session: AsyncSession, season_id: int, season_matches: Sequence
+) -> Dict:
+    """
+    Helper: calculate season stats from a pre-loaded list of matches.
 
-    if season_rating_history_list:
-        await insert_season_rating_history_async(session, season_rating_history_list)
+    Used internally by calculate_season_stats_async.
 
-    await upsert_player_season_stats_async(session, tracker, season_id)
+    Returns:
+        Dict with player_count, match_count and rows_written.
+    """
+    setup = await _season_setup_async(session, season_id, season_matches)
+    tracker = calculation_service.create_season_tracker(setup)
+    for match in season_matches:
+        tracker.process_match(match, skip_global_elo=True)
 
-    unique_players = {
-        pid
-        for match in season_matches
-        for pid in [
-            match.team1_player1_id,
-            match.team1_player2_id,
-            match.team2_player1_id,
-            match.team2_player2_id,
-        ]
-        if pid
+    season_rows = calculation_service.build_season_stats_rows(
+        tracker, season_id, setup.scoring_config, setup.is_season_rating
+    )
+    return await _write_season_stats_async(session, season_id, season_rows, season_matches)
+
+
+async def _write_season_stats_async(
+    session: AsyncSession,
+    season_id: int,
+    season_rows: "calculation_service.SeasonStatsRows",
+    season_matches: Sequence,
+) -> Dict:
+    """
+    Replace a season's stats rows with those built from its tracker, writing
+    only the keys whose values changed.
+
+    Returns:
+        Dict with player_count, match_count and rows_written.
+    """
+    rows_written = await _sync_pair_stats_async(
+        session,
+        PartnershipStatsSeason,
+        "partner_id",
+        season_rows.partnerships,
+        "season_id",
+        season_id,
+    )
+    rows_written += await _sync_pair_stats_async(
+        session,
+        OpponentStatsSeason,
+        "opponent_id",
+        season_rows.opponents,
+        "season_id",
+        season_id,
+    )
+    rows_written += await _merge_rows_via_staging_async(
+        session,
+        SeasonRatingHistory,
+        SEASON_RATING_HISTORY_COLUMNS,
+        ("player_id", "season_id", "match_id"),
+        season_rows.rating_history,
+        [SeasonRatingHistory.season_id == season_id],
+    )
+    await _sync_match_season_ratings_async(session, season_id)
+    rows_written += await _sync_player_stats_async(
+        session, PlayerSeasonStats, "season_id", season_id, season_rows.players
+    )
+    await _rebuild_leaderboard_async(
+        session, SeasonLeaderboardEntry, PlayerSeasonStats, "season_id", season_id
+    )
+
+    unique_players = {pid for match in season_matches for team in match.player_ids for pid in team}
+    unique_players.discard(None)
+    return {
+        "player_count": len(unique_players),
+        "match_count": len(season_matches),
+        "rows_written": rows_written,
     }
-    return {"player_count": len(unique_players), "match_count": len(season_matches)}
 
 
 async def calculate_league_stats_async(session: AsyncSession, league_id: int) -> Dict:
     """
     Calculate league-level stats and all season stats for a league.
 
-    Loads all ranked matches once, processes league-level stats, then
-    calculates per-season stats from in-memory subsets.
+    Loads all ranked matches once and replays them in a single pass that
+    updates the league tracker and the tracker of each match's season together
+    (each scope with its own scoring config). Large leagues are replayed in a
+    replay process. Every league and season stats table is then diffed against
+    the replayed rows and only changed keys are written, in one transaction.
 
     Returns:
-        Dict with league_player_count, league_match_count, and season_counts.
+        Dict with league_player_count, league_match_count, season_counts and
+        rows_written (league and season stats rows inserted, updated or deleted).
     """
     # Lazy import to avoid circular dependency
     from backend.services.league_data import list_seasons
 
-    all_matches = await load_stat_eligible_matches_async(session, league_id=league_id)
+    all_matches = await load_replay_matches_async(session, league_id=league_id)
     seasons = await list_seasons(session, league_id)
     season_ids = [s["id"] for s in seasons]
 
-    if not all_matches:
-        await delete_league_stats_async(session, league_id)
-        for sid in season_ids:
-            await delete_season_stats_async(session, sid)
-        await session.commit()
-        return {
-            "league_player_count": 0,
-            "league_match_count": 0,
-            "season_counts": {sid: {"player_count": 0, "match_count": 0} for sid in season_ids},
-        }
-
     session_ids_set = {m.session_id for m in all_matches if m.session_id}
     session_to_season_map: Dict[int, int] = {}
     if session_ids_set:
@@ -574,105 +1540,69 @@ async def calculate_league_stats_async(session: AsyncSession, league_id: int) ->
     league_point_system = league_config_result.scalar_one_or_none()
     league_scoring_config = calculation_service.get_scoring_config(league_point_system)
 
-    partnerships, opponents, _ = calculation_service.process_matches(
-        all_matches, scoring_config=league_scoring_config
-    )
-
-    league_tracker = calculation_service.StatsTracker(scoring_config=league_scoring_config)
-    for match in all_matches:
-        league_tracker.process_match(match)
-
-    partnership_league_list = [
-        PartnershipStatsLeague(
-            player_id=ps.player_id,
-            partner_id=ps.partner_id,
-            league_id=league_id,
-            games=ps.games,
-            wins=ps.wins,
-            points=ps.points,
-            win_rate=ps.win_rate,
-            avg_point_diff=ps.avg_point_diff,
-        )
-        for ps in partnerships
-    ]
-
-    opponent_league_list = [
-        OpponentStatsLeague(
-            player_id=os.player_id,
-            opponent_id=os.opponent_id,
-            league_id=league_id,
-            games=os.games,
-            wins=os.wins,
-            points=os.points,
-            win_rate=os.win_rate,
-            avg_point_diff=os.avg_point_diff,
-        )
-        for os in opponents
-    ]
-
-    player_league_stats_list = [
-        {
-            "player_id": player_id,
-            "league_id": league_id,
-            "games": player_stats.game_count,
-            "wins": player_stats.win_count,
-            "points": player_stats.points,
-            "win_rate": round(player_stats.win_rate, 3),
-            "avg_point_diff": round(player_stats.avg_point_diff, 1),
-        }
-        for player_id, player_stats in league_tracker.players.items()
-    ]
-
-    await delete_league_stats_async(session, league_id)
-    await insert_partnership_stats_league_async(session, partnership_league_list)
-    await insert_opponent_stats_league_async(session, opponent_league_list)
-
-    if player_league_stats_list:
-        stmt = pg_insert(PlayerLeagueStats).values(player_league_stats_list)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["player_id", "league_id"],
-            set_=dict(
-                games=stmt.excluded.games,
-                wins=stmt.excluded.wins,
-                points=stmt.excluded.points,
-                win_rate=stmt.excluded.win_rate,
-                avg_point_diff=stmt.excluded.avg_point_diff,
-                updated_at=func.now(),
-            ),
-        )
-        await session.execute(stmt)
-
-    matches_by_season: Dict[int, List[Match]] = {}
+    matches_by_season: Dict[int, List[calculation_service.ReplayMatch]] = {}
     for match in all_matches:
         sid = session_to_season_map.get(match.session_id) if match.session_id else None
         if sid and sid in season_ids:
             matches_by_season.setdefault(sid, []).append(match)
 
+    season_setups = {
+        sid: await _season_setup_async(session, sid, matches_by_season.get(sid, []))
+        for sid in season_ids
+    }
+
+    league_rows = None
+    replay = replay_process.iter_replay(
+        calculation_service.iter_league_stats,
+        all_matches,
+        league_id,
+        league_scoring_config,
+        season_setups,
+        session_to_season_map,
+    )
+    async with aclosing(replay) as items:
+        async for league_rows in items:
+            pass
+
+    rows_written = await _sync_pair_stats_async(
+        session,
+        PartnershipStatsLeague,
+        "partner_id",
+        league_rows.partnerships,
+        "league_id",
+        league_id,
+    )
+    rows_written += await _sync_pair_stats_async(
+        session,
+        OpponentStatsLeague,
+        "opponent_id",
+        league_rows.opponents,
+        "league_id",
+        league_id,
+    )
+    rows_written += await _sync_player_stats_async(
+        session, PlayerLeagueStats, "league_id", league_id, league_rows.players
+    )
+    await _rebuild_leaderboard_async(
+        session, LeagueLeaderboardEntry, PlayerLeagueStats, "league_id", league_id
+    )
+
     season_counts: Dict[int, Dict] = {}
     for sid in season_ids:
-        season_matches = matches_by_season.get(sid, [])
-        season_counts[sid] = await _calculate_season_stats_from_matches(
-            session, sid, season_matches
+        season_counts[sid] = await _write_season_stats_async(
+            session, sid, league_rows.seasons[sid], matches_by_season.get(sid, [])
         )
+        rows_written += season_counts[sid]["rows_written"]
 
-    unique_league_players = {
-        pid
-        for match in all_matches
-        for pid in [
-            match.team1_player1_id,
-            match.team1_player2_id,
-            match.team2_player1_id,
-            match.team2_player2_id,
-        ]
-        if pid
-    }
-
+    await stats_cache.bump_generation(session, stats_cache.league_scope(league_id))
     await session.commit()
+    logger.info("League %s stats wrote %s rows", league_id, rows_written)
 
     return {
-        "league_player_count": len(unique_league_players),
+        "league_player_count": league_rows.player_count,
         "league_match_count": len(all_matches),
         "season_counts": season_counts,
+        "rows_written": rows_written,
     }
 
 
@@ -686,8 +1616,12 @@ async def calculate_season_stats_async(session: AsyncSession, season_id: int) ->
     Returns:
         Dict with player_count and match_count.
     """
-    matches = await load_stat_eligible_matches_async(session, season_id=season_id)
+    matches = await load_replay_matches_async(session, season_id=season_id)
     result = await _calculate_season_stats_from_matches(session, season_id, matches)
+    league_result = await session.execute(select(Season.league_id).where(Season.id == season_id))
+    league_id = league_result.scalar_one_or_none()
+    if league_id is not None:
+        await stats_cache.bump_generation(session, stats_cache.league_scope(league_id))
     await session.commit()
     return result
 
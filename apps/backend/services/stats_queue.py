@@ -2,31 +2,65 @@
 Stats calculation queue system with deduplication.
 
 Handles async stats calculation jobs with a database-backed queue that:
-- Deduplicates concurrent requests
+- Deduplicates concurrent requests per (calc_type, league_id)
 - Persists across server restarts
 - Tracks job status
+- Runs a pool of workers that claim jobs with SELECT ... FOR UPDATE SKIP LOCKED
+- Wakes workers with Postgres LISTEN/NOTIFY instead of polling
+- Debounces bursts of requests for the same job into one recompute
+
+Jobs that touch the same scope (global stats, or one league) are serialized with a
+Postgres advisory lock held for the lifetime of the job, so any number of workers -
+in this process or in other API replicas - can drain the queue concurrently.
 """
 
 import asyncio
 import logging
-from typing import Optional, Dict, Callable, Awaitable
+import os
+from datetime import timedelta
+from typing import Optional, Dict, List, Callable, Awaitable
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.utils.datetime_utils import utcnow
 from sqlalchemy import select, update, and_, func
 from backend.database.models import StatsCalculationJob, StatsCalculationJobStatus, Season
 from backend.database import db
+from backend.services import stats_cache
 
 logger = logging.getLogger(__name__)
 
+# Number of concurrent worker tasks started by start_background_worker()
+WORKER_COUNT = max(1, int(os.getenv("STATS_QUEUE_WORKERS", "4")))
+# Minimum age of a pending job before it is claimed. Requests for the same
+# (calc_type, league_id) arriving within this window collapse into the one pending job.
+DEBOUNCE_SECONDS = float(os.getenv("STATS_QUEUE_DEBOUNCE_SECONDS", "5"))
+# Fallback poll for an idle worker; enqueues wake workers through NOTIFY
+IDLE_POLL_SECONDS = 60
+# Retry interval while runnable jobs are waiting on a busy scope
+SCOPE_RETRY_SECONDS = 1
+# Back-off after an unexpected worker error
+ERROR_BACKOFF_SECONDS = 5
+# Pending jobs inspected per claim attempt (jobs whose scope is busy are skipped)
+CLAIM_BATCH_SIZE = 20
+
+# Advisory lock namespace (first key of the two-int pg_advisory_*lock form) for scope
+# locks, which are keyed by league_id, with GLOBAL_SCOPE_ID for global stats
+SCOPE_LOCK_NAMESPACE = 0x5343
+GLOBAL_SCOPE_ID = 0
+
+# NOTIFY channel used to wake workers on every replica when a job is enqueued
+STATS_QUEUE_CHANNEL = "stats_calculation_jobs"
+
 
 class StatsCalculationQueue:
     """Database-backed queue for stats calculation jobs."""
 
-    def __init__(self):
-        self._worker_task: Optional[asyncio.Task] = None
-        self._running = False
+    def __init__(self, debounce_seconds: float = DEBOUNCE_SECONDS):
+        self._debounce_seconds = debounce_seconds
+        self._worker_tasks: List[asyncio.Task] = []
+        self._listener_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
-        self._global_calc_callback: Optional[Callable[[AsyncSession], Awaitable[Dict]]] = None
+        self._wake_event = asyncio.Event()
+        self._global_calc_callback: Optional[Callable[..., Awaitable[Dict]]] = None
         self._league_calc_callback: Optional[Callable[[AsyncSession, int], Awaitable[Dict]]] = None
 
     async def enqueue_calculation(
@@ -37,17 +71,32 @@ class StatsCalculationQueue:
 
         Deduplication logic:
         - If same (calc_type, league_id) already pending/running, return existing job_id
-        - If calculation is running and more than 1 request comes in, only queue 1 additional
-        - Otherwise, start immediately or queue as pending
+        - Otherwise insert a pending job and NOTIFY the workers on every replica
+
+        A new job is not claimed until it is DEBOUNCE_SECONDS old, so a burst of
+        submissions for one league is folded into a single recompute.
+
+        Concurrent enqueues of the same (calc_type, league_id) - from this process or
+        another replica - are serialized by a transaction-scoped advisory lock, so the
+        dedupe check and the insert cannot race.
 
         Args:
             session: Database session
-            calc_type: 'global' or 'league'
+            calc_type: 'global', 'global_rebuild' (full replay) or 'league'
             league_id: Optional league ID for league calculations
 
         Returns:
             Job ID
         """
+        await session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    func.hashtext(f"stats_queue:{calc_type}"),
+                    league_id if league_id is not None else GLOBAL_SCOPE_ID,
+                )
+            )
+        )
+
         # Check for existing pending/running job of same type
         existing = await self._find_existing_job(session, calc_type, league_id)
         if existing and existing.status in [
@@ -56,50 +105,20 @@ class StatsCalculationQueue:
         ]:
             return existing.id
 
-        # Check if any calculation is currently running
-        running_job = await self._get_running_job(session)
-        if running_job:
-            # Check if same type already queued
-            queued = await self._find_queued_job(session, calc_type, league_id)
-            if queued:
-                return queued.id
-
-            # Check how many jobs are already queued
-            queued_count = await self._count_queued_jobs(session)
-            if queued_count == 0:
-                # No jobs queued, add this one
-                job = StatsCalculationJob(
-                    calc_type=calc_type,
-                    league_id=league_id,
-                    status=StatsCalculationJobStatus.PENDING,
-                )
-                session.add(job)
-                await session.commit()
-                await session.refresh(job)
-                return job.id
-            else:
-                # Already have one queued, return the first one
-                first_queued = await self._get_first_queued_job(session)
-                return (
-                    first_queued.id
-                    if first_queued
-                    else await self._create_pending_job(session, calc_type, league_id)
-                )
-        else:
-            # No calculation running, start immediately
-            job = StatsCalculationJob(
-                calc_type=calc_type,
-                league_id=league_id,
-                status=StatsCalculationJobStatus.RUNNING,
-                started_at=utcnow(),
-            )
-            session.add(job)
-            await session.commit()
-            await session.refresh(job)
+        job = StatsCalculationJob(
+            calc_type=calc_type,
+            league_id=league_id,
+            status=StatsCalculationJobStatus.PENDING,
+        )
+        session.add(job)
+        await session.flush()
+        # Delivered to listeners when the transaction commits
+        await session.execute(select(func.pg_notify(STATS_QUEUE_CHANNEL, str(job.id))))
+        await session.commit()
+        await session.refresh(job)
 
-            # Start async task to run calculation
-            asyncio.create_task(self._run_calculation(job.id))
-            return job.id
+        self._wake_event.set()
+        return job.id
 
     async def _find_existing_job(
         self, session: AsyncSession, calc_type: str, league_id: Optional[int]
@@ -119,67 +138,149 @@ class StatsCalculationQueue:
         )
         return result.scalar_one_or_none()
 
-    async def _get_running_job(self, session: AsyncSession) -> Optional[StatsCalculationJob]:
-        """Get currently running job if any."""
+    async def _get_running_jobs(self, session: AsyncSession) -> List[StatsCalculationJob]:
+        """Get currently running jobs, oldest first."""
         result = await session.execute(
             select(StatsCalculationJob)
             .where(StatsCalculationJob.status == StatsCalculationJobStatus.RUNNING)
-            .limit(1)
+            .order_by(StatsCalculationJob.started_at.asc(), StatsCalculationJob.id.asc())
         )
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
 
-    async def _find_queued_job(
-        self, session: AsyncSession, calc_type: str, league_id: Optional[int]
-    ) -> Optional[StatsCalculationJob]:
-        """Find queued job with same calc_type and league_id."""
-        conditions = [
-            StatsCalculationJob.status == StatsCalculationJobStatus.PENDING,
-            StatsCalculationJob.calc_type == calc_type,
-        ]
-        if league_id is None:
-            conditions.append(StatsCalculationJob.league_id.is_(None))
-        else:
-            conditions.append(StatsCalculationJob.league_id == league_id)
+    async def _job_scope_id(self, session: AsyncSession, job: StatsCalculationJob) -> int:
+        """
+        Get the advisory lock key for the data a job writes.
 
+        Global jobs (incremental or full rebuild) share GLOBAL_SCOPE_ID; league jobs use
+        their league_id. Legacy season jobs resolve to their league.
+        """
+        if job.calc_type == "league" and job.league_id:
+            return job.league_id
+        if job.calc_type == "season" and job.season_id:
+            result = await session.execute(
+                select(Season.league_id).where(Season.id == job.season_id)
+            )
+            league_id = result.scalar_one_or_none()
+            if league_id:
+                return league_id
+        # Global jobs, and malformed jobs that will fail in _run_calculation anyway
+        return GLOBAL_SCOPE_ID
+
+    async def _try_lock_scope(self, session: AsyncSession, scope_id: int) -> bool:
+        """Try to take a scope lock for the rest of the session's transaction."""
         result = await session.execute(
-            select(StatsCalculationJob).where(and_(*conditions)).limit(1)
+            select(func.pg_try_advisory_xact_lock(SCOPE_LOCK_NAMESPACE, scope_id))
         )
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
 
-    async def _count_queued_jobs(self, session: AsyncSession) -> int:
-        """Count pending jobs."""
-        result = await session.execute(
-            select(func.count())
-            .select_from(StatsCalculationJob)
-            .where(StatsCalculationJob.status == StatsCalculationJobStatus.PENDING)
-        )
-        return result.scalar() or 0
+    async def _reap_orphaned_jobs(self, session: AsyncSession) -> None:
+        """
+        Fail running jobs whose worker is gone.
 
-    async def _get_first_queued_job(self, session: AsyncSession) -> Optional[StatsCalculationJob]:
-        """Get first pending job."""
+        A live worker holds its job's scope lock until the job is marked completed or
+        failed, so a running job whose scope lock is free belongs to a worker (or
+        replica) that exited mid-job. The row lock from FOR UPDATE keeps a finishing
+        worker from completing the job between the check and the update.
+        """
         result = await session.execute(
             select(StatsCalculationJob)
-            .where(StatsCalculationJob.status == StatsCalculationJobStatus.PENDING)
-            .order_by(StatsCalculationJob.created_at.asc())
-            .limit(1)
-        )
-        return result.scalar_one_or_none()
-
-    async def _create_pending_job(
-        self, session: AsyncSession, calc_type: str, league_id: Optional[int]
-    ) -> int:
-        """Create a pending job and return its ID."""
-        job = StatsCalculationJob(
-            calc_type=calc_type, league_id=league_id, status=StatsCalculationJobStatus.PENDING
+            .where(StatsCalculationJob.status == StatsCalculationJobStatus.RUNNING)
+            .with_for_update(skip_locked=True)
         )
-        session.add(job)
+        for job in result.scalars().all():
+            if await self._try_lock_scope(session, await self._job_scope_id(session, job)):
+                logger.warning(f"Marking orphaned stats job {job.id} ({job.calc_type}) failed")
+                job.status = StatsCalculationJobStatus.FAILED
+                job.completed_at = utcnow()
+                job.error_message = "Worker exited before the job finished"
+        # Commit (or release) before claiming so the scope locks taken here are dropped
         await session.commit()
-        await session.refresh(job)
-        return job.id
+
+    async def _claim_next_job(self, lock_session: AsyncSession) -> Optional[int]:
+        """
+        Claim the oldest pending job whose scope is free.
+
+        The scope lock is taken on ``lock_session`` and stays held until that session's
+        transaction ends, which the caller does only after the job has finished. The job
+        row itself is claimed in a short separate transaction so its RUNNING status is
+        visible to other workers immediately.
+
+        Returns:
+            The claimed job ID, or None if nothing is runnable right now
+        """
+        async with db.AsyncSessionLocal() as claim_session:
+            await self._reap_orphaned_jobs(claim_session)
+
+            result = await claim_session.execute(
+                select(StatsCalculationJob)
+                .where(
+                    StatsCalculationJob.status == StatsCalculationJobStatus.PENDING,
+                    StatsCalculationJob.created_at
+                    <= func.now() - timedelta(seconds=self._debounce_seconds),
+                )
+                .order_by(StatsCalculationJob.created_at.asc(), StatsCalculationJob.id.asc())
+                .limit(CLAIM_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            for job in result.scalars().all():
+                scope_id = await self._job_scope_id(claim_session, job)
+                if await self._try_lock_scope(lock_session, scope_id):
+                    job.status = StatsCalculationJobStatus.RUNNING
+                    job.started_at = utcnow()
+                    await claim_session.commit()
+                    return job.id
+
+            await claim_session.rollback()
+            return None
+
+    async def _next_claim_delay(self) -> float:
+        """
+        Get how long an idle worker should wait before trying to claim again.
+
+        Returns the time until the oldest pending job leaves its debounce window,
+        SCOPE_RETRY_SECONDS if runnable jobs are only waiting on a busy scope, and
+        IDLE_POLL_SECONDS when the queue is empty.
+        """
+        async with db.AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(
+                    func.extract("epoch", func.min(StatsCalculationJob.created_at) - func.now())
+                ).where(StatsCalculationJob.status == StatsCalculationJobStatus.PENDING)
+            )
+            oldest_age = result.scalar()
+        if oldest_age is None:
+            return IDLE_POLL_SECONDS
+        wait = float(oldest_age) + self._debounce_seconds
+        if wait <= 0:
+            return SCOPE_RETRY_SECONDS
+        # Small margin so the job is past its window when the worker retries
+        return min(wait + 0.05, IDLE_POLL_SECONDS)
+
+    async def _run_next_job(self) -> bool:
+        """
+        Claim and run one job.
+
+        Returns:
+            True if a job was run, False if nothing was runnable
+        """
+        lock_session = db.AsyncSessionLocal()
+        try:
+            job_id = await self._claim_next_job(lock_session)
+            if job_id is None:
+                return False
+            try:
+                await self._run_calculation(job_id)
+            except Exception as e:
+                # _run_calculation already marked the job failed
+                logger.error(f"Stats calculation job {job_id} failed: {e}")
+            return True
+        finally:
+            # Ending the transaction releases the scope lock
+            await lock_session.close()
 
     def register_calculation_callbacks(
         self,
-        global_calc_callback: Callable[[AsyncSession], Awaitable[Dict]],
+        global_calc_callback: Callable[..., Awaitable[Dict]],
         league_calc_callback: Callable[[AsyncSession, int], Awaitable[Dict]],
     ) -> None:
         """
@@ -189,7 +290,8 @@ class StatsCalculationQueue:
         Typically called during application startup.
 
         Args:
-            global_calc_callback: Async function that takes a session and calculates global stats
+            global_calc_callback: Async function that takes a session (and an optional
+                full_rebuild keyword) and calculates global stats
             league_calc_callback: Async function that takes a session and league_id and calculates league stats
 
         Raises:
@@ -233,6 +335,8 @@ class StatsCalculationQueue:
             try:
                 if job.calc_type == "global":
                     await self._global_calc_callback(session)
+                elif job.calc_type == "global_rebuild":
+                    await self._global_calc_callback(session, full_rebuild=True)
                 elif job.calc_type == "league":
                     if not job.league_id:
                         raise ValueError("league_id required for league calculation")
@@ -277,50 +381,88 @@ class StatsCalculationQueue:
             await session.close()
 
     async def _process_queue_worker(self) -> None:
-        """Background worker that processes pending jobs."""
+        """Background worker that claims and runs pending jobs until stopped."""
         while not self._stop_event.is_set():
+            # Cleared before claiming, so a wake-up that arrives during the attempt
+            # is not lost
+            self._wake_event.clear()
             try:
-                session = db.AsyncSessionLocal()
-                try:
-                    # Get first pending job
-                    job = await self._get_first_queued_job(session)
-                    if job:
-                        # Mark as running
-                        await session.execute(
-                            update(StatsCalculationJob)
-                            .where(StatsCalculationJob.id == job.id)
-                            .values(status=StatsCalculationJobStatus.RUNNING, started_at=utcnow())
-                        )
-                        await session.commit()
-                        await session.close()
-
-                        # Run calculation (it will create its own session)
-                        await self._run_calculation(job.id)
-                    else:
-                        # No pending jobs, wait a bit
-                        await session.close()
-                        await asyncio.sleep(1)
-                except Exception as e:
-                    try:
-                        await session.rollback()
-                    except Exception:
-                        pass
+                if await self._run_next_job():
+                    continue
+                delay = await self._next_claim_delay()
+            except Exception as e:
+                # Log error and continue (don't raise)
+                logger.error(f"Error in queue worker: {e}")
+                delay = ERROR_BACKOFF_SECONDS
+
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_job_notification(self, connection, pid, channel, payload) -> None:
+        """asyncpg LISTEN callback: wake the local workers."""
+        self._wake_event.set()
+
+    async def _listen_for_jobs(self) -> None:
+        """
+        Hold a LISTEN connection for STATS_QUEUE_CHANNEL until stopped.
+
+        The same connection feeds stats_cache the stats generations announced by
+        every replica. Reconnects after the connection drops; in the meantime
+        workers fall back to polling every IDLE_POLL_SECONDS and the cache reads
+        generations from the database.
+        """
+        while not self._stop_event.is_set():
+            try:
+                async with db.engine.connect() as conn:
+                    raw_connection = await conn.get_raw_connection()
+                    driver_connection = raw_connection.driver_connection
+                    connection_lost = asyncio.Event()
+
+                    def on_terminate(_connection) -> None:
+                        connection_lost.set()
+
+                    driver_connection.add_termination_listener(on_terminate)
+                    await driver_connection.add_listener(
+                        STATS_QUEUE_CHANNEL, self._on_job_notification
+                    )
+                    await stats_cache.attach_generation_feed(driver_connection)
+                    # Jobs may have been enqueued while the listener was connecting
+                    self._wake_event.set()
                     try:
-                        await session.close()
-                    except Exception:
-                        pass
-                    # Log error and continue (don't raise)
-                    logger.error(f"Error in queue worker: {e}")
-                    await asyncio.sleep(5)
+                        waiters = [
+                            asyncio.create_task(connection_lost.wait()),
+                            asyncio.create_task(self._stop_event.wait()),
+                        ]
+                        try:
+                            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                        finally:
+                            for waiter in waiters:
+                                waiter.cancel()
+                    finally:
+                        driver_connection.remove_termination_listener(on_terminate)
+                        await stats_cache.detach_generation_feed(driver_connection)
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(
+                                STATS_QUEUE_CHANNEL, self._on_job_notification
+                            )
+                if not self._stop_event.is_set():
+                    logger.warning("Stats queue listener connection lost, reconnecting")
             except Exception as e:
-                # Log error and continue
-                logger.error(f"Error in queue worker (outer): {e}")
-                await asyncio.sleep(5)
+                logger.error(f"Error in stats queue listener: {e}")
+                await asyncio.sleep(ERROR_BACKOFF_SECONDS)
 
     async def get_queue_status(self, session: AsyncSession) -> Dict:
-        """Get current queue status."""
-        # Get running job
-        running = await self._get_running_job(session)
+        """
+        Get current queue status.
+
+        ``running`` is the oldest running job (kept for existing clients); with several
+        workers, ``running_jobs`` lists all of them.
+        """
+        # Get running jobs
+        running_jobs = await self._get_running_jobs(session)
+        running = running_jobs[0] if running_jobs else None
 
         # Get pending jobs
         result = await session.execute(
@@ -358,6 +500,16 @@ class StatsCalculationQueue:
             }
             if running
             else None,
+            "running_jobs": [
+                {
+                    "id": j.id,
+                    "calc_type": j.calc_type,
+                    "league_id": j.league_id,
+                    "season_id": j.season_id,  # Deprecated
+                    "started_at": j.started_at.isoformat() if j.started_at else None,
+                }
+                for j in running_jobs
+            ],
             "pending": [
                 {
                     "id": j.id,
@@ -412,17 +564,27 @@ class StatsCalculationQueue:
             "error_message": job.error_message,
         }
 
-    def start_background_worker(self) -> None:
-        """Start the background worker."""
-        if self._worker_task is None or self._worker_task.done():
-            self._stop_event.clear()
-            self._worker_task = asyncio.create_task(self._process_queue_worker())
+    def start_background_worker(self, worker_count: int = WORKER_COUNT) -> None:
+        """Start the listener and worker pool (no-op if they are already running)."""
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        if self._worker_tasks:
+            return
+        self._stop_event.clear()
+        self._listener_task = asyncio.create_task(self._listen_for_jobs())
+        self._worker_tasks = [
+            asyncio.create_task(self._process_queue_worker()) for _ in range(worker_count)
+        ]
 
     def stop_background_worker(self) -> None:
-        """Stop the background worker."""
+        """Stop the listener and worker pool."""
         self._stop_event.set()
-        if self._worker_task and not self._worker_task.done():
-            self._worker_task.cancel()
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+        self._listener_task = None
+        for task in self._worker_tasks:
+            if not task.done():
+                task.cancel()
+        self._worker_tasks = []
 
 
 # Global queue instance
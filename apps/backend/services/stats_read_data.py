@@ -2,8 +2,8 @@
 Stats read-only operations.
 
 Extracted from stats_data.py.  Covers:
-- Rankings queries (_sort helpers, get_rankings)
-- ELO timeline and match-with-ELO queries
+- Rankings queries (precomputed leaderboards, _sort helpers, get_rankings)
+- ELO timeline (dense legacy table and sparse per-player series) and match-with-ELO queries
 - Paginated match listing (query_matches)
 - Per-player / per-season / per-league stats reads
 - CSV export and match history
@@ -14,9 +14,10 @@ from __future__ import annotations
 import csv
 import io
 import logging
-from typing import Dict, List, Optional
+from datetime import date
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import Integer, and_, cast, func, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -24,7 +25,10 @@ from backend.database.models import (
     Court,
     EloHistory,
     League,
+    LeagueLeaderboardEntry,
     Match,
+    MatchParticipant,
+    MatchStats,
     OpponentStats,
     OpponentStatsSeason,
     OpponentStatsLeague,
@@ -32,24 +36,34 @@ from backend.database.models import (
     PartnershipStatsSeason,
     PartnershipStatsLeague,
     Player,
+    PlayerEloSeries,
     PlayerGlobalStats,
     PlayerLeagueStats,
     PlayerSeasonStats,
     Season,
+    SeasonLeaderboardEntry,
     Session,
     SessionStatus,
 )
 from backend.utils.constants import INITIAL_ELO
+from backend.utils.downsample import lttb_indices
+from backend.utils.pagination import after_cursor, decode_cursor, encode_cursor
 from backend.services.player_data import generate_player_initials
+from backend.services.stats_calc_data import MATCH_SEATS, ranked_player_stats_query
 
 logger = logging.getLogger(__name__)
 
+# Matches fetched per server-side cursor round trip by the CSV export
+MATCH_EXPORT_CHUNK_SIZE = 1000
+
 __all__ = [
     "get_rankings",
     "get_elo_timeline",
+    "get_elo_series",
     "get_season_matches_with_elo",
     "get_league_matches_with_elo",
     "query_matches",
+    "query_matches_next_cursor",
     "get_player_stats_by_id",
     "get_player_season_partnership_opponent_stats",
     "get_all_player_season_stats",
@@ -60,6 +74,7 @@ __all__ = [
     "get_player_league_partnership_opponent_stats",
     "get_all_player_league_partnership_opponent_stats",
     "export_matches_to_csv",
+    "iter_matches_csv",
     "get_player_match_history_by_id",
 ]
 
@@ -101,9 +116,78 @@ def _sort_rankings_single_season(rankings: List[Dict]) -> List[Dict]:
     )
 
 
+def _ranking_entry(row) -> Dict:
+    """Build a rankings response dict from a player + stats row."""
+    name = row.full_name or row.nickname or f"Player {row.id}"
+    initials = generate_player_initials(name)
+    return {
+        "player_id": row.id,
+        "name": name,
+        "avatar": row.profile_picture_url or row.avatar or initials,
+        "initials": initials,
+        "is_placeholder": row.is_placeholder or False,
+        "elo": round(row.current_rating) if row.current_rating else INITIAL_ELO,
+        "points": row.points or 0,
+        "games": row.games or 0,
+        "wins": row.wins or 0,
+        "losses": (row.games or 0) - (row.wins or 0),
+        "win_rate": row.win_rate or 0.0,
+        "avg_pt_diff": row.avg_point_diff or 0.0,
+    }
+
+
+async def _ranked_rows(session: AsyncSession, entries) -> list:
+    """Join ranked leaderboard entries (a subquery) with player details, in rank order."""
+    query = (
+        select(
+            entries.c.rank,
+            Player.id,
+            Player.full_name,
+            Player.nickname,
+            Player.is_placeholder,
+            Player.avatar,
+            Player.profile_picture_url,
+            PlayerGlobalStats.current_rating,
+            entries.c.points,
+            entries.c.games,
+            entries.c.wins,
+            entries.c.win_rate,
+            entries.c.avg_point_diff,
+        )
+        .join(Player, Player.id == entries.c.player_id)
+        .outerjoin(PlayerGlobalStats, Player.id == PlayerGlobalStats.player_id)
+        .order_by(entries.c.rank)
+    )
+    result = await session.execute(query)
+    return result.all()
+
+
+async def _get_leaderboard(
+    session: AsyncSession, entry_model, stats_model, scope_column: str, scope_id: int
+) -> List[Dict]:
+    """
+    Read a league's/season's precomputed leaderboard, in rank order.
+
+    Names, avatars and ELO are joined from the player tables, so profile edits
+    show up without a recompute. Falls back to ranking the scope's player stats
+    on the fly (same order) when no leaderboard has been written for it, e.g.
+    for stats written outside the stats job.
+    """
+    entries = select(entry_model).where(entry_model.__table__.c[scope_column] == scope_id)
+    rows = await _ranked_rows(session, entries.subquery())
+    if not rows:
+        ranked = ranked_player_stats_query(stats_model, scope_column, scope_id)
+        rows = await _ranked_rows(session, ranked.subquery())
+    return [{"rank": row.rank, **_ranking_entry(row)} for row in rows]
+
+
 async def get_rankings(session: AsyncSession, body: Optional[Dict] = None) -> List[Dict]:
     """
-    Get current player rankings ordered by points.
+    Get current player rankings, best first.
+
+    With a season_id or league_id, reads that season's / league's leaderboard,
+    which the stats job keeps ranked. Without either, ranks every player by
+    their latest season stats ("All Seasons" order).
 
     Args:
         session: Database session
@@ -121,63 +205,53 @@ async def get_rankings(session: AsyncSession, body: Optional[Dict] = None) -> Li
     league_id = body.get("league_id")
 
     try:
-        if league_id is not None and season_id is None:
-            stats_subq = (
-                select(
-                    PlayerLeagueStats.player_id,
-                    PlayerLeagueStats.points,
-                    PlayerLeagueStats.games,
-                    PlayerLeagueStats.wins,
-                    PlayerLeagueStats.win_rate,
-                    PlayerLeagueStats.avg_point_diff,
-                )
-                .where(PlayerLeagueStats.league_id == int(league_id))
-                .subquery()
+        if season_id is not None:
+            return await _get_leaderboard(
+                session, SeasonLeaderboardEntry, PlayerSeasonStats, "season_id", int(season_id)
             )
-        else:
-            latest_stats_subq = select(
+        if league_id is not None:
+            return await _get_leaderboard(
+                session, LeagueLeaderboardEntry, PlayerLeagueStats, "league_id", int(league_id)
+            )
+
+        latest_stats_subq = (
+            select(
                 PlayerSeasonStats.player_id,
                 func.max(PlayerSeasonStats.updated_at).label("max_updated_at"),
             )
-            if season_id is not None:
-                latest_stats_subq = latest_stats_subq.where(
-                    PlayerSeasonStats.season_id == int(season_id)
-                )
-            latest_stats_subq = latest_stats_subq.group_by(PlayerSeasonStats.player_id).subquery()
-
-            latest_id_subq = select(
-                PlayerSeasonStats.player_id, func.max(PlayerSeasonStats.id).label("max_id")
-            ).join(
+            .group_by(PlayerSeasonStats.player_id)
+            .subquery()
+        )
+        latest_id_subq = (
+            select(PlayerSeasonStats.player_id, func.max(PlayerSeasonStats.id).label("max_id"))
+            .join(
                 latest_stats_subq,
                 and_(
                     PlayerSeasonStats.player_id == latest_stats_subq.c.player_id,
                     PlayerSeasonStats.updated_at == latest_stats_subq.c.max_updated_at,
                 ),
             )
-            if season_id is not None:
-                latest_id_subq = latest_id_subq.where(
-                    PlayerSeasonStats.season_id == int(season_id)
-                )
-            latest_id_subq = latest_id_subq.group_by(PlayerSeasonStats.player_id).subquery()
-
-            stats_subq = (
-                select(
-                    PlayerSeasonStats.player_id,
-                    PlayerSeasonStats.points,
-                    PlayerSeasonStats.games,
-                    PlayerSeasonStats.wins,
-                    PlayerSeasonStats.win_rate,
-                    PlayerSeasonStats.avg_point_diff,
-                )
-                .join(
-                    latest_id_subq,
-                    and_(
-                        PlayerSeasonStats.player_id == latest_id_subq.c.player_id,
-                        PlayerSeasonStats.id == latest_id_subq.c.max_id,
-                    ),
-                )
-                .subquery()
+            .group_by(PlayerSeasonStats.player_id)
+            .subquery()
+        )
+        stats_subq = (
+            select(
+                PlayerSeasonStats.player_id,
+                PlayerSeasonStats.points,
+                PlayerSeasonStats.games,
+                PlayerSeasonStats.wins,
+                PlayerSeasonStats.win_rate,
+                PlayerSeasonStats.avg_point_diff,
             )
+            .join(
+                latest_id_subq,
+                and_(
+                    PlayerSeasonStats.player_id == latest_id_subq.c.player_id,
+                    PlayerSeasonStats.id == latest_id_subq.c.max_id,
+                ),
+            )
+            .subquery()
+        )
 
         query = (
             select(
@@ -205,35 +279,8 @@ async def get_rankings(session: AsyncSession, body: Optional[Dict] = None) -> Li
         )
 
         result = await session.execute(query)
-        rows = result.all()
-
-        rankings = []
-        for row in rows:
-            name = row.full_name or row.nickname or f"Player {row.id}"
-            initials = generate_player_initials(name)
-            rankings.append(
-                {
-                    "player_id": row.id,
-                    "name": name,
-                    "avatar": row.profile_picture_url or row.avatar or initials,
-                    "initials": initials,
-                    "is_placeholder": row.is_placeholder or False,
-                    "elo": round(row.current_rating) if row.current_rating else INITIAL_ELO,
-                    "points": row.points or 0,
-                    "games": row.games or 0,
-                    "wins": row.wins or 0,
-                    "losses": (row.games or 0) - (row.wins or 0),
-                    "win_rate": row.win_rate or 0.0,
-                    "avg_pt_diff": row.avg_point_diff or 0.0,
-                }
-            )
-
-        if season_id is not None:
-            rankings = _sort_rankings_single_season(rankings)
-        else:
-            rankings = _sort_rankings_all_seasons(rankings)
-
-        return rankings
+        rankings = _sort_rankings_all_seasons([_ranking_entry(row) for row in result.all()])
+        return [{"rank": rank, **entry} for rank, entry in enumerate(rankings, start=1)]
 
     except Exception:
         logger.exception("get_rankings failed")
@@ -267,7 +314,7 @@ async def get_elo_timeline(session: AsyncSession) -> List[Dict]:
     # Fetch all EloHistory records once, ordered by player, date, id
     result = await session.execute(
         select(EloHistory.player_id, EloHistory.date, EloHistory.elo_after).order_by(
-            EloHistory.player_id, EloHistory.date.asc(), EloHistory.id.asc()
+            EloHistory.player_id, EloHistory.date.asc(), EloHistory.match_id.asc()
         )
     )
     all_elo_rows = result.all()
@@ -280,7 +327,7 @@ async def get_elo_timeline(session: AsyncSession) -> List[Dict]:
         if player_id not in player_elo_history:
             player_elo_history[player_id] = []
         history = player_elo_history[player_id]
-        # Keep only the latest elo per date (last write wins since sorted by id asc)
+        # Keep only the latest elo per date (last write wins since sorted by match id asc)
         if history and history[-1][0] == elo_date:
             history[-1] = (elo_date, elo_after)
         else:
@@ -308,24 +355,91 @@ async def get_elo_timeline(session: AsyncSession) -> List[Dict]:
     return timeline
 
 
-def _build_elo_by_match(elo_rows) -> Dict:
-    """Group EloHistory rows by match_id into a nested dict."""
-    elo_by_match: Dict = {}
-    for elo_row in elo_rows:
-        match_id = elo_row.match_id
-        if match_id not in elo_by_match:
-            elo_by_match[match_id] = {}
-        elo_before = elo_row.elo_after - elo_row.elo_change
-        elo_by_match[match_id][elo_row.player_id] = {
-            "elo_before": round(elo_before, 1),
-            "elo_after": round(elo_row.elo_after, 1),
-            "elo_change": round(elo_row.elo_change, 1),
+def _series_x(dates: Sequence[str]) -> List[float]:
+    """Chart x values for series dates: day ordinals, or positions if a date isn't ISO."""
+    try:
+        return [date.fromisoformat(d).toordinal() for d in dates]
+    except ValueError:
+        return list(range(len(dates)))
+
+
+async def get_elo_series(
+    session: AsyncSession,
+    player_ids: Optional[Sequence[int]] = None,
+    league_id: Optional[int] = None,
+    max_points: Optional[int] = None,
+) -> List[Dict]:
+    """Get per-player ELO timelines as sparse change points.
+
+    Reads the series precomputed by the global stats job (PlayerEloSeries), so
+    the cost grows with each player's own history rather than players x dates.
+
+    Args:
+        session: Database session
+        player_ids: Only include these players
+        league_id: Only include players with stats in this league
+        max_points: Downsample each series to at most this many points
+            (largest-triangle-three-buckets; first and last points are kept)
+
+    Returns:
+        List of {"player_id", "name", "points": [[date, elo], ...]} ordered
+        by name. A player's ELO holds from one point until the next.
+    """
+    query = select(PlayerEloSeries.player_id, Player.full_name, PlayerEloSeries.points).join(
+        Player, Player.id == PlayerEloSeries.player_id
+    )
+    if player_ids is not None:
+        query = query.where(PlayerEloSeries.player_id.in_(player_ids))
+    if league_id is not None:
+        query = query.join(
+            PlayerLeagueStats,
+            and_(
+                PlayerLeagueStats.player_id == PlayerEloSeries.player_id,
+                PlayerLeagueStats.league_id == league_id,
+            ),
+        )
+    result = await session.execute(query.order_by(Player.full_name, PlayerEloSeries.player_id))
+
+    series = []
+    for player_id, name, points in result.all():
+        if max_points is not None and len(points) > max_points:
+            dates = [point[0] for point in points]
+            elos = [point[1] for point in points]
+            points = [points[i] for i in lttb_indices(_series_x(dates), elos, max_points)]
+        series.append(
+            {"player_id": player_id, "name": name or f"Player {player_id}", "points": points}
+        )
+    return series
+
+
+# Per-match rating results, read along with the match (see MatchStats)
+_MATCH_STATS_COLUMNS = (
+    MatchStats.team1_elo_change,
+    MatchStats.team2_elo_change,
+    *(getattr(MatchStats, f"{seat}_elo_after") for seat in MATCH_SEATS),
+    MatchStats.team1_rating_change,
+    MatchStats.team2_rating_change,
+)
+
+
+def _elo_changes(row) -> Dict:
+    """Per-player ELO before/after/change of a match row carrying _MATCH_STATS_COLUMNS."""
+    elo_changes: Dict = {}
+    for seat in MATCH_SEATS:
+        elo_after = getattr(row, f"{seat}_elo_after")
+        if elo_after is None:
+            continue
+        elo_change = getattr(row, f"{seat[:5]}_elo_change")
+        elo_changes[getattr(row, f"{seat}_id")] = {
+            "elo_before": round(elo_after - elo_change, 1),
+            "elo_after": round(elo_after, 1),
+            "elo_change": round(elo_change, 1),
         }
-    return elo_by_match
+    return elo_changes
 
 
-def _match_row_to_elo_dict(row, elo_by_match: Dict) -> Dict:
-    """Convert a match query row to a dict with elo_changes."""
+def _match_row_to_elo_dict(row) -> Dict:
+    """Convert a match query row (with _MATCH_STATS_COLUMNS) to a dict with elo_changes."""
     return {
         "id": row.id,
         "date": row.date,
@@ -346,7 +460,9 @@ def _match_row_to_elo_dict(row, elo_by_match: Dict) -> Dict:
         "winner": row.winner,
         "is_ranked": row.is_ranked,
         "ranked_intent": row.ranked_intent,
-        "elo_changes": elo_by_match.get(row.id, {}),
+        "elo_changes": _elo_changes(row),
+        "team1_rating_change": row.team1_rating_change,
+        "team2_rating_change": row.team2_rating_change,
     }
 
 
@@ -378,8 +494,10 @@ async def get_season_matches_with_elo(session: AsyncSession, season_id: int) ->
             Match.winner,
             Match.is_ranked,
             Match.ranked_intent,
+            *_MATCH_STATS_COLUMNS,
         )
         .select_from(Match)
+        .outerjoin(MatchStats, MatchStats.match_id == Match.id)
         .outerjoin(Session, Match.session_id == Session.id)
         .outerjoin(p1, Match.team1_player1_id == p1.id)
         .outerjoin(p2, Match.team1_player2_id == p2.id)
@@ -390,17 +508,7 @@ async def get_season_matches_with_elo(session: AsyncSession, season_id: int) ->
     )
 
     result = await session.execute(query)
-    match_rows = result.all()
-    match_ids = [row.id for row in match_rows]
-
-    elo_result = await session.execute(
-        select(
-            EloHistory.match_id, EloHistory.player_id, EloHistory.elo_after, EloHistory.elo_change
-        ).where(EloHistory.match_id.in_(match_ids))
-    )
-    elo_by_match = _build_elo_by_match(elo_result.all())
-
-    return [_match_row_to_elo_dict(row, elo_by_match) for row in match_rows]
+    return [_match_row_to_elo_dict(row) for row in result.all()]
 
 
 async def get_league_matches_with_elo(session: AsyncSession, league_id: int) -> List[Dict]:
@@ -431,8 +539,10 @@ async def get_league_matches_with_elo(session: AsyncSession, league_id: int) ->
             Match.winner,
             Match.is_ranked,
             Match.ranked_intent,
+            *_MATCH_STATS_COLUMNS,
         )
         .select_from(Match)
+        .outerjoin(MatchStats, MatchStats.match_id == Match.id)
         .outerjoin(Session, Match.session_id == Session.id)
         .outerjoin(Season, Session.season_id == Season.id)
         .outerjoin(p1, Match.team1_player1_id == p1.id)
@@ -444,17 +554,19 @@ async def get_league_matches_with_elo(session: AsyncSession, league_id: int) ->
     )
 
     result = await session.execute(query)
-    match_rows = result.all()
-    match_ids = [row.id for row in match_rows]
+    return [_match_row_to_elo_dict(row) for row in result.all()]
 
-    elo_result = await session.execute(
-        select(
-            EloHistory.match_id, EloHistory.player_id, EloHistory.elo_after, EloHistory.elo_change
-        ).where(EloHistory.match_id.in_(match_ids))
-    )
-    elo_by_match = _build_elo_by_match(elo_result.all())
 
-    return [_match_row_to_elo_dict(row, elo_by_match) for row in match_rows]
+def _match_query_paging(body: Dict) -> Tuple[int, str, str]:
+    """Normalized (limit, sort_by, sort_dir) of a query_matches body."""
+    limit = min(max(int(body.get("limit", 50)), 1), 500)
+    sort_by = body.get("sort_by", "id")
+    sort_dir = body.get("sort_dir", "desc")
+    if sort_by not in ["id", "date"]:
+        sort_by = "id"
+    if sort_dir not in ["asc", "desc"]:
+        sort_dir = "desc"
+    return limit, sort_by, sort_dir
 
 
 async def query_matches(
@@ -463,28 +575,28 @@ async def query_matches(
     """
     Query matches with filtering.
 
+    Pages either by offset or, when body has a cursor (from
+    query_matches_next_cursor), by keyset on the sort key and match id.
+
     Args:
         session: Database session
-        body: Query parameters dict with limit, offset, league_id, season_id,
-              submitted_only, include_non_public, sort_by, sort_dir.
+        body: Query parameters dict with limit, offset, cursor, league_id,
+              season_id, submitted_only, include_non_public, sort_by, sort_dir.
         user: Optional user dict (reserved for future permission checks).
 
     Returns:
         List of match dicts.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
-    limit = min(max(int(body.get("limit", 50)), 1), 500)
+    limit, sort_by, sort_dir = _match_query_paging(body)
     offset = max(int(body.get("offset", 0)), 0)
+    cursor = body.get("cursor")
     submitted_only = body.get("submitted_only", True)
     include_non_public = body.get("include_non_public", False)
     league_id = body.get("league_id")
     season_id = body.get("season_id")
-    sort_by = body.get("sort_by", "id")
-    sort_dir = body.get("sort_dir", "desc")
-
-    if sort_by not in ["id", "date"]:
-        sort_by = "id"
-    if sort_dir not in ["asc", "desc"]:
-        sort_dir = "desc"
 
     p1 = aliased(Player)
     p2 = aliased(Player)
@@ -514,10 +626,13 @@ async def query_matches(
             Match.team2_score,
             Match.winner,
             Match.is_public,
-            cast(0, Integer).label("team1_elo_change"),
-            cast(0, Integer).label("team2_elo_change"),
+            func.coalesce(MatchStats.team1_elo_change, 0).label("team1_elo_change"),
+            func.coalesce(MatchStats.team2_elo_change, 0).label("team2_elo_change"),
+            MatchStats.team1_rating_change,
+            MatchStats.team2_rating_change,
         )
         .select_from(Match)
+        .outerjoin(MatchStats, MatchStats.match_id == Match.id)
         .outerjoin(Session, Match.session_id == Session.id)
         .outerjoin(Season, Session.season_id == Season.id)
         .outerjoin(p1, Match.team1_player1_id == p1.id)
@@ -542,16 +657,24 @@ async def query_matches(
         conditions.append(and_(Session.season_id.isnot(None), Season.league_id == int(league_id)))
     if season_id is not None:
         conditions.append(Session.season_id == int(season_id))
+    # Sort key, made total by the match id (matches without a session sort
+    # as an empty date)
+    if sort_by == "date":
+        sort_key = [func.coalesce(Session.date, ""), Match.id]
+        parsers = (str, int)
+    else:
+        sort_key = [Match.id]
+        parsers = (int,)
+    descending = sort_dir == "desc"
+    if cursor:
+        conditions.append(after_cursor(sort_key, decode_cursor(cursor, *parsers), descending))
     if conditions:
         query = query.where(and_(*conditions))
 
-    order_column = Session.date if sort_by == "date" else Match.id
-    if sort_dir.lower() == "asc":
-        query = query.order_by(order_column.asc())
-    else:
-        query = query.order_by(order_column.desc())
-
-    query = query.limit(limit).offset(offset)
+    query = query.order_by(*(col.desc() if descending else col.asc() for col in sort_key))
+    query = query.limit(limit)
+    if not cursor:
+        query = query.offset(offset)
     result = await session.execute(query)
     rows = result.all()
 
@@ -582,11 +705,28 @@ async def query_matches(
             "is_public": row.is_public,
             "team1_elo_change": row.team1_elo_change,
             "team2_elo_change": row.team2_elo_change,
+            "team1_rating_change": row.team1_rating_change,
+            "team2_rating_change": row.team2_rating_change,
         }
         for row in rows
     ]
 
 
+def query_matches_next_cursor(body: Dict, matches: List[Dict]) -> Optional[str]:
+    """
+    Cursor for the page after matches, a page returned by query_matches(body).
+
+    Returns None when the page was not full, i.e. there is nothing after it.
+    """
+    limit, sort_by, _ = _match_query_paging(body)
+    if not matches or len(matches) < limit:
+        return None
+    last = matches[-1]
+    if sort_by == "date":
+        return encode_cursor(last["date"] or "", last["id"])
+    return encode_cursor(last["id"])
+
+
 # ---------------------------------------------------------------------------
 # Player stats reads
 # ---------------------------------------------------------------------------
@@ -1055,17 +1195,54 @@ async def get_all_player_league_partnership_opponent_stats(
 # ---------------------------------------------------------------------------
 
 
-async def export_matches_to_csv(session: AsyncSession) -> str:
+async def iter_matches_csv(
+    session: AsyncSession,
+    league_id: Optional[int] = None,
+    season_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> AsyncIterator[str]:
     """
-    Export all matches (locked-in sessions only) to CSV format.
+    Export matches (locked-in sessions only) as CSV text chunks.
+
+    Rows come from a server-side cursor, MATCH_EXPORT_CHUNK_SIZE at a time, and
+    each batch is encoded and yielded as it arrives, so memory stays flat
+    however many matches there are. The query is started before the header
+    chunk is yielded, so query errors surface on the first chunk.
 
     Format: DATE, T1P1, T1P2, T2P1, T2P2, T1SCORE, T2SCORE
+
+    Args:
+        session: Database session
+        league_id: Only matches from this league's seasons
+        season_id: Only matches from this season
+        date_from: Only matches on or after this session date
+        date_to: Only matches on or before this session date
+
+    Yields:
+        CSV text, the header row first
     """
     p1 = aliased(Player)
     p2 = aliased(Player)
     p3 = aliased(Player)
     p4 = aliased(Player)
 
+    conditions = [
+        or_(
+            Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
+            Match.session_id.is_(None),
+        )
+    ]
+    if league_id is not None:
+        conditions.append(Season.league_id == league_id)
+    if season_id is not None:
+        conditions.append(Session.season_id == season_id)
+    # Session dates are ISO strings, which compare in date order
+    if date_from is not None:
+        conditions.append(Session.date >= date_from.isoformat())
+    if date_to is not None:
+        conditions.append(Session.date <= date_to.isoformat())
+
     query = (
         select(
             Session.date.label("date"),
@@ -1078,39 +1255,44 @@ async def export_matches_to_csv(session: AsyncSession) -> str:
         )
         .select_from(Match)
         .outerjoin(Session, Match.session_id == Session.id)
+        .outerjoin(Season, Session.season_id == Season.id)
         .outerjoin(p1, Match.team1_player1_id == p1.id)
         .outerjoin(p2, Match.team1_player2_id == p2.id)
         .outerjoin(p3, Match.team2_player1_id == p3.id)
         .outerjoin(p4, Match.team2_player2_id == p4.id)
-        .where(
-            or_(
-                Session.status.in_([SessionStatus.SUBMITTED, SessionStatus.EDITED]),
-                Match.session_id.is_(None),
-            )
-        )
+        .where(and_(*conditions))
         .order_by(Match.id.asc())
+        .execution_options(yield_per=MATCH_EXPORT_CHUNK_SIZE)
     )
 
-    result = await session.execute(query)
-    matches = result.all()
-
     output = io.StringIO()
     writer = csv.writer(output)
-    writer.writerow(["Date", "Team 1", "", "Team 2", "", "Team 1 Score", "Team 2 Score"])
-    for match in matches:
-        writer.writerow(
-            [
-                match.date,
-                match.team1_player1_name,
-                match.team1_player2_name,
-                match.team2_player1_name,
-                match.team2_player2_name,
-                match.team1_score,
-                match.team2_score,
-            ]
-        )
 
-    return output.getvalue()
+    def take() -> str:
+        text = output.getvalue()
+        output.seek(0)
+        output.truncate()
+        return text
+
+    result = await session.stream(query)
+    try:
+        writer.writerow(["Date", "Team 1", "", "Team 2", "", "Team 1 Score", "Team 2 Score"])
+        yield take()
+        async for rows in result.partitions(MATCH_EXPORT_CHUNK_SIZE):
+            writer.writerows(rows)
+            yield take()
+    finally:
+        await result.close()
+
+
+async def export_matches_to_csv(session: AsyncSession, **filters) -> str:
+    """
+    Export matches (locked-in sessions only) to one CSV string.
+
+    Accepts the filters of iter_matches_csv; prefer streaming that for large
+    exports.
+    """
+    return "".join([chunk async for chunk in iter_matches_csv(session, **filters)])
 
 
 async def get_player_match_history_by_id(
@@ -1129,7 +1311,6 @@ async def get_player_match_history_by_id(
     p2 = aliased(Player)
     p3 = aliased(Player)
     p4 = aliased(Player)
-    eh = aliased(EloHistory)
 
     query = (
         select(
@@ -1143,8 +1324,8 @@ async def get_player_match_history_by_id(
             Match.team1_score,
             Match.team2_score,
             Match.winner,
-            cast(0, Integer).label("team1_elo_change"),
-            cast(0, Integer).label("team2_elo_change"),
+            MatchParticipant.team,
+            *_MATCH_STATS_COLUMNS,
             p1.full_name.label("team1_player1_name"),
             p2.full_name.label("team1_player2_name"),
             p3.full_name.label("team2_player1_name"),
@@ -1153,7 +1334,6 @@ async def get_player_match_history_by_id(
             p2.is_placeholder.label("t1p2_is_placeholder"),
             p3.is_placeholder.label("t2p1_is_placeholder"),
             p4.is_placeholder.label("t2p2_is_placeholder"),
-            eh.elo_after,
             Match.is_ranked,
             Match.ranked_intent,
             Session.status.label("session_status"),
@@ -1165,25 +1345,19 @@ async def get_player_match_history_by_id(
             Season.name.label("season_name"),
             Court.name.label("court_name"),
         )
-        .select_from(Match)
+        .select_from(MatchParticipant)
+        .join(Match, Match.id == MatchParticipant.match_id)
         .outerjoin(p1, Match.team1_player1_id == p1.id)
         .outerjoin(p2, Match.team1_player2_id == p2.id)
         .outerjoin(p3, Match.team2_player1_id == p3.id)
         .outerjoin(p4, Match.team2_player2_id == p4.id)
-        .outerjoin(eh, and_(eh.match_id == Match.id, eh.player_id == player_id))
+        .outerjoin(MatchStats, MatchStats.match_id == Match.id)
         .outerjoin(Session, Match.session_id == Session.id)
         .outerjoin(Season, Session.season_id == Season.id)
         .outerjoin(League, Season.league_id == League.id)
         .outerjoin(Court, Session.court_id == Court.id)
-        .where(
-            or_(
-                Match.team1_player1_id == player_id,
-                Match.team1_player2_id == player_id,
-                Match.team2_player1_id == player_id,
-                Match.team2_player2_id == player_id,
-            )
-        )
-        .order_by(Match.id.desc())
+        .where(MatchParticipant.player_id == player_id)
+        .order_by(MatchParticipant.match_id.desc())
     )
 
     result = await session.execute(query)
@@ -1191,7 +1365,7 @@ async def get_player_match_history_by_id(
 
     results = []
     for row in rows:
-        if row.team1_player1_id == player_id or row.team1_player2_id == player_id:
+        if row.team == 1:
             if row.team1_player1_id == player_id:
                 partner = row.team1_player2_name
                 partner_id = row.team1_player2_id
@@ -1240,6 +1414,9 @@ async def get_player_match_history_by_id(
             else:
                 match_result = "L"
 
+        seat = next(seat for seat in MATCH_SEATS if getattr(row, f"{seat}_id") == player_id)
+        elo_after = getattr(row, f"{seat}_elo_after")
+
         session_status_value = None
         if row.session_status:
             if hasattr(row.session_status, "value"):
@@ -1262,7 +1439,7 @@ async def get_player_match_history_by_id(
                 "result": match_result,
                 "score": f"{player_score}-{opponent_score}",
                 "elo_change": elo_change,
-                "elo_after": row.elo_after,
+                "elo_after": elo_after,
                 "session_status": session_status_value,
                 "session_id": row.session_id,
                 "session_name": row.session_name,
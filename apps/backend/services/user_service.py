@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from backend.utils.datetime_utils import utcnow
+from backend.services import stats_cache
 from sqlalchemy import select, update, delete, func
 from backend.database.models import (
     User,
@@ -23,6 +24,8 @@ from backend.database.models import (
     LeagueRequest,
     PlayerSeasonStats,
     PlayerLeagueStats,
+    SeasonLeaderboardEntry,
+    LeagueLeaderboardEntry,
     PlayerGlobalStats,
     PartnershipStats,
     PartnershipStatsSeason,
@@ -31,6 +34,7 @@ from backend.database.models import (
     OpponentStatsSeason,
     OpponentStatsLeague,
     EloHistory,
+    PlayerEloSeries,
     SeasonRatingHistory,
     SignupPlayer,
     SignupEvent,
@@ -774,6 +778,15 @@ async def _delete_s3_objects(player: Player, player_id: int, session: AsyncSessi
 
 async def _delete_player_stats(session: AsyncSession, player_id: int) -> None:
     """Delete all stats rows for a player."""
+    league_ids = await session.execute(
+        select(PlayerLeagueStats.league_id).where(PlayerLeagueStats.player_id == player_id)
+    )
+    await stats_cache.bump_generation(
+        session,
+        stats_cache.GLOBAL_SCOPE,
+        stats_cache.PLAYERS_SCOPE,
+        *(stats_cache.league_scope(league_id) for league_id in league_ids.scalars()),
+    )
     await session.execute(
         delete(PartnershipStats).where(
             (PartnershipStats.player_id == player_id) | (PartnershipStats.partner_id == player_id)
@@ -814,10 +827,17 @@ async def _delete_player_stats(session: AsyncSession, player_id: int) -> None:
     await session.execute(
         delete(PlayerLeagueStats).where(PlayerLeagueStats.player_id == player_id)
     )
+    await session.execute(
+        delete(SeasonLeaderboardEntry).where(SeasonLeaderboardEntry.player_id == player_id)
+    )
+    await session.execute(
+        delete(LeagueLeaderboardEntry).where(LeagueLeaderboardEntry.player_id == player_id)
+    )
     await session.execute(
         delete(PlayerGlobalStats).where(PlayerGlobalStats.player_id == player_id)
     )
     await session.execute(delete(EloHistory).where(EloHistory.player_id == player_id))
+    await session.execute(delete(PlayerEloSeries).where(PlayerEloSeries.player_id == player_id))
     await session.execute(
         delete(SeasonRatingHistory).where(SeasonRatingHistory.player_id == player_id)
     )
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import NullPool
 from sqlalchemy import text
 from backend.database.db import Base
+from backend.services import ratings_snapshot, stats_cache
 
 
 def _resolve_test_database_url() -> str:
@@ -294,6 +295,10 @@ async def db_session(test_engine):
         # but connection cleanup errors shouldn't prevent tests from running
         pass
 
+    # Ids are reused after RESTART IDENTITY; drop what was cached about the old rows
+    stats_cache.reset()
+    ratings_snapshot.reset()
+
     # Yield session for test
     async with async_session_maker() as session:
         try:
@@ -9,6 +9,7 @@ import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
 from backend.utils.datetime_utils import utcnow
+from backend.utils.pagination import InvalidCursorError
 from backend.api.main import app
 from backend.api import auth_dependencies
 from backend.database.db import get_db_session
@@ -949,6 +950,30 @@ class TestMatchEndpoints:
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
+    def test_query_matches_next_cursor_header(self, monkeypatch):
+        """A full page carries X-Next-Cursor; a bad cursor is a 400."""
+        client = TestClient(app)
+        captured = {}
+
+        async def fake_query_matches(session, body, user=None):
+            captured["cursor"] = body["cursor"]
+            if body["cursor"] == "bad":
+                raise InvalidCursorError("Invalid cursor")
+            return [{"id": 9}, {"id": 8}]
+
+        monkeypatch.setattr(data_service, "query_matches", fake_query_matches, raising=True)
+
+        response = client.post("/api/matches/search", json={"limit": 2})
+        assert response.status_code == 200
+        next_cursor = response.headers["X-Next-Cursor"]
+
+        response = client.post("/api/matches/search", json={"limit": 3, "cursor": next_cursor})
+        assert captured["cursor"] == next_cursor
+        assert "X-Next-Cursor" not in response.headers
+
+        response = client.post("/api/matches/search", json={"cursor": "bad"})
+        assert response.status_code == 400
+
     def test_get_elo_timeline(self, monkeypatch):
         """Test getting ELO timeline."""
         client = TestClient(app)
@@ -965,6 +990,24 @@ class TestMatchEndpoints:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
+    def test_get_elo_series(self, monkeypatch):
+        """Test getting sparse per-player ELO series with filters."""
+        client = TestClient(app)
+        calls = []
+
+        async def fake_get_elo_series(session, player_ids=None, league_id=None, max_points=None):
+            calls.append((player_ids, league_id, max_points))
+            return [{"player_id": 1, "name": "Player 1", "points": [["2024-01-01", 1216.0]]}]
+
+        monkeypatch.setattr(data_service, "get_elo_series", fake_get_elo_series, raising=True)
+
+        response = client.get("/api/elo-timeline/series?player_ids=1&player_ids=2&max_points=50")
+        assert response.status_code == 200
+        assert response.json()[0]["points"] == [["2024-01-01", 1216.0]]
+        assert calls == [([1, 2], None, 50)]
+
+        assert client.get("/api/elo-timeline/series?max_points=1").status_code == 422
+
 
 # ============================================================================
 # Rankings and Stats Endpoints Tests
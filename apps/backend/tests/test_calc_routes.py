@@ -1,13 +1,13 @@
 """Route-layer tests for calc.py endpoints.
 
-Covers: loadsheets 501, calculate-stats status, job status.
+Covers: loadsheets 501, calculate-stats rebuild, status, job status.
 POST /api/calculate and GET /api/health already tested in test_api_routes_comprehensive.py.
 """
 
 from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from backend.api.main import app
-from backend.services import auth_service, user_service
+from backend.services import auth_service, data_service, user_service
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +59,44 @@ class TestLoadSheets:
         assert response.status_code in (401, 403)
 
 
+# ============================================================================
+# POST /api/calculate-stats/rebuild
+# ============================================================================
+
+
+class TestRebuildGlobalStats:
+    """Tests for the admin-only global stats rebuild endpoint."""
+
+    @staticmethod
+    def _set_admin_phones(monkeypatch, phones):
+        async def fake_get_setting(session, key):
+            return phones if key == "system_admin_phone_numbers" else None
+
+        monkeypatch.setattr(data_service, "get_setting", fake_get_setting, raising=True)
+
+    def test_rebuild_queues_full_rebuild_job(self, monkeypatch):
+        """System admins queue a global_rebuild job."""
+        mock_queue = MagicMock()
+        mock_queue.enqueue_calculation = AsyncMock(return_value=7)
+        monkeypatch.setattr("backend.api.routes.calc.get_stats_queue", lambda: mock_queue)
+
+        client, headers = _make_authed_client(monkeypatch)
+        self._set_admin_phones(monkeypatch, "+10000000000")
+
+        response = client.post("/api/calculate-stats/rebuild", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["job_id"] == 7
+        assert mock_queue.enqueue_calculation.await_args.args[1] == "global_rebuild"
+
+    def test_rebuild_non_admin_returns_403(self, monkeypatch):
+        """Non-admins cannot force a full rebuild."""
+        client, headers = _make_authed_client(monkeypatch)
+        self._set_admin_phones(monkeypatch, "+19999999999")
+
+        response = client.post("/api/calculate-stats/rebuild", headers=headers)
+        assert response.status_code == 403
+
+
 # ============================================================================
 # GET /api/calculate-stats/status
 # ============================================================================
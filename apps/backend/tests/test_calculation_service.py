@@ -2,6 +2,10 @@
 Tests for the calculation service - ELO calculations and statistics.
 """
 
+import json
+
+import pytest
+
 from backend.services import calculation_service
 from backend.utils.constants import INITIAL_ELO, K, USE_POINT_DIFFERENTIAL
 
@@ -634,3 +638,198 @@ def test_stats_tracker_non_member_initial_rating():
     assert (
         non_member.season_rating == INITIAL_ELO
     )  # 1200 — the bug we're fixing in stats_calc_data
+
+
+def test_stats_tracker_state_round_trip_resumes_replay():
+    """Replaying from a restored state matches replaying everything at once."""
+    first = [
+        create_mock_match([1, 2], [3, 4], 21, 19, match_id=1),
+        create_mock_match([1, 3], [2, 4], 15, 21, match_id=2),
+    ]
+    later = [
+        create_mock_match([1, 4], [2, 3], 21, 10, match_id=3),
+        create_mock_match([1, 2], [3, 4], 18, 21, match_id=4),
+    ]
+
+    full = calculation_service.replay_matches(first + later)
+
+    partial = calculation_service.replay_matches(first)
+    state = json.loads(json.dumps(partial.to_state()))  # must survive a JSON round trip
+    resumed = calculation_service.StatsTracker.from_state(state)
+    calculation_service.replay_matches(later, tracker=resumed)
+
+    assert resumed.players.keys() == full.players.keys()
+    for pid, expected in full.players.items():
+        actual = resumed.players[pid]
+        assert actual.elo == expected.elo
+        assert actual.game_count == expected.game_count
+        assert actual.win_count == expected.win_count
+        assert actual.total_point_diff == expected.total_point_diff
+        assert actual.games_with == expected.games_with
+        assert actual.wins_with == expected.wins_with
+        assert actual.point_diff_against == expected.point_diff_against
+        # Only the resumed matches produce new history entries
+        assert [h[0] for h in actual.match_elo_history] == [3, 4]
+
+
+def test_stats_tracker_from_state_rejects_unknown_version():
+    """from_state refuses payloads from an unsupported serializer version."""
+    with pytest.raises(ValueError):
+        calculation_service.StatsTracker.from_state({"v": 999, "players": []})
+
+
+def test_tracker_from_state_rejects_other_rating_params(monkeypatch):
+    """A state computed with different K/initial ELO must not be resumed."""
+    state = calculation_service.replay_matches(
+        [create_mock_match([1, 2], [3, 4], 21, 19, match_id=1)]
+    ).to_state()
+    monkeypatch.setattr(calculation_service, "K", 32)
+
+    for tracker_cls in (calculation_service.StatsTracker, calculation_service.CompactStatsTracker):
+        with pytest.raises(ValueError):
+            tracker_cls.from_state(state)
+        with pytest.raises(ValueError):
+            tracker_cls.from_state({"v": calculation_service.STATE_VERSION, "players": []})
+
+
+def test_iter_replay_checkpoints_aligned_to_match_count():
+    """Checkpoints land on absolute match-count multiples and resume like a full replay."""
+    matches = [
+        create_mock_match([1, 2], [3, 4], 21, 19, match_id=10),
+        create_mock_match([1, 3], [2, 4], 15, 21, match_id=11),
+        create_mock_match([1, 4], [2, 3], 21, 10, match_id=12),
+        create_mock_match([1, 2], [3, 4], 18, 21, match_id=13),
+        create_mock_match([2, 3], [1, 4], 21, 16, match_id=14),
+    ]
+
+    full = calculation_service.StatsTracker()
+    checkpoints = list(calculation_service.iter_replay_checkpoints(matches, full, 2))
+    assert [(match_id, count) for match_id, count, _ in checkpoints] == [(11, 2), (13, 4)]
+
+    # Resume from the first checkpoint and replay only the remaining matches
+    resumed = calculation_service.StatsTracker.from_state(checkpoints[0][2])
+    later = list(calculation_service.iter_replay_checkpoints(matches[2:], resumed, 2, 2))
+    assert [(match_id, count) for match_id, count, _ in later] == [(13, 4)]
+    assert later[0][2] == checkpoints[1][2]
+    assert resumed.to_state() == full.to_state()
+
+
+def test_iter_replay_checkpoints_only_snapshots_retained_counts():
+    """Non-retained boundaries are replayed through without taking a snapshot."""
+    matches = [create_mock_match([1, 2], [3, 4], 21, 19, match_id=i) for i in range(1, 7)]
+    tracker = calculation_service.StatsTracker()
+    checkpoints = calculation_service.iter_replay_checkpoints(
+        matches, tracker, 1, retained_counts={2, 5}
+    )
+    assert [(match_id, count) for match_id, count, _ in checkpoints] == [(2, 2), (5, 5)]
+    assert tracker.players[1].game_count == 6
+
+
+def test_retained_checkpoint_counts_keeps_recent_and_log_spaced():
+    """Retention keeps the latest few checkpoints plus powers-of-two-spaced older ones."""
+    assert calculation_service.retained_checkpoint_counts(0, 10, 2) == set()
+    assert calculation_service.retained_checkpoint_counts(25, 10, 4) == {10, 20}
+    # Checkpoint numbers 1..13 with keep_recent=2: 12, 13 plus 13, 12, 12, 8
+    assert calculation_service.retained_checkpoint_counts(139, 10, 2) == {80, 120, 130}
+
+    # Once dropped, a checkpoint never becomes retained again, so pruning is safe
+    dropped = set()
+    for total in range(1, 300):
+        retained = calculation_service.retained_checkpoint_counts(total, 1, 3)
+        assert not retained & dropped
+        assert len(retained) <= 3 + total.bit_length()
+        previous = calculation_service.retained_checkpoint_counts(total - 1, 1, 3)
+        dropped |= previous - retained
+
+
+def test_replay_league_matches_updates_league_and_season_scopes():
+    """One pass feeds every match to the league tracker and only its own season's tracker."""
+    matches = [
+        create_mock_match([1, 2], [3, 4], 21, 19, match_id=1),
+        create_mock_match([1, 3], [2, 4], 15, 21, match_id=2),
+        create_mock_match([1, 4], [2, 3], 21, 10, match_id=3),
+    ]
+    for match, session_id in zip(matches, [100, 200, None]):
+        match.session_id = session_id
+
+    league = calculation_service.StatsTracker()
+    season_a = calculation_service.StatsTracker(
+        initial_ratings={pid: 100.0 for pid in (1, 2, 3, 4)},
+        scoring_config={"type": "season_rating"},
+    )
+    season_b = calculation_service.StatsTracker()
+    calculation_service.replay_league_matches(
+        matches, league, {10: season_a, 20: season_b}, {100: 10, 200: 20}
+    )
+
+    assert league.players[1].game_count == 3
+    assert season_a.players[1].game_count == 1
+    assert season_b.players[1].game_count == 1
+    # Season ratings still move; global ELO is not computed for league/season scopes
+    assert season_a.players[1].season_rating > 100.0
+    assert league.players[1].elo == INITIAL_ELO
+    assert league.players[1].match_elo_history == []
+
+
+def test_compact_stats_tracker_matches_stats_tracker():
+    """The array-backed tracker produces the same rows, views and state as StatsTracker."""
+    matches = [
+        create_mock_match([1, 2], [3, 4], 21, 19, match_id=1),
+        create_mock_match([1, 3], [2, 4], 15, 21, match_id=2),
+        create_mock_match([1, 4], [2, 3], 20, 20, match_id=3),
+        create_mock_match([5, 2], [3, 1], 21, 10, match_id=4),
+    ]
+    matches[1].is_ranked = False
+    config = {"type": "season_rating"}
+    ratings = {pid: 100.0 for pid in (1, 2, 3, 4)}
+
+    dicts = calculation_service.replay_matches(
+        matches,
+        tracker=calculation_service.StatsTracker(initial_ratings=ratings, scoring_config=config),
+    )
+    compact = calculation_service.replay_matches(
+        matches,
+        tracker=calculation_service.CompactStatsTracker(
+            initial_ratings=ratings, scoring_config=config
+        ),
+    )
+
+    assert compact.to_state() == dicts.to_state()
+    assert sorted(compact.iter_partner_totals()) == sorted(dicts.iter_partner_totals())
+    assert sorted(compact.iter_opponent_totals({1})) == sorted(dicts.iter_opponent_totals({1}))
+    assert sorted(compact.iter_elo_history()) == sorted(dicts.iter_elo_history())
+    assert sorted(compact.iter_season_rating_history()) == sorted(
+        dicts.iter_season_rating_history()
+    )
+
+    assert compact.players.keys() == dicts.players.keys()
+    for pid, expected in dicts.players.items():
+        actual = compact.players[pid]
+        assert actual.elo == expected.elo
+        assert actual.season_rating == expected.season_rating
+        assert actual.points == expected.points
+        assert actual.win_rate == expected.win_rate
+        assert actual.wins_with == expected.wins_with
+        assert actual.point_diff_against == expected.point_diff_against
+        assert actual.match_elo_history == expected.match_elo_history
+
+
+def test_compact_stats_tracker_resumes_from_stats_tracker_state():
+    """Both trackers share the to_state() layout, so persisted states are interchangeable."""
+    matches = [
+        create_mock_match([1, 2], [3, 4], 21, 19, match_id=1),
+        create_mock_match([1, 3], [2, 4], 15, 21, match_id=2),
+        create_mock_match([1, 4], [2, 3], 21, 10, match_id=3),
+    ]
+    full = calculation_service.replay_matches(matches)
+
+    partial = calculation_service.replay_matches(matches[:2])
+    state = json.loads(json.dumps(partial.to_state()))
+    resumed = calculation_service.CompactStatsTracker.from_state(state)
+    calculation_service.replay_matches(matches[2:], tracker=resumed)
+
+    assert resumed.to_state() == full.to_state()
+    assert [h[0] for h in resumed.players[1].match_elo_history] == [3]
+
+    with pytest.raises(ValueError):
+        calculation_service.CompactStatsTracker.from_state({"v": 999, "players": []})
@@ -182,6 +182,30 @@ async def test_get_thread_pagination(db_session, friends):
     assert result2["has_more"] is False
 
 
+@pytest.mark.asyncio
+async def test_get_thread_cursor_pagination(db_session, friends):
+    """get_thread pages by next_cursor, newest first, without gaps or repeats."""
+    alice = friends["alice"]["player_id"]
+    bob = friends["bob"]["player_id"]
+
+    for i in range(5):
+        await direct_message_service.send_message(db_session, alice, bob, f"Msg {i}")
+
+    texts = []
+    cursor = None
+    while True:
+        page = await direct_message_service.get_thread(
+            db_session, alice, bob, limit=2, cursor=cursor
+        )
+        texts += [m["message_text"] for m in page["items"]]
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            break
+        cursor = page["next_cursor"]
+
+    assert texts == [f"Msg {i}" for i in range(4, -1, -1)]
+
+
 # ──────────────────────────────────────────────────────────────
 # mark_thread_read
 # ──────────────────────────────────────────────────────────────
@@ -281,3 +305,25 @@ async def test_get_conversations_shows_unread_count(db_session, friends):
 
     result = await direct_message_service.get_conversations(db_session, alice)
     assert result["items"][0]["unread_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_conversations_cursor_pagination(db_session, friends):
+    """get_conversations pages by next_cursor, most recent conversation first."""
+    alice = friends["alice"]["player_id"]
+    bob = friends["bob"]["player_id"]
+    carol = friends["carol"]["player_id"]
+    await _make_friends(db_session, alice, carol)
+
+    await direct_message_service.send_message(db_session, alice, bob, "Hi Bob")
+    await direct_message_service.send_message(db_session, alice, carol, "Hi Carol")
+
+    first = await direct_message_service.get_conversations(db_session, alice, limit=1)
+    assert [c["player_id"] for c in first["items"]] == [carol]
+    assert first["total_count"] == 2
+
+    second = await direct_message_service.get_conversations(
+        db_session, alice, limit=1, cursor=first["next_cursor"]
+    )
+    assert [c["player_id"] for c in second["items"]] == [bob]
+    assert second["next_cursor"] is None
@@ -0,0 +1,131 @@
+"""
+Tests for the vectorized ELO backtest (elo_backtest).
+"""
+
+import math
+import random
+
+import pytest
+
+from backend.services import calculation_service
+from backend.services.calculation_service import ReplayMatch, ReplaySession, StatsTracker
+from backend.services.elo_backtest import (
+    EloConfig,
+    backtest_elo,
+    elo_config_grid,
+    encode_matches,
+)
+
+
+def _matches(count, seed=7):
+    """Random doubles matches among eight players, with some ties and unranked games."""
+    rng = random.Random(seed)
+    matches = []
+    for i in range(count):
+        p = rng.sample(range(101, 109), 4)
+        team1 = 21 if rng.random() < 0.55 else rng.randint(10, 19)
+        team2 = 21 if team1 != 21 else rng.randint(10, 19)
+        if i % 11 == 5:
+            team2 = team1
+        matches.append(
+            ReplayMatch(
+                id=i + 1,
+                player_ids=((p[0], p[1]), (p[2], p[3])),
+                team1_score=team1,
+                team2_score=team2,
+                is_ranked=i % 9 != 4,
+                session_id=1,
+                session=ReplaySession("2024-01-01"),
+            )
+        )
+    return matches
+
+
+def _tracker_predictions(matches, monkeypatch, k, use_point_differential):
+    """Team 1 win probabilities StatsTracker implies before each ranked match."""
+    monkeypatch.setattr(calculation_service, "K", k)
+    monkeypatch.setattr(calculation_service, "USE_POINT_DIFFERENTIAL", use_point_differential)
+    tracker = StatsTracker()
+    predictions = []
+    for match in matches:
+        if match.is_ranked:
+            team1, team2 = (
+                sum(tracker.get_player(pid).elo for pid in team) / 2 for team in match.player_ids
+            )
+            predictions.append(calculation_service.expected_score(team1, team2))
+        tracker.process_match(match, skip_global_elo=not match.is_ranked)
+    return predictions
+
+
+def _metrics(predictions, outcomes):
+    log_loss = -sum(
+        y * math.log(p) + (1 - y) * math.log(1 - p) for p, y in zip(predictions, outcomes)
+    ) / len(predictions)
+    brier = sum((p - y) ** 2 for p, y in zip(predictions, outcomes)) / len(predictions)
+    return log_loss, brier
+
+
+def test_encode_matches_drops_unranked_and_scores_outcomes():
+    matches = _matches(30)
+    encoded = encode_matches(matches)
+
+    ranked = [m for m in matches if m.is_ranked]
+    assert encoded.match_ids.tolist() == [m.id for m in ranked]
+    assert encoded.seats.shape == (len(ranked), 4)
+    for match, seats, outcome in zip(ranked, encoded.seats, encoded.outcome):
+        (p1, p2), (p3, p4) = match.player_ids
+        assert encoded.player_ids[seats].tolist() == [p1, p2, p3, p4]
+        winner = calculation_service.calculate_winner(match.team1_score, match.team2_score)
+        assert outcome == {1: 1.0, 2: 0.0, -1: 0.5}[winner]
+
+
+@pytest.mark.parametrize("k,use_point_differential", [(40, False), (24, True)])
+def test_backtest_matches_stats_tracker(monkeypatch, k, use_point_differential):
+    matches = _matches(120)
+    expected = _tracker_predictions(matches, monkeypatch, k, use_point_differential)
+    outcomes = encode_matches(matches).outcome.tolist()
+
+    (result,) = backtest_elo(encode_matches(matches), [EloConfig(k, use_point_differential)])
+
+    log_loss, brier = _metrics(expected, outcomes)
+    assert result["matches"] == len(expected)
+    assert result["log_loss"] == pytest.approx(log_loss)
+    assert result["brier"] == pytest.approx(brier)
+    decisive = [(p, y) for p, y in zip(expected, outcomes) if y != 0.5]
+    assert result["accuracy"] == pytest.approx(
+        sum((p > 0.5) == (y == 1.0) for p, y in decisive) / len(decisive)
+    )
+
+
+def test_configs_are_independent_and_blocking_does_not_change_results(monkeypatch):
+    encoded = encode_matches(_matches(200))
+    configs = elo_config_grid([8, 32, 64])
+
+    together = backtest_elo(encoded, configs, warmup=15)
+    monkeypatch.setattr("backend.services.elo_backtest.BACKTEST_BLOCK_SIZE", 7)
+    separately = [backtest_elo(encoded, [config], warmup=15)[0] for config in configs]
+
+    assert len(together) == 6
+    for joint, alone in zip(together, separately):
+        assert joint["k"] == alone["k"]
+        assert joint["use_point_differential"] == alone["use_point_differential"]
+        for metric in ("log_loss", "brier", "accuracy", "calibration_error"):
+            assert joint[metric] == pytest.approx(alone[metric])
+        assert len(joint["calibration"]) == len(alone["calibration"])
+        for joint_bin, alone_bin in zip(joint["calibration"], alone["calibration"]):
+            assert joint_bin == pytest.approx(alone_bin)
+
+
+def test_warmup_and_calibration_bins():
+    encoded = encode_matches(_matches(100))
+    (result,) = backtest_elo(encoded, [EloConfig(40, False)], warmup=20, calibration_bins=5)
+
+    assert result["matches"] == len(encoded.match_ids) - 20
+    assert sum(b["count"] for b in result["calibration"]) == result["matches"]
+    assert all(0 <= b["predicted"] <= 1 for b in result["calibration"])
+
+    # Warmup longer than the history scores nothing
+    (empty,) = backtest_elo(encoded, [EloConfig(40, False)], warmup=1000)
+    assert empty["matches"] == 0
+    assert empty["log_loss"] is None
+    assert empty["calibration"] == []
@@ -10,6 +10,7 @@ import pytest_asyncio
 import uuid
 from datetime import date
 
+from sqlalchemy import delete, select, update
 
 from backend.database.models import (
     Player,
@@ -17,6 +18,7 @@ from backend.database.models import (
     Season,
     Session,
     Match,
+    MatchParticipant,
 )
 from backend.services import data_service, user_service
 
@@ -338,3 +340,38 @@ async def test_player_with_no_matches_returns_empty_list(db_session):
     result = await data_service.get_player_match_history_by_id(db_session, p.id)
     assert result is not None
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_match_participants_follow_match_writes(db_session, match_scenario):
+    """match_participants tracks seat edits and deletes, and history reads it."""
+    p1, p2, p3, p4 = (match_scenario[key] for key in ("p1", "p2", "p3", "p4"))
+    match_id = match_scenario["match_id"]
+
+    async def participants():
+        result = await db_session.execute(
+            select(MatchParticipant.player_id, MatchParticipant.team)
+            .where(MatchParticipant.match_id == match_id)
+            .order_by(MatchParticipant.player_id)
+        )
+        return result.all()
+
+    assert await participants() == [(p1.id, 1), (p2.id, 1), (p3.id, 2), (p4.id, 2)]
+
+    # Swap p2 out for a new player
+    p5 = await _create_player(db_session, "Eve Epsilon")
+    await db_session.execute(
+        update(Match).where(Match.id == match_id).values(team1_player2_id=p5.id)
+    )
+    await db_session.commit()
+
+    assert await participants() == [(p1.id, 1), (p3.id, 2), (p4.id, 2), (p5.id, 1)]
+    assert await data_service.get_player_match_history_by_id(db_session, p2.id) == []
+    history = await data_service.get_player_match_history_by_id(db_session, p5.id)
+    assert [m["partner_id"] for m in history] == [p1.id]
+
+    await db_session.execute(delete(Match).where(Match.id == match_id))
+    await db_session.commit()
+
+    assert await participants() == []
+    assert await data_service.get_player_match_history_by_id(db_session, p1.id) == []
@@ -2,6 +2,7 @@
 Tests for match route endpoints not covered by test_api_routes_comprehensive.py.
 
 Covers:
+- POST /api/matches/preview
 - PUT /api/matches/{match_id}
 - DELETE /api/matches/{match_id}
 - POST /api/leagues/{league_id}/matches/upload-photo
@@ -14,10 +15,18 @@ Covers:
 import io
 from unittest.mock import MagicMock
 
+import pytest
 from fastapi.testclient import TestClient
 
 from backend.api.main import app
-from backend.services import auth_service, data_service, photo_match_service, user_service
+from backend.services import (
+    auth_service,
+    data_service,
+    photo_match_service,
+    ratings_snapshot,
+    user_service,
+)
+from backend.services.ratings_snapshot import RatingsSnapshot
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +92,92 @@ _ACTIVE_MATCH = {
 }
 
 
+# ---------------------------------------------------------------------------
+# POST /api/matches/preview
+# ---------------------------------------------------------------------------
+
+
+class TestPreviewMatches:
+    """Tests for POST /api/matches/preview."""
+
+    def _fake_snapshots(self, monkeypatch, season_snapshot=None):
+        seen = {}
+
+        async def fake_global(session):
+            return RatingsSnapshot(1, {1: 1300.0, 2: 1300.0, 3: 1100.0}, 1200.0, 40)
+
+        async def fake_season(session, season_id):
+            seen["season_id"] = season_id
+            return season_snapshot
+
+        monkeypatch.setattr(ratings_snapshot, "get_global_ratings", fake_global)
+        monkeypatch.setattr(ratings_snapshot, "get_season_ratings", fake_season)
+        return seen
+
+    def test_preview_batch_of_pairings(self, monkeypatch):
+        """Each pairing gets team ratings, win probability and the swing either way."""
+        client, headers = _make_admin_client(monkeypatch)
+        seen = self._fake_snapshots(monkeypatch)
+
+        response = client.post(
+            "/api/matches/preview",
+            json={
+                "pairings": [
+                    {"team1": [1, 2], "team2": [3, 4]},
+                    {"team1": [3, 4], "team2": [1, 2]},
+                ]
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        favored, underdog = response.json()["pairings"]
+        assert favored["team1"] == [1, 2]
+        # Player 4 has no stats yet and counts at the initial rating
+        assert favored["elo"]["team1_rating"] == 1300.0
+        assert favored["elo"]["team2_rating"] == 1150.0
+        expected = favored["elo"]["expected_score"]
+        assert expected == pytest.approx(1 / (1 + 10 ** (-150 / 400)))
+        assert favored["elo"]["change_if_win"] == pytest.approx(40 * (1 - expected))
+        assert favored["elo"]["change_if_loss"] == pytest.approx(-40 * expected)
+        assert underdog["elo"]["expected_score"] == pytest.approx(1 - expected)
+        assert favored["season_rating"] is None
+        assert "season_id" not in seen
+
+    def test_preview_with_season_ratings(self, monkeypatch):
+        """With a season-rating season, pairings also preview season ratings."""
+        client, headers = _make_admin_client(monkeypatch)
+        seen = self._fake_snapshots(
+            monkeypatch, RatingsSnapshot(1, {1: 110.0, 3: 90.0}, 100.0, 10)
+        )
+
+        response = client.post(
+            "/api/matches/preview",
+            json={"pairings": [{"team1": [1], "team2": [3]}], "season_id": 7},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        (pairing,) = response.json()["pairings"]
+        assert seen["season_id"] == 7
+        season = pairing["season_rating"]
+        assert season["team1_rating"] == 110.0
+        assert season["change_if_win"] == pytest.approx(10 * (1 - season["expected_score"]))
+
+    def test_preview_rejects_oversized_teams(self, monkeypatch):
+        """Teams have one or two players."""
+        client, headers = _make_admin_client(monkeypatch)
+        self._fake_snapshots(monkeypatch)
+
+        response = client.post(
+            "/api/matches/preview",
+            json={"pairings": [{"team1": [1, 2, 5], "team2": [3, 4]}]},
+            headers=headers,
+        )
+
+        assert response.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # PUT /api/matches/{match_id}
 # ---------------------------------------------------------------------------
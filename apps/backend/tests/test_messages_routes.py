@@ -59,7 +59,7 @@ class TestGetConversations:
     def test_conversations_success(self, client, headers, monkeypatch):
         """Returns conversation list."""
 
-        async def fake_get(session, player_id, limit=50, offset=0):
+        async def fake_get(session, player_id, limit=50, offset=0, cursor=None):
             return {
                 "items": [
                     {
@@ -88,7 +88,7 @@ class TestGetConversations:
         """Pagination params are passed through."""
         captured = {}
 
-        async def fake_get(session, player_id, limit=50, offset=0):
+        async def fake_get(session, player_id, limit=50, offset=0, cursor=None):
             captured["limit"] = limit
             captured["offset"] = offset
             return {"items": [], "total_count": 0}
@@ -125,7 +125,7 @@ class TestGetThread:
     def test_thread_success(self, client, headers, monkeypatch):
         """Returns thread messages."""
 
-        async def fake_get(session, player_id, other_id, limit=50, offset=0):
+        async def fake_get(session, player_id, other_id, limit=50, offset=0, cursor=None):
             return {
                 "items": [
                     {
@@ -63,7 +63,9 @@ async def test_get_notifications(monkeypatch):
         "has_more": False,
     }
 
-    async def fake_get_user_notifications(session, user_id, limit=50, offset=0, unread_only=False):
+    async def fake_get_user_notifications(
+        session, user_id, limit=50, offset=0, unread_only=False, cursor=None
+    ):
         return mock_notifications
 
     monkeypatch.setattr(
@@ -83,7 +85,9 @@ async def test_get_notifications_with_params(monkeypatch):
     """Test getting notifications with query parameters."""
     client, headers = make_client_with_auth(monkeypatch, user_id=1)
 
-    async def fake_get_user_notifications(session, user_id, limit=50, offset=0, unread_only=False):
+    async def fake_get_user_notifications(
+        session, user_id, limit=50, offset=0, unread_only=False, cursor=None
+    ):
         return {"items": [], "total_count": 0, "has_more": False}
 
     monkeypatch.setattr(
@@ -242,7 +246,9 @@ async def test_get_notifications_error_handling(monkeypatch):
     """Test error handling in get notifications endpoint."""
     client, headers = make_client_with_auth(monkeypatch, user_id=1)
 
-    async def fake_get_user_notifications(session, user_id, limit=50, offset=0, unread_only=False):
+    async def fake_get_user_notifications(
+        session, user_id, limit=50, offset=0, unread_only=False, cursor=None
+    ):
         raise Exception("Database error")
 
     monkeypatch.setattr(
@@ -3,12 +3,15 @@ Unit tests for notification service.
 Tests notification creation, retrieval, marking as read, and bulk operations.
 """
 
+from datetime import datetime, timezone
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
 from backend.services import notification_service
 from backend.database.models import NotificationType, Player, League
 from backend.services import user_service
+from backend.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 
 @pytest_asyncio.fixture
@@ -268,6 +271,67 @@ async def test_get_user_notifications_pagination(db_session, test_user):
     assert result["has_more"] is True
 
 
+@pytest.mark.asyncio
+async def test_get_user_notifications_cursor_pagination(db_session, test_user):
+    """Cursor pages cover every notification once, even as new ones arrive."""
+    for i in range(5):
+        await notification_service.create_notification(
+            session=db_session,
+            user_id=test_user,
+            type=NotificationType.LEAGUE_MESSAGE.value,
+            title=f"Notification {i}",
+            message=f"Message {i}",
+        )
+    await db_session.commit()
+
+    first = await notification_service.get_user_notifications(
+        session=db_session, user_id=test_user, limit=2
+    )
+    assert [n["title"] for n in first["items"]] == ["Notification 4", "Notification 3"]
+    assert first["next_cursor"]
+
+    # A newer notification must not shift the following pages
+    await notification_service.create_notification(
+        session=db_session,
+        user_id=test_user,
+        type=NotificationType.LEAGUE_MESSAGE.value,
+        title="Newest",
+        message="Message",
+    )
+    await db_session.commit()
+
+    titles = [n["title"] for n in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = await notification_service.get_user_notifications(
+            session=db_session, user_id=test_user, limit=2, cursor=cursor
+        )
+        titles += [n["title"] for n in page["items"]]
+        assert page["has_more"] is (page["next_cursor"] is not None)
+        cursor = page["next_cursor"]
+
+    assert titles == [f"Notification {i}" for i in range(4, -1, -1)]
+
+    with pytest.raises(InvalidCursorError):
+        await notification_service.get_user_notifications(
+            session=db_session, user_id=test_user, cursor="not-a-cursor"
+        )
+
+
+def test_cursor_round_trip():
+    """encode_cursor/decode_cursor round-trip typed values and reject bad input."""
+    created_at = datetime(2024, 6, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor, datetime.fromisoformat, int) == (created_at, 42)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, int)  # wrong arity
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("x", 1), int, int)  # wrong type
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("%%%", int)
+
+
 @pytest.mark.asyncio
 async def test_get_user_notifications_unread_only(db_session, test_user):
     """Test getting only unread notifications."""
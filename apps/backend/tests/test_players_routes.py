@@ -15,6 +15,9 @@ Covers:
 Placeholder routes are tested in test_placeholder_crud.py and are excluded here.
 """
 
+import gzip
+from datetime import date
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -208,30 +211,58 @@ class TestMatchExport:
 
     def test_returns_csv_content(self, monkeypatch):
         """Happy path: response is text/csv with expected Content-Disposition."""
-        csv_data = (
-            "DATE,T1P1,T1P2,T2P1,T2P2,T1SCORE,T2SCORE\n2024-01-01,Alice,Bob,Carol,Dave,21,15\n"
-        )
+        captured = {}
 
-        async def fake_export(session):
-            return csv_data
+        async def fake_export(session, **filters):
+            captured.update(filters)
+            yield "DATE,T1P1,T1P2,T2P1,T2P2,T1SCORE,T2SCORE\n"
+            yield "2024-01-01,Alice,Bob,Carol,Dave,21,15\n"
 
-        monkeypatch.setattr(data_service, "export_matches_to_csv", fake_export, raising=True)
+        monkeypatch.setattr(data_service, "iter_matches_csv", fake_export, raising=True)
 
         client = TestClient(app)
-        response = client.get("/api/matches/export")
+        response = client.get(
+            "/api/matches/export?season_id=3&date_from=2024-01-01&date_to=2024-12-31"
+        )
 
         assert response.status_code == 200
         assert "text/csv" in response.headers["content-type"]
         assert "attachment" in response.headers["content-disposition"]
-        assert "Alice" in response.text
+        assert response.text.endswith("2024-01-01,Alice,Bob,Carol,Dave,21,15\n")
+        assert captured == {
+            "league_id": None,
+            "season_id": 3,
+            "date_from": date(2024, 1, 1),
+            "date_to": date(2024, 12, 31),
+        }
+
+    def test_gzip_output(self, monkeypatch):
+        """gzip=true streams a gzipped .csv.gz of the same rows."""
+
+        async def fake_export(session, **filters):
+            yield "DATE,T1P1\n"
+            for i in range(3):
+                yield f"2024-01-0{i + 1},Alice\n"
+
+        monkeypatch.setattr(data_service, "iter_matches_csv", fake_export, raising=True)
+
+        client = TestClient(app)
+        response = client.get("/api/matches/export?gzip=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "matches_export.csv.gz" in response.headers["content-disposition"]
+        text = gzip.decompress(response.content).decode()
+        assert text == "DATE,T1P1\n2024-01-01,Alice\n2024-01-02,Alice\n2024-01-03,Alice\n"
 
     def test_service_error_returns_500(self, monkeypatch):
         """Service exception is surfaced as HTTP 500."""
 
-        async def fake_export(session):
+        async def fake_export(session, **filters):
             raise RuntimeError("storage error")
+            yield  # pragma: no cover - makes this an async generator
 
-        monkeypatch.setattr(data_service, "export_matches_to_csv", fake_export, raising=True)
+        monkeypatch.setattr(data_service, "iter_matches_csv", fake_export, raising=True)
 
         client = TestClient(app)
         response = client.get("/api/matches/export")
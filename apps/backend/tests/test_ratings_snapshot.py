@@ -0,0 +1,98 @@
+"""
+Tests for the in-memory ratings snapshot (services/ratings_snapshot.py).
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import update
+
+from backend.database.models import (
+    League,
+    Player,
+    PlayerGlobalStats,
+    PlayerSeasonStats,
+    ScoringSystem,
+    Season,
+)
+from backend.services import ratings_snapshot, stats_cache
+
+# db_session fixture is provided by conftest.py
+
+
+@pytest.mark.asyncio
+async def test_global_ratings_reload_only_when_global_scope_moves(db_session):
+    """Test that the global snapshot is reused until GLOBAL_SCOPE is bumped."""
+    players = [Player(full_name=f"Player {i}") for i in range(2)]
+    db_session.add_all(players)
+    await db_session.flush()
+    db_session.add(PlayerGlobalStats(player_id=players[0].id, current_rating=1250.0))
+    await stats_cache.bump_generation(db_session, stats_cache.GLOBAL_SCOPE)
+    await db_session.commit()
+
+    snapshot = await ratings_snapshot.get_global_ratings(db_session)
+    assert snapshot.ratings == {players[0].id: 1250.0}
+    assert snapshot.team_rating([players[0].id, players[1].id]) == 1225.0
+
+    # Unannounced writes aren't seen...
+    await db_session.execute(
+        update(PlayerGlobalStats)
+        .where(PlayerGlobalStats.player_id == players[0].id)
+        .values(current_rating=1400.0)
+    )
+    await db_session.commit()
+    assert await ratings_snapshot.get_global_ratings(db_session) is snapshot
+
+    # ...until the stats job's generation bump
+    await stats_cache.bump_generation(db_session, stats_cache.GLOBAL_SCOPE)
+    await db_session.commit()
+    refreshed = await ratings_snapshot.get_global_ratings(db_session)
+    assert refreshed.ratings == {players[0].id: 1400.0}
+
+
+@pytest.mark.asyncio
+async def test_season_ratings_follow_league_scope(db_session):
+    """Test season snapshots: season-rating seasons only, refreshed with their league."""
+    league = League(name="Ratings League", is_open=True)
+    db_session.add(league)
+    await db_session.flush()
+    rated = Season(
+        league_id=league.id,
+        name="Rated",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 30),
+        scoring_system=ScoringSystem.SEASON_RATING.value,
+    )
+    points = Season(
+        league_id=league.id,
+        name="Points",
+        start_date=date(2024, 7, 1),
+        end_date=date(2024, 12, 31),
+    )
+    player = Player(full_name="Rated Player")
+    db_session.add_all([rated, points, player])
+    await db_session.flush()
+    db_session.add(PlayerSeasonStats(player_id=player.id, season_id=rated.id, points=112.0))
+    await stats_cache.bump_generation(db_session, stats_cache.league_scope(league.id))
+    await db_session.commit()
+
+    snapshot = await ratings_snapshot.get_season_ratings(db_session, rated.id)
+    assert snapshot.ratings == {player.id: 112.0}
+    preview = snapshot.preview([player.id], [player.id + 1000])
+    assert preview["team2_rating"] == 100.0
+    assert preview["change_if_win"] == pytest.approx(10 * (1 - preview["expected_score"]))
+    assert await ratings_snapshot.get_season_ratings(db_session, points.id) is None
+    assert await ratings_snapshot.get_season_ratings(db_session, rated.id + 1000) is None
+
+    await db_session.execute(
+        update(PlayerSeasonStats)
+        .where(PlayerSeasonStats.season_id == rated.id)
+        .values(points=95.0)
+    )
+    await db_session.commit()
+    assert await ratings_snapshot.get_season_ratings(db_session, rated.id) is snapshot
+
+    await stats_cache.bump_generation(db_session, stats_cache.league_scope(league.id))
+    await db_session.commit()
+    refreshed = await ratings_snapshot.get_season_ratings(db_session, rated.id)
+    assert refreshed.ratings == {player.id: 95.0}
@@ -0,0 +1,121 @@
+"""
+Tests for running stats replays in a child process (replay_process).
+"""
+
+import pytest
+
+from backend.services import calculation_service, replay_process
+from backend.services.calculation_service import ReplayMatch, ReplaySession
+
+
+def _matches(count):
+    """Round-robin doubles matches between six players."""
+    players = [1, 2, 3, 4, 5, 6]
+    matches = []
+    for i in range(count):
+        p = players[i % 6 :] + players[: i % 6]
+        matches.append(
+            ReplayMatch(
+                id=i + 1,
+                player_ids=((p[0], p[1]), (p[2], p[3])),
+                team1_score=21,
+                team2_score=15 + i % 5,
+                is_ranked=i % 7 != 0,
+                session_id=1,
+                session=ReplaySession("2024-01-01"),
+            )
+        )
+    return matches
+
+
+async def _collect(*args, **kwargs):
+    return [item async for item in replay_process.iter_replay(*args, **kwargs)]
+
+
+@pytest.fixture
+def always_in_process(monkeypatch):
+    monkeypatch.setattr(replay_process, "REPLAY_PROCESS_MIN_MATCHES", 0)
+
+
+@pytest.mark.asyncio
+async def test_global_replay_in_process_matches_inline(always_in_process):
+    """Test that a replay in a child process yields exactly what it yields inline."""
+    matches = _matches(25)
+    retained = calculation_service.retained_checkpoint_counts(25, 10, 4)
+    args = (calculation_service.iter_global_replay, matches, None, 10, 0, retained)
+
+    in_process = await _collect(*args)
+    inline = list(calculation_service.iter_global_replay(*args[1:]))
+
+    assert in_process == inline
+    assert [type(item).__name__ for item in in_process[:2]] == ["ReplayCheckpoint"] * 2
+    assert isinstance(in_process[-1], calculation_service.GlobalReplaySummary)
+
+
+@pytest.mark.asyncio
+async def test_global_replay_in_process_resumes_from_state(always_in_process):
+    """Test that resuming from a serialized state in a child process gives full-replay stats."""
+    matches = _matches(30)
+    items = await _collect(
+        calculation_service.iter_global_replay, matches[:18], None, 10, 0, set()
+    )
+    state_json = items[-1].state_json
+
+    resumed = await _collect(
+        calculation_service.iter_global_replay, matches[18:], state_json, 10, 18, set()
+    )
+    full = list(calculation_service.iter_global_replay(matches, None, 10, 0, set()))
+
+    def rows(items, kind):
+        return sorted(
+            row
+            for item in items
+            if isinstance(item, calculation_service.ReplayRows) and item.kind == kind
+            for row in item.rows
+        )
+
+    for kind in ("partnerships", "opponents", "player_global"):
+        assert rows(resumed, kind) == rows(full, kind)
+    assert resumed[-1] == full[-1]
+
+
+@pytest.mark.asyncio
+async def test_errors_in_process_are_reraised(always_in_process):
+    """Test that an exception raised in the child is re-raised with its type."""
+    with pytest.raises(calculation_service.UnusableStateError):
+        await _collect(
+            calculation_service.iter_global_replay, _matches(3), '{"v": -1}', 10, 0, set()
+        )
+
+
+@pytest.mark.asyncio
+async def test_small_replays_run_inline(monkeypatch):
+    """Test that replays below the threshold never start a process."""
+    monkeypatch.setattr(replay_process, "REPLAY_PROCESS_MIN_MATCHES", 10)
+
+    def fail(*args):
+        raise AssertionError("started a replay process")
+
+    monkeypatch.setattr(replay_process, "_iter_in_process", fail)
+
+    items = await _collect(calculation_service.iter_global_replay, _matches(5), None, 10, 0, set())
+    assert isinstance(items[-1], calculation_service.GlobalReplaySummary)
+
+
+@pytest.mark.asyncio
+async def test_league_stats_in_process(always_in_process):
+    """Test that league and season rows come back from a child process."""
+    matches = _matches(12)
+    setup = calculation_service.SeasonSetup(
+        calculation_service.get_scoring_config(None), False, {}
+    )
+
+    (league_rows,) = await _collect(
+        calculation_service.iter_league_stats, matches, 7, setup.scoring_config, {3: setup}, {1: 3}
+    )
+
+    assert league_rows.player_count == 6
+    assert all(row[2] == 7 for row in league_rows.partnerships)
+    assert sorted(league_rows.seasons[3].players) == sorted(
+        (pid, 3, *rest) for pid, _, *rest in league_rows.players
+    )
@@ -0,0 +1,287 @@
+"""
+Tests for the stats-generation read cache (services/stats_cache.py).
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.database.models import League, Player, Season, Session, StatsGeneration
+from backend.models.schemas import CreateMatchRequest
+from backend.services import session_data, stats_cache
+from backend.services.stats_calc_data import calculate_league_stats_async
+from backend.services.stats_queue import StatsCalculationQueue
+
+# db_session fixture is provided by conftest.py
+
+SCOPES = [stats_cache.league_scope(1), stats_cache.PLAYERS_SCOPE]
+
+
+def counting_loader(result):
+    """Loader returning result and counting its calls in loader.calls."""
+
+    async def loader():
+        loader.calls += 1
+        return result
+
+    loader.calls = 0
+    return loader
+
+
+async def generation(session, scope):
+    result = await session.execute(
+        select(StatsGeneration.generation).where(StatsGeneration.scope == scope)
+    )
+    return result.scalar_one_or_none()
+
+
+@pytest.mark.asyncio
+async def test_reads_cached_until_scope_bumped(db_session):
+    """Test that a read is served from cache until one of its scopes is bumped."""
+    loader = counting_loader([{"player_id": 1, "wins": 3}])
+
+    # Never-bumped scopes have no generation: every read goes to the loader
+    assert await stats_cache.get_json(db_session, "view", SCOPES, loader) is not None
+    await stats_cache.get_json(db_session, "view", SCOPES, loader)
+    assert loader.calls == 2
+
+    await stats_cache.bump_generation(db_session, *SCOPES)
+    await db_session.commit()
+    body = await stats_cache.get_json(db_session, "view", SCOPES, loader)
+    assert body == '[{"player_id":1,"wins":3}]'
+    assert await stats_cache.get_json(db_session, "view", SCOPES, loader) == body
+    assert loader.calls == 3
+
+    # Other leagues' bumps leave the entry alone
+    await stats_cache.bump_generation(db_session, stats_cache.league_scope(2))
+    await db_session.commit()
+    await stats_cache.get_json(db_session, "view", SCOPES, loader)
+    assert loader.calls == 3
+
+    await stats_cache.bump_generation(db_session, stats_cache.league_scope(1))
+    await db_session.commit()
+    await stats_cache.get_json(db_session, "view", SCOPES, loader)
+    assert loader.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_bump_moves_all_scope_and_never_reuses_generations(db_session):
+    """Test that bumps also move ALL_SCOPE and generations only increase."""
+    await stats_cache.bump_generation(db_session, stats_cache.GLOBAL_SCOPE)
+    await db_session.commit()
+    first_global = await generation(db_session, stats_cache.GLOBAL_SCOPE)
+    first_all = await generation(db_session, stats_cache.ALL_SCOPE)
+    assert first_global is not None and first_all is not None
+
+    await stats_cache.bump_generation(db_session, stats_cache.league_scope(1))
+    await db_session.commit()
+    assert await generation(db_session, stats_cache.GLOBAL_SCOPE) == first_global
+    assert await generation(db_session, stats_cache.ALL_SCOPE) > first_all
+    assert await generation(db_session, stats_cache.league_scope(1)) > first_global
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(db_session, test_engine):
+    """Test that a burst of identical reads costs one load."""
+    await stats_cache.bump_generation(db_session, *SCOPES)
+    await db_session.commit()
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_loader():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        return {"1": {"games": 4}}
+
+    session_maker = async_sessionmaker(test_engine, class_=AsyncSession)
+
+    async def read():
+        async with session_maker() as session:
+            return await stats_cache.get_json(session, "burst", SCOPES, slow_loader)
+
+    readers = [asyncio.create_task(read()) for _ in range(10)]
+    await asyncio.wait_for(started.wait(), timeout=10)
+    await asyncio.sleep(0.1)
+    release.set()
+    bodies = await asyncio.gather(*readers)
+
+    assert calls == 1
+    assert set(bodies) == {'{"1":{"games":4}}'}
+
+
+@pytest.mark.asyncio
+async def test_empty_and_missing_results_are_not_cached(db_session):
+    """Test that None and empty results are read again next time."""
+    await stats_cache.bump_generation(db_session, *SCOPES)
+    await db_session.commit()
+
+    missing = counting_loader(None)
+    assert await stats_cache.get_json(db_session, "missing", SCOPES, missing) is None
+    assert await stats_cache.get_json(db_session, "missing", SCOPES, missing) is None
+    empty = counting_loader([])
+    assert await stats_cache.get_json(db_session, "empty", SCOPES, empty) == "[]"
+    assert await stats_cache.get_json(db_session, "empty", SCOPES, empty) == "[]"
+
+    assert missing.calls == 2
+    assert empty.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_serves_other_processes_entries(db_session):
+    """Test that an entry found in Redis is used without loading, and misses are stored."""
+    await stats_cache.bump_generation(db_session, *SCOPES)
+    await db_session.commit()
+    loader = counting_loader({"rankings": [1, 2]})
+
+    with (
+        patch.object(
+            stats_cache.redis_service, "redis_get", new=AsyncMock(return_value='{"shared":1}')
+        ),
+        patch.object(stats_cache.redis_service, "redis_set", new=AsyncMock()) as redis_set,
+    ):
+        assert await stats_cache.get_json(db_session, "shared", SCOPES, loader) == '{"shared":1}'
+        redis_set.assert_not_awaited()
+    assert loader.calls == 0
+
+    with (
+        patch.object(stats_cache.redis_service, "redis_get", new=AsyncMock(return_value=None)),
+        patch.object(stats_cache.redis_service, "redis_set", new=AsyncMock()) as redis_set,
+    ):
+        body = await stats_cache.get_json(db_session, "fresh", SCOPES, loader)
+    assert loader.calls == 1
+    key, stored, expiry = redis_set.await_args.args
+    assert key.startswith(stats_cache.REDIS_KEY_PREFIX + "fresh@")
+    assert stored == body
+    assert expiry == stats_cache.STATS_CACHE_REDIS_EXPIRY_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_reads_through(db_session):
+    """Test that a failing generation lookup does not fail the read."""
+    loader = counting_loader([1])
+    with patch.object(
+        stats_cache, "_current_generations", new=AsyncMock(side_effect=RuntimeError("down"))
+    ):
+        assert await stats_cache.get_json(db_session, "view", SCOPES, loader) == "[1]"
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_scopes(db_session):
+    """Test the scopes of season, league and unscoped reads."""
+    league = League(name="Cache League", is_open=True)
+    db_session.add(league)
+    await db_session.flush()
+    season = Season(
+        league_id=league.id,
+        name="S1",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+    db_session.add(season)
+    await db_session.commit()
+
+    league_scopes = [stats_cache.league_scope(league.id), stats_cache.PLAYERS_SCOPE]
+    assert await stats_cache.stats_scopes(db_session, season_id=season.id) == league_scopes
+    assert await stats_cache.stats_scopes(db_session, league_id=league.id, elo=True) == [
+        *league_scopes,
+        stats_cache.GLOBAL_SCOPE,
+    ]
+    assert await stats_cache.stats_scopes(db_session) == [stats_cache.ALL_SCOPE]
+    assert await stats_cache.stats_scopes(db_session, season_id=season.id + 100) is None
+    assert await stats_cache.stats_scopes(db_session, league_id="abc") is None
+
+
+@pytest.mark.asyncio
+async def test_league_stats_job_bumps_league_generation(db_session):
+    """Test that recomputing a league's stats invalidates its cached reads."""
+    league = League(name="Cache League", is_open=True)
+    db_session.add(league)
+    await db_session.commit()
+    scope = stats_cache.league_scope(league.id)
+    assert await generation(db_session, scope) is None
+
+    await calculate_league_stats_async(db_session, league.id)
+    first = await generation(db_session, scope)
+    assert first is not None
+
+    await calculate_league_stats_async(db_session, league.id)
+    assert await generation(db_session, scope) > first
+
+
+@pytest.mark.asyncio
+async def test_queue_listener_feeds_generations(db_session, test_engine, monkeypatch):
+    """Test that generations bumped elsewhere reach this process through NOTIFY."""
+    from backend.database import db
+
+    monkeypatch.setattr(db, "engine", test_engine)
+    listening = StatsCalculationQueue(debounce_seconds=0)
+    listener = asyncio.create_task(listening._listen_for_jobs())
+    try:
+        # The listener sets the wake event once it is subscribed
+        await asyncio.wait_for(listening._wake_event.wait(), timeout=10)
+        assert stats_cache._feed_live
+
+        await stats_cache.bump_generation(db_session, stats_cache.GLOBAL_SCOPE)
+        await db_session.commit()
+        expected = await generation(db_session, stats_cache.GLOBAL_SCOPE)
+
+        async def announced():
+            while stats_cache._generations.get(stats_cache.GLOBAL_SCOPE) != expected:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(announced(), timeout=10)
+        assert stats_cache._generations[stats_cache.ALL_SCOPE] == await generation(
+            db_session, stats_cache.ALL_SCOPE
+        )
+    finally:
+        listening._stop_event.set()
+        await asyncio.wait_for(listener, timeout=10)
+
+    # Without the feed, remembered generations are not trusted
+    assert not stats_cache._feed_live
+    assert stats_cache._generations == {}
+
+
+@pytest.mark.asyncio
+async def test_match_edits_bump_their_league(db_session):
+    """Test that adding and deleting a league match invalidates the league's reads."""
+    league = League(name="Cache League", is_open=True)
+    db_session.add(league)
+    await db_session.flush()
+    season = Season(
+        league_id=league.id, name="S1", start_date=date(2024, 1, 1), end_date=date(2024, 12, 31)
+    )
+    players = [Player(full_name=f"Player {i}") for i in range(4)]
+    db_session.add_all([season, *players])
+    await db_session.flush()
+    league_session = Session(date="2024-05-01", name="Week 1", season_id=season.id)
+    db_session.add(league_session)
+    await db_session.commit()
+    scope = stats_cache.league_scope(league.id)
+
+    match_id = await session_data.create_match_async(
+        db_session,
+        CreateMatchRequest(
+            team1_player1_id=players[0].id,
+            team1_player2_id=players[1].id,
+            team2_player1_id=players[2].id,
+            team2_player2_id=players[3].id,
+            team1_score=21,
+            team2_score=15,
+        ),
+        league_session.id,
+    )
+    created = await generation(db_session, scope)
+    assert created is not None
+
+    assert await session_data.delete_match_async(db_session, match_id)
+    assert await generation(db_session, scope) > created
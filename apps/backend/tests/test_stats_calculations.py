@@ -13,21 +13,25 @@ import pytest
 import pytest_asyncio
 from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 from backend.database.models import (
     Player,
     League,
     LeagueConfig,
+    LeagueLeaderboardEntry,
     LeagueMember,
     Season,
+    SeasonLeaderboardEntry,
     Session,
     Match,
+    MatchStats,
     PartnershipStats,
     OpponentStats,
     EloHistory,
     PartnershipStatsSeason,
     OpponentStatsSeason,
     PlayerSeasonStats,
+    PlayerEloSeries,
     PlayerGlobalStats,
     PartnershipStatsLeague,
     OpponentStatsLeague,
@@ -35,8 +39,10 @@ from backend.database.models import (
     SeasonRatingHistory,
     ScoringSystem,
     SessionStatus,
+    StatsTrackerCheckpoint,
+    StatsTrackerState,
 )
-from backend.services import data_service, calculation_service
+from backend.services import data_service, calculation_service, stats_read_data
 from backend.utils.constants import INITIAL_ELO, K
 
 
@@ -1427,6 +1433,148 @@ async def test_season_rating_mode_points_are_ratings(
     assert len(history) == 4  # One entry per player
 
 
+@pytest.mark.asyncio
+async def test_match_lists_read_deltas_written_by_stats_jobs(
+    db_session, test_players, season_rating_league
+):
+    """Match list reads return the global and season-rating deltas the stats jobs stored."""
+    alice, bob, charlie, dave = test_players
+    league, season = season_rating_league
+    session_obj = Session(
+        date="2024-01-15",
+        name="Rating Session",
+        status=SessionStatus.SUBMITTED,
+        season_id=season.id,
+        created_by=1,
+    )
+    db_session.add(session_obj)
+    await db_session.commit()
+    match = await create_match(db_session, session_obj, alice, bob, charlie, dave, 21, 15)
+    unranked = await create_match(
+        db_session, session_obj, alice, charlie, bob, dave, 21, 10, is_ranked=False
+    )
+
+    await data_service.calculate_global_stats_async(db_session)
+    await data_service.calculate_league_stats_async(db_session, league.id)
+
+    history = await db_session.execute(
+        select(EloHistory.player_id, EloHistory.elo_after, EloHistory.elo_change).where(
+            EloHistory.match_id == match.id
+        )
+    )
+    expected = {
+        player_id: {
+            "elo_before": round(elo_after - elo_change, 1),
+            "elo_after": elo_after,
+            "elo_change": elo_change,
+        }
+        for player_id, elo_after, elo_change in history.all()
+    }
+    rating = await db_session.execute(
+        select(SeasonRatingHistory.rating_change).where(
+            SeasonRatingHistory.match_id == match.id,
+            SeasonRatingHistory.player_id == alice.id,
+        )
+    )
+    alice_rating_change = rating.scalar_one()
+    assert expected[alice.id]["elo_change"] > 0 and alice_rating_change > 0
+
+    for matches in (
+        await data_service.get_season_matches_with_elo(db_session, season.id),
+        await data_service.get_league_matches_with_elo(db_session, league.id),
+    ):
+        by_id = {m["id"]: m for m in matches}
+        assert by_id[match.id]["elo_changes"] == expected
+        assert by_id[match.id]["team1_rating_change"] == alice_rating_change
+        assert by_id[unranked.id]["elo_changes"] == {}
+
+    listed = await data_service.query_matches(db_session, {"season_id": season.id})
+    by_id = {m["id"]: m for m in listed}
+    assert by_id[match.id]["team1_elo_change"] == expected[alice.id]["elo_change"]
+    assert by_id[match.id]["team2_elo_change"] == expected[charlie.id]["elo_change"]
+    assert by_id[unranked.id]["team1_elo_change"] == 0
+
+    alice_history = await data_service.get_player_match_history_by_id(db_session, alice.id)
+    ranked_entry = next(m for m in alice_history if m["score"] == "21-15")
+    assert ranked_entry["elo_change"] == expected[alice.id]["elo_change"]
+    assert ranked_entry["elo_after"] == expected[alice.id]["elo_after"]
+
+    # Making the match ineligible clears its deltas on the next run
+    match.ranked_intent = False
+    match.is_ranked = False
+    await db_session.commit()
+    await data_service.calculate_global_stats_async(db_session)
+    await data_service.calculate_league_stats_async(db_session, league.id)
+    matches = await data_service.get_season_matches_with_elo(db_session, season.id)
+    assert all(m["elo_changes"] == {} for m in matches)
+    assert all(m["team1_rating_change"] is None for m in matches)
+
+
+@pytest.mark.asyncio
+async def test_query_matches_cursor_pagination(db_session, test_players):
+    """query_matches pages by cursor in (date, id) order without gaps or repeats."""
+    alice, bob, charlie, dave = test_players
+    later = Session(date="2024-02-01", name="Later", status=SessionStatus.SUBMITTED)
+    earlier = Session(date="2024-01-01", name="Earlier", status=SessionStatus.SUBMITTED)
+    db_session.add_all([later, earlier])
+    await db_session.commit()
+    ids = [
+        (await create_match(db_session, sess, alice, bob, charlie, dave, 21, score)).id
+        for sess, score in ((later, 10), (earlier, 11), (later, 12), (earlier, 13))
+    ]
+    expected = [ids[1], ids[3], ids[0], ids[2]]  # date asc, then id asc
+
+    body = {"limit": 3, "sort_by": "date", "sort_dir": "asc"}
+    first = await data_service.query_matches(db_session, body)
+    cursor = data_service.query_matches_next_cursor(body, first)
+    rest = await data_service.query_matches(db_session, {**body, "cursor": cursor})
+
+    assert [m["id"] for m in first + rest] == expected
+    assert data_service.query_matches_next_cursor(body, rest) is None
+
+    # Default sort (id desc) pages by id alone
+    body = {"limit": 2}
+    first = await data_service.query_matches(db_session, body)
+    cursor = data_service.query_matches_next_cursor(body, first)
+    rest = await data_service.query_matches(db_session, {**body, "cursor": cursor})
+    assert [m["id"] for m in first + rest] == sorted(ids, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_matches_csv_export_streams_filtered_batches(
+    db_session, test_players, season_rating_league, monkeypatch
+):
+    """The CSV export yields one chunk per cursor batch and applies its filters."""
+    alice, bob, charlie, dave = test_players
+    league, season = season_rating_league
+    in_season = Session(
+        date="2024-01-15", name="Season", status=SessionStatus.SUBMITTED, season_id=season.id
+    )
+    casual = Session(date="2024-03-01", name="Casual", status=SessionStatus.SUBMITTED)
+    active = Session(date="2024-03-02", name="Active", status=SessionStatus.ACTIVE)
+    db_session.add_all([in_season, casual, active])
+    await db_session.commit()
+    for sess, score in ((in_season, 10), (in_season, 11), (casual, 12), (active, 13)):
+        await create_match(db_session, sess, alice, bob, charlie, dave, 21, score)
+
+    monkeypatch.setattr(stats_read_data, "MATCH_EXPORT_CHUNK_SIZE", 1)
+    chunks = [chunk async for chunk in data_service.iter_matches_csv(db_session)]
+    header = "Date,Team 1,,Team 2,,Team 1 Score,Team 2 Score\r\n"
+    assert chunks[0] == header
+    assert [line.split(",")[-1] for line in chunks[1:]] == ["10\r\n", "11\r\n", "12\r\n"]
+
+    by_league = await data_service.export_matches_to_csv(db_session, league_id=league.id)
+    assert by_league.count("\r\n") == 3  # header + 2 season matches
+    by_date = await data_service.export_matches_to_csv(
+        db_session, date_from=date(2024, 2, 1), date_to=date(2024, 12, 31)
+    )
+    assert by_date == (
+        header
+        + f"2024-03-01,{alice.full_name},{bob.full_name},"
+        + f"{charlie.full_name},{dave.full_name},21,12\r\n"
+    )
+
+
 @pytest.mark.asyncio
 async def test_season_rating_non_member_gets_same_initial_rating(
     db_session, test_players, season_rating_league
@@ -1519,3 +1667,479 @@ async def test_malformed_point_system_uses_defaults(db_session, test_players):
     )
     alice_stats = stats_result.scalar_one()
     assert alice_stats.points == 3.0  # 1 win * 3 (default)
+
+
+async def _snapshot_global_stats(db_session: AsyncSession) -> dict:
+    """Collect global stats rows as comparable tuples."""
+    elo = await db_session.execute(select(EloHistory))
+    partnerships = await db_session.execute(select(PartnershipStats))
+    opponents = await db_session.execute(select(OpponentStats))
+    global_stats = await db_session.execute(select(PlayerGlobalStats))
+    series = await db_session.execute(
+        select(PlayerEloSeries.player_id, PlayerEloSeries.points, PlayerEloSeries.point_count)
+    )
+    match_stats = await db_session.execute(select(MatchStats))
+    return {
+        "elo": sorted(
+            (r.player_id, r.match_id, r.date, r.elo_after, r.elo_change)
+            for r in elo.scalars().all()
+        ),
+        "partnerships": sorted(
+            (r.player_id, r.partner_id, r.games, r.wins, r.points, r.win_rate, r.avg_point_diff)
+            for r in partnerships.scalars().all()
+        ),
+        "opponents": sorted(
+            (r.player_id, r.opponent_id, r.games, r.wins, r.points, r.win_rate, r.avg_point_diff)
+            for r in opponents.scalars().all()
+        ),
+        "global": sorted(
+            (r.player_id, r.current_rating, r.total_games, r.total_wins)
+            for r in global_stats.scalars().all()
+        ),
+        "series": sorted(tuple(r) for r in series.all()),
+        "match_stats": sorted(
+            (
+                r.match_id,
+                r.team1_elo_change,
+                r.team2_elo_change,
+                r.team1_player1_elo_after,
+                r.team1_player2_elo_after,
+                r.team2_player1_elo_after,
+                r.team2_player2_elo_after,
+            )
+            for r in match_stats.scalars().all()
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_global_stats_match_full_rebuild(
+    db_session, test_players, test_session, monkeypatch
+):
+    """Appending new matches incrementally yields the same rows as a full rebuild."""
+    from backend.services import stats_calc_data
+
+    alice, bob, charlie, dave = test_players
+
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(
+        db_session,
+        test_session,
+        alice,
+        charlie,
+        bob,
+        dave,
+        21,
+        17,
+        ranked_intent=True,
+        is_ranked=False,
+    )
+    await data_service.calculate_global_stats_async(db_session)
+
+    state = await db_session.execute(select(StatsTrackerState))
+    state_row = state.scalar_one()
+    assert state_row.match_count == 2
+    previous_last_match_id = state_row.last_match_id
+
+    # Record every load so the test fails if the run silently fell back to a replay
+    load_calls = []
+    original_stream = stats_calc_data._stream_matches_with_hashes_async
+
+    def recording_stream(session, after_match_id=None, db_lock=None):
+        load_calls.append(after_match_id)
+        return original_stream(session, after_match_id, db_lock)
+
+    monkeypatch.setattr(stats_calc_data, "_stream_matches_with_hashes_async", recording_stream)
+
+    await create_match(db_session, test_session, alice, dave, bob, charlie, 15, 21)
+    await create_match(db_session, test_session, bob, dave, alice, charlie, 21, 12)
+    result = await data_service.calculate_global_stats_async(db_session)
+    assert (result["player_count"], result["match_count"]) == (4, 4)
+    assert load_calls == [previous_last_match_id]
+
+    db_session.expire_all()
+    state = await db_session.execute(select(StatsTrackerState))
+    assert state.scalar_one().match_count == 4
+
+    incremental = await _snapshot_global_stats(db_session)
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    rebuilt = await _snapshot_global_stats(db_session)
+    assert incremental == rebuilt
+
+
+@pytest.mark.asyncio
+async def test_incremental_global_stats_rebuilds_after_older_match_edit(
+    db_session, test_players, test_session
+):
+    """Editing an already-processed match replays from a checkpoint or rebuilds."""
+    alice, bob, charlie, dave = test_players
+
+    match1 = await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await data_service.calculate_global_stats_async(db_session)
+
+    # Flip the result of the already-processed match, then add a newer one
+    match1.team1_score = 10
+    match1.winner = 2
+    await db_session.commit()
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+
+    await data_service.calculate_global_stats_async(db_session)
+    after_edit = await _snapshot_global_stats(db_session)
+
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert after_edit == await _snapshot_global_stats(db_session)
+
+    alice_vs_charlie = next(
+        row for row in after_edit["opponents"] if row[0] == alice.id and row[1] == charlie.id
+    )
+    assert alice_vs_charlie[2:4] == (1, 0)  # 1 game (match 1), lost after the edit
+
+
+@pytest.mark.asyncio
+async def test_global_stats_replay_from_checkpoint_after_older_match_edit(
+    db_session, test_players, test_session, monkeypatch
+):
+    """Editing a match after a checkpoint replays from that checkpoint and matches a rebuild."""
+    from backend.services import stats_calc_data
+
+    monkeypatch.setattr(stats_calc_data, "STATS_CHECKPOINT_INTERVAL", 2)
+    alice, bob, charlie, dave = test_players
+
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    match2 = await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+    match3 = await create_match(db_session, test_session, alice, dave, bob, charlie, 15, 21)
+    match4 = await create_match(db_session, test_session, bob, dave, alice, charlie, 21, 12)
+    await data_service.calculate_global_stats_async(db_session)
+
+    checkpoints = await db_session.execute(
+        select(StatsTrackerCheckpoint.last_match_id).order_by(StatsTrackerCheckpoint.last_match_id)
+    )
+    assert checkpoints.scalars().all() == [match2.id, match4.id]
+
+    # Edit match 3: the checkpoint after match 2 is still valid, the later one is not
+    match3.team1_score = 21
+    match3.team2_score = 10
+    match3.winner = 1
+    await db_session.commit()
+
+    find_result = await stats_calc_data._find_resume_checkpoint_async(db_session, "global")
+    assert find_result.last_match_id == match2.id
+
+    await data_service.calculate_global_stats_async(db_session)
+    replayed = await _snapshot_global_stats(db_session)
+
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert replayed == await _snapshot_global_stats(db_session)
+
+
+@pytest.mark.asyncio
+async def test_global_stats_compact_tracker_matches_default(
+    db_session, test_players, test_session, monkeypatch
+):
+    """The opt-in CompactStatsTracker writes the same global rows as StatsTracker."""
+    from backend.services import stats_calc_data
+
+    alice, bob, charlie, dave = test_players
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 15, 21)
+    await create_match(db_session, test_session, bob, dave, alice, charlie, 21, 12)
+
+    monkeypatch.setattr(stats_calc_data, "USE_COMPACT_STATS_TRACKER", False)
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    expected = await _snapshot_global_stats(db_session)
+
+    monkeypatch.setattr(stats_calc_data, "USE_COMPACT_STATS_TRACKER", True)
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert await _snapshot_global_stats(db_session) == expected
+
+
+@pytest.mark.asyncio
+async def test_global_stats_checkpoints_are_pruned_to_retention_set(
+    db_session, test_players, test_session, monkeypatch
+):
+    """Only the latest and log-spaced checkpoints are kept, with fingerprints of their prefix."""
+    from backend.services import stats_calc_data
+
+    monkeypatch.setattr(stats_calc_data, "STATS_CHECKPOINT_INTERVAL", 1)
+    monkeypatch.setattr(stats_calc_data, "STATS_CHECKPOINT_KEEP_RECENT", 1)
+    alice, bob, charlie, dave = test_players
+
+    for _ in range(5):
+        await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await data_service.calculate_global_stats_async(db_session)
+
+    async def checkpoint_headers():
+        result = await db_session.execute(
+            select(
+                StatsTrackerCheckpoint.last_match_id,
+                StatsTrackerCheckpoint.match_count,
+                StatsTrackerCheckpoint.fingerprint,
+            ).order_by(StatsTrackerCheckpoint.last_match_id)
+        )
+        return result.all()
+
+    headers = await checkpoint_headers()
+    assert [h.match_count for h in headers] == [4, 5]
+    db_fingerprints = await stats_calc_data._prefix_fingerprints_async(
+        db_session, [h.last_match_id for h in headers]
+    )
+    assert db_fingerprints == [(h.match_count, h.fingerprint) for h in headers]
+
+    # One more match: checkpoint 5 falls out of the retention set and is pruned
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+    await data_service.calculate_global_stats_async(db_session)
+    assert [h.match_count for h in await checkpoint_headers()] == [4, 6]
+
+
+@pytest.mark.asyncio
+async def test_stats_recalculation_writes_only_changed_rows(
+    db_session, test_players, test_league_and_season, test_session
+):
+    """Recomputing unchanged stats writes nothing; removing a match deletes only its stale rows."""
+    alice, bob, charlie, dave = test_players
+    league, season = test_league_and_season
+
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    match2 = await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+
+    first = await data_service.calculate_league_stats_async(db_session, league.id)
+    assert first["rows_written"] > 0
+    rebuilt = await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert rebuilt["rows_written"] > 0
+
+    again = await data_service.calculate_league_stats_async(db_session, league.id)
+    assert again["rows_written"] == 0
+    assert again["season_counts"][season.id]["rows_written"] == 0
+    assert (await data_service.calculate_global_stats_async(db_session, full_rebuild=True))[
+        "rows_written"
+    ] == 0
+
+    # Dropping match 2 removes the alice/charlie partnership everywhere
+    match2.ranked_intent = False
+    await db_session.commit()
+    await data_service.calculate_league_stats_async(db_session, league.id)
+    await data_service.calculate_global_stats_async(db_session)
+    for model, scope in (
+        (PartnershipStats, []),
+        (PartnershipStatsLeague, [PartnershipStatsLeague.league_id == league.id]),
+        (PartnershipStatsSeason, [PartnershipStatsSeason.season_id == season.id]),
+    ):
+        result = await db_session.execute(
+            select(model.partner_id).where(model.player_id == alice.id, *scope)
+        )
+        assert result.scalars().all() == [bob.id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_writers_copy_and_merge_plain_rows(db_session, test_players):
+    """COPY inserts plain rows; staged upserts update existing keys and add new ones."""
+    from backend.services import stats_calc_data
+
+    alice, bob, charlie, _ = test_players
+    row = calculation_service.PartnershipRow
+    await stats_calc_data.insert_partnership_stats_async(
+        db_session, [row(alice.id, bob.id, 1, 1, 3, 1.0, 2.0)]
+    )
+    # Two merges in one transaction: the staging table is recreated each time
+    await stats_calc_data.upsert_partnership_stats_async(
+        db_session, [row(alice.id, bob.id, 2, 1, 4, 0.5, -1.0)]
+    )
+    await stats_calc_data.upsert_partnership_stats_async(
+        db_session, [row(alice.id, charlie.id, 1, 0, 1, 0.0, -3.0)]
+    )
+    await db_session.commit()
+
+    result = await db_session.execute(
+        select(PartnershipStats).where(PartnershipStats.player_id == alice.id)
+    )
+    rows = sorted(
+        (p.partner_id, p.games, p.wins, p.points, p.win_rate, p.avg_point_diff)
+        for p in result.scalars().all()
+    )
+    assert rows == sorted([(bob.id, 2, 1, 4, 0.5, -1.0), (charlie.id, 1, 0, 1, 0.0, -3.0)])
+
+
+@pytest.mark.asyncio
+async def test_global_stats_replayed_in_process_match_inline(
+    db_session, test_players, test_session, monkeypatch
+):
+    """Global stats computed in a replay process (incremental and full) match inline ones."""
+    from backend.services import replay_process, stats_calc_data
+
+    monkeypatch.setattr(stats_calc_data, "STATS_CHECKPOINT_INTERVAL", 2)
+    alice, bob, charlie, dave = test_players
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+    await create_match(db_session, test_session, alice, dave, bob, charlie, 15, 21)
+
+    await data_service.calculate_global_stats_async(db_session)
+    inline = await _snapshot_global_stats(db_session)
+
+    monkeypatch.setattr(replay_process, "REPLAY_PROCESS_MIN_MATCHES", 0)
+    result = await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert (result["player_count"], result["match_count"]) == (4, 3)
+    assert await _snapshot_global_stats(db_session) == inline
+
+    # Incremental update on top of the state written by the child process
+    await create_match(db_session, test_session, bob, dave, alice, charlie, 21, 12)
+    await data_service.calculate_global_stats_async(db_session)
+    in_process = await _snapshot_global_stats(db_session)
+
+    monkeypatch.setattr(replay_process, "REPLAY_PROCESS_MIN_MATCHES", 10**9)
+    await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+    assert await _snapshot_global_stats(db_session) == in_process
+
+
+@pytest.mark.asyncio
+async def test_global_stats_streamed_in_small_chunks_match_single_chunk(
+    db_session, test_players, test_session, monkeypatch
+):
+    """Streaming matches a few rows at a time gives the same stats and checkpoints."""
+    from backend.services import replay_process, stats_calc_data
+
+    monkeypatch.setattr(stats_calc_data, "STATS_CHECKPOINT_INTERVAL", 2)
+    alice, bob, charlie, dave = test_players
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+    await create_match(db_session, test_session, alice, dave, bob, charlie, 15, 21)
+    await create_match(db_session, test_session, bob, dave, alice, charlie, 21, 12)
+    await create_match(db_session, test_session, bob, charlie, alice, dave, 18, 21)
+
+    await data_service.calculate_global_stats_async(db_session)
+    single_chunk = await _snapshot_global_stats(db_session)
+    checkpoints = await db_session.execute(
+        select(StatsTrackerCheckpoint.match_count, StatsTrackerCheckpoint.fingerprint)
+    )
+    expected_checkpoints = sorted(checkpoints.all())
+
+    chunk_sizes = []
+    original_stream = stats_calc_data._stream_matches_with_hashes_async
+
+    async def recording_stream(session, after_match_id=None, db_lock=None):
+        async for matches, hashes in original_stream(session, after_match_id, db_lock):
+            assert len(matches) == len(hashes)
+            chunk_sizes.append(len(matches))
+            yield matches, hashes
+
+    monkeypatch.setattr(stats_calc_data, "STATS_MATCH_LOAD_CHUNK_SIZE", 2)
+    monkeypatch.setattr(stats_calc_data, "_stream_matches_with_hashes_async", recording_stream)
+    monkeypatch.setattr(replay_process, "REPLAY_PROCESS_MIN_MATCHES", 0)
+    result = await data_service.calculate_global_stats_async(db_session, full_rebuild=True)
+
+    assert chunk_sizes == [2, 2, 1]
+    assert (result["player_count"], result["match_count"]) == (4, 5)
+    assert await _snapshot_global_stats(db_session) == single_chunk
+    db_session.expire_all()
+    checkpoints = await db_session.execute(
+        select(StatsTrackerCheckpoint.match_count, StatsTrackerCheckpoint.fingerprint)
+    )
+    assert sorted(checkpoints.all()) == expected_checkpoints
+
+
+@pytest.mark.asyncio
+async def test_league_stats_job_writes_ranked_leaderboards(
+    db_session, test_players, test_league_and_season, test_session
+):
+    """The league stats job ranks league and season leaderboards in the rankings order."""
+    from sqlalchemy import delete
+    from backend.services.stats_read_data import (
+        _sort_rankings_all_seasons,
+        _sort_rankings_single_season,
+    )
+
+    league, season = test_league_and_season
+    alice, bob, charlie, dave = test_players
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 10)
+    await create_match(db_session, test_session, bob, charlie, alice, dave, 21, 15)
+    await data_service.calculate_global_stats_async(db_session)
+    await data_service.calculate_league_stats_async(db_session, league.id)
+
+    season_rankings = await data_service.get_rankings(db_session, {"season_id": season.id})
+    league_rankings = await data_service.get_rankings(db_session, {"league_id": league.id})
+    assert [r["rank"] for r in season_rankings] == [1, 2, 3, 4]
+    assert season_rankings == _sort_rankings_single_season(season_rankings)
+    assert [r["rank"] for r in league_rankings] == [1, 2, 3, 4]
+    assert league_rankings == _sort_rankings_all_seasons(league_rankings)
+    # Alice and Charlie tie on points; Charlie has the better point differential
+    assert [r["player_id"] for r in season_rankings[:2]] == [charlie.id, alice.id]
+
+    entries = await db_session.execute(
+        select(SeasonLeaderboardEntry.player_id)
+        .where(SeasonLeaderboardEntry.season_id == season.id)
+        .order_by(SeasonLeaderboardEntry.rank)
+    )
+    assert entries.scalars().all() == [r["player_id"] for r in season_rankings]
+
+    # A recompute replaces the ranking rather than appending to it
+    for _ in range(3):
+        await create_match(db_session, test_session, dave, charlie, alice, bob, 21, 5)
+    await data_service.calculate_global_stats_async(db_session)
+    await data_service.calculate_league_stats_async(db_session, league.id)
+    season_rankings = await data_service.get_rankings(db_session, {"season_id": season.id})
+    assert [r["rank"] for r in season_rankings] == [1, 2, 3, 4]
+    assert season_rankings == _sort_rankings_single_season(season_rankings)
+    assert season_rankings[0]["player_id"] in (charlie.id, dave.id)
+    league_count = await db_session.execute(
+        select(func.count())
+        .select_from(LeagueLeaderboardEntry)
+        .where(LeagueLeaderboardEntry.league_id == league.id)
+    )
+    assert league_count.scalar_one() == 4
+
+    # Without a stored leaderboard, the scope's stats are ranked the same way on read
+    await db_session.execute(delete(SeasonLeaderboardEntry))
+    await db_session.commit()
+    assert await data_service.get_rankings(db_session, {"season_id": season.id}) == season_rankings
+
+
+@pytest.mark.asyncio
+async def test_global_stats_job_maintains_sparse_elo_series(
+    db_session, test_players, test_league_and_season, test_session
+):
+    """The global stats job keeps one end-of-day ELO point per date in each player's series."""
+    league, season = test_league_and_season
+    alice, bob, charlie, dave = test_players
+    later = Session(
+        date="2024-02-01",
+        name="Later Session",
+        status=SessionStatus.SUBMITTED,
+        season_id=season.id,
+        created_by=1,
+    )
+    db_session.add(later)
+    await db_session.commit()
+
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 19)
+    await create_match(db_session, test_session, alice, charlie, bob, dave, 21, 17)
+    await data_service.calculate_global_stats_async(db_session)
+
+    history = await db_session.execute(
+        select(EloHistory.elo_after)
+        .where(EloHistory.player_id == alice.id)
+        .order_by(EloHistory.match_id.desc())
+    )
+    alice_end_of_day = history.scalars().first()
+    series = {s["player_id"]: s for s in await data_service.get_elo_series(db_session)}
+    assert series[alice.id]["points"] == [["2024-01-15", alice_end_of_day]]
+    assert series[alice.id]["name"] == "Alice"
+
+    # Incremental run: only Alice and Bob played, and they gain a second point
+    await create_match(db_session, test_session, alice, bob, charlie, dave, 21, 5)
+    await create_match(db_session, later, alice, bob, charlie, dave, 21, 5)
+    await data_service.calculate_global_stats_async(db_session)
+    series = await data_service.get_elo_series(db_session, player_ids=[alice.id])
+    assert [point[0] for point in series[0]["points"]] == ["2024-01-15", "2024-02-01"]
+
+    # A league filter keeps only players with stats in the league
+    assert await data_service.get_elo_series(db_session, league_id=league.id) == []
+    await data_service.calculate_league_stats_async(db_session, league.id)
+    league_series = await data_service.get_elo_series(db_session, league_id=league.id)
+    assert [s["name"] for s in league_series] == ["Alice", "Bob", "Charlie", "Dave"]
+
+    downsampled = await data_service.get_elo_series(db_session, max_points=2)
+    assert all(len(s["points"]) <= 2 for s in downsampled)
+
+    timeline = await data_service.get_elo_timeline(db_session)
+    assert [row["date"] for row in timeline] == ["2024-01-15", "2024-02-01"]
+    assert timeline[-1]["Alice"] == series[0]["points"][-1][1]
@@ -12,9 +12,11 @@ from backend.services.stats_read_data import (
     _sort_rankings_all_seasons,
     _sort_rankings_single_season,
     _match_row_to_elo_dict,
+    _series_x,
     get_rankings,
 )
 from backend.services.stats_calc_data import _chunks
+from backend.utils.downsample import lttb_indices
 
 
 # ---------------------------------------------------------------------------
@@ -39,7 +41,7 @@ def test_stats_data_exports_calc_functions():
         "calculate_league_stats_async",
         "register_stats_queue_callbacks",
         "insert_elo_history_async",
-        "upsert_player_global_stats_async",
+        "upsert_partnership_stats_async",
     ]:
         assert hasattr(stats_data, name), f"stats_data missing: {name}"
 
@@ -49,9 +51,11 @@ def test_stats_data_exports_read_functions():
     for name in [
         "get_rankings",
         "get_elo_timeline",
+        "get_elo_series",
         "get_season_matches_with_elo",
         "get_league_matches_with_elo",
         "query_matches",
+        "query_matches_next_cursor",
         "get_player_stats_by_id",
         "get_player_season_stats",
         "get_player_league_stats",
@@ -199,6 +203,11 @@ def _make_match_row(
     winner=1,
     is_ranked=True,
     ranked_intent=True,
+    team1_elo_change=None,
+    team2_elo_change=None,
+    elo_after=(None, None, None, None),
+    team1_rating_change=None,
+    team2_rating_change=None,
 ):
     row = MagicMock()
     row.id = id
@@ -220,20 +229,30 @@ def _make_match_row(
     row.winner = winner
     row.is_ranked = is_ranked
     row.ranked_intent = ranked_intent
+    row.team1_elo_change = team1_elo_change
+    row.team2_elo_change = team2_elo_change
+    (
+        row.team1_player1_elo_after,
+        row.team1_player2_elo_after,
+        row.team2_player1_elo_after,
+        row.team2_player2_elo_after,
+    ) = elo_after
+    row.team1_rating_change = team1_rating_change
+    row.team2_rating_change = team2_rating_change
     return row
 
 
 def test_match_row_to_elo_dict_basic():
     """Should map row attributes to the expected dict shape."""
-    row = _make_match_row()
-    elo_by_match = {
-        42: {
-            1: {"elo_before": 1200.0, "elo_after": 1215.0, "elo_change": 15.0},
-            3: {"elo_before": 1210.0, "elo_after": 1195.0, "elo_change": -15.0},
-        }
-    }
+    row = _make_match_row(
+        team1_elo_change=15.0,
+        team2_elo_change=-15.0,
+        elo_after=(1215.0, 1230.0, 1195.0, 1180.0),
+        team1_rating_change=4.5,
+        team2_rating_change=-4.5,
+    )
 
-    result = _match_row_to_elo_dict(row, elo_by_match)
+    result = _match_row_to_elo_dict(row)
 
     assert result["id"] == 42
     assert result["date"] == "2024-01-15"
@@ -242,15 +261,25 @@ def test_match_row_to_elo_dict_basic():
     assert result["team2_score"] == 15
     assert result["team1_player1_name"] == "Alice"
     assert result["team2_player1_name"] == "Carol"
-    assert result["elo_changes"] == elo_by_match[42]
+    assert result["elo_changes"][1] == {
+        "elo_before": 1200.0,
+        "elo_after": 1215.0,
+        "elo_change": 15.0,
+    }
+    assert result["elo_changes"][3] == {
+        "elo_before": 1210.0,
+        "elo_after": 1195.0,
+        "elo_change": -15.0,
+    }
+    assert set(result["elo_changes"]) == {1, 2, 3, 4}
+    assert (result["team1_rating_change"], result["team2_rating_change"]) == (4.5, -4.5)
 
 
 def test_match_row_to_elo_dict_missing_elo_entry():
     """When a match has no ELO data, elo_changes should be an empty dict."""
     row = _make_match_row(id=99)
-    elo_by_match = {}  # no entry for match 99
 
-    result = _match_row_to_elo_dict(row, elo_by_match)
+    result = _match_row_to_elo_dict(row)
 
     assert result["elo_changes"] == {}
     assert result["id"] == 99
@@ -409,3 +438,39 @@ async def test_get_rankings_avatar_empty_string_treated_as_falsy():
 
     # Empty string is falsy, so should fall back to initials "EF"
     assert result[0]["avatar"] == "EF"
+
+
+# ---------------------------------------------------------------------------
+# ELO series downsampling
+# ---------------------------------------------------------------------------
+
+
+def test_lttb_keeps_series_within_budget():
+    """Short series are returned whole; long ones keep endpoints and fit the budget."""
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 3) == [0, 1, 2]
+
+    xs = list(range(100))
+    ys = [1200 + (i % 7) for i in xs]
+    kept = lttb_indices(xs, ys, 10)
+    assert len(kept) == 10
+    assert kept[0] == 0 and kept[-1] == 99
+    assert kept == sorted(set(kept))
+
+
+def test_lttb_keeps_spikes():
+    """A single spike survives downsampling that a stride would skip."""
+    xs = list(range(50))
+    ys = [1200.0] * 50
+    ys[23] = 1350.0
+    assert 23 in lttb_indices(xs, ys, 5)
+
+
+def test_lttb_rejects_budget_below_two():
+    with pytest.raises(ValueError):
+        lttb_indices([0, 1, 2], [0, 1, 2], 1)
+
+
+def test_series_x_uses_day_ordinals_or_positions():
+    """ISO dates are spaced by days; any other format falls back to positions."""
+    assert _series_x(["2024-01-01", "2024-01-31"]) == [738886, 738916]
+    assert _series_x(["1/1/2024", "2024-01-31"]) == [0, 1]
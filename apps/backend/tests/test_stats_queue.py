@@ -5,7 +5,8 @@ Tests enqueueing, deduplication, and job status tracking.
 
 import pytest
 from backend.utils.datetime_utils import utcnow
-from sqlalchemy import select
+from datetime import timedelta
+from sqlalchemy import select, update
 from backend.database.models import StatsCalculationJob, StatsCalculationJobStatus
 from backend.services.stats_queue import StatsCalculationQueue, get_stats_queue
 
@@ -14,8 +15,8 @@ from backend.services.stats_queue import StatsCalculationQueue, get_stats_queue
 
 @pytest.fixture
 def queue():
-    """Create a fresh queue instance for each test."""
-    q = StatsCalculationQueue()
+    """Create a fresh queue instance for each test (no debounce, so jobs are claimable)."""
+    q = StatsCalculationQueue(debounce_seconds=0)
 
     # Register mock callbacks to avoid RuntimeError when calculations are triggered
     # Tests that actually need to run calculations can override these
@@ -201,6 +202,7 @@ async def test_get_queue_status_with_jobs(db_session, queue):
 
     assert status["running"] is not None
     assert status["running"]["calc_type"] == "global"
+    assert [j["id"] for j in status["running_jobs"]] == [job1.id]
     assert len(status["pending"]) == 1
     assert len(status["recent_completed"]) == 1
 
@@ -263,6 +265,231 @@ async def test_deduplication_running_job(db_session, queue):
     assert job_id == job.id
 
 
+@pytest.mark.asyncio
+async def test_enqueue_does_not_start_job_inline(db_session, queue):
+    """Test that enqueue only inserts a pending job; the worker pool runs it."""
+    job_id = await queue.enqueue_calculation(db_session, "global", None)
+
+    job = await db_session.get(StatsCalculationJob, job_id)
+    assert job.status == StatsCalculationJobStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_enqueue_queues_jobs_for_many_leagues_while_one_runs(db_session, queue):
+    """Test that a running job doesn't collapse other leagues' requests into one."""
+    from backend.database.models import League
+
+    leagues = [League(name=f"League {i}", is_open=True) for i in range(3)]
+    db_session.add_all(leagues)
+    db_session.add(
+        StatsCalculationJob(
+            calc_type="global", status=StatsCalculationJobStatus.RUNNING, started_at=utcnow()
+        )
+    )
+    await db_session.commit()
+
+    job_ids = [await queue.enqueue_calculation(db_session, "league", lg.id) for lg in leagues]
+
+    assert len(set(job_ids)) == 3
+
+
+# ============================================================================
+# Worker Pool Tests
+# ============================================================================
+
+
+async def _create_league(db_session, name="Test League"):
+    from backend.database.models import League
+
+    league = League(name=name, is_open=True)
+    db_session.add(league)
+    await db_session.commit()
+    return league.id
+
+
+@pytest.mark.asyncio
+async def test_claim_serializes_jobs_in_the_same_scope(db_session, queue):
+    """Test that workers skip jobs whose scope is held and claim other scopes."""
+    from backend.database import db
+
+    league_id = await _create_league(db_session)
+    global_id = await queue.enqueue_calculation(db_session, "global", None)
+    rebuild_id = await queue.enqueue_calculation(db_session, "global_rebuild", None)
+    league_job_id = await queue.enqueue_calculation(db_session, "league", league_id)
+
+    first, second, third = (db.AsyncSessionLocal() for _ in range(3))
+    try:
+        # Oldest job first; the global rebuild shares its scope so it is skipped
+        assert await queue._claim_next_job(first) == global_id
+        assert await queue._claim_next_job(second) == league_job_id
+        assert await queue._claim_next_job(third) is None
+
+        # Releasing the global scope lets the rebuild be claimed
+        await first.close()
+        assert await queue._claim_next_job(third) == rebuild_id
+    finally:
+        for lock_session in (first, second, third):
+            await lock_session.close()
+
+    db_session.expire_all()
+    rebuild = await db_session.get(StatsCalculationJob, rebuild_id)
+    assert rebuild.status == StatsCalculationJobStatus.RUNNING
+    assert rebuild.started_at is not None
+
+
+@pytest.mark.asyncio
+async def test_claim_reaps_orphaned_running_jobs(db_session, queue):
+    """Test that running jobs with no live worker are failed, live ones are kept."""
+    from backend.database import db
+
+    league_id = await _create_league(db_session)
+    orphan = StatsCalculationJob(
+        calc_type="global", status=StatsCalculationJobStatus.RUNNING, started_at=utcnow()
+    )
+    live = StatsCalculationJob(
+        calc_type="league",
+        league_id=league_id,
+        status=StatsCalculationJobStatus.RUNNING,
+        started_at=utcnow(),
+    )
+    db_session.add_all([orphan, live])
+    await db_session.commit()
+    orphan_id, live_id = orphan.id, live.id
+
+    # Simulate the live job's worker holding its scope lock
+    holder = db.AsyncSessionLocal()
+    lock_session = db.AsyncSessionLocal()
+    try:
+        assert await queue._try_lock_scope(holder, league_id)
+        assert await queue._claim_next_job(lock_session) is None
+    finally:
+        await holder.close()
+        await lock_session.close()
+
+    db_session.expire_all()
+    orphan = await db_session.get(StatsCalculationJob, orphan_id)
+    live = await db_session.get(StatsCalculationJob, live_id)
+    assert orphan.status == StatsCalculationJobStatus.FAILED
+    assert "Worker exited" in orphan.error_message
+    assert live.status == StatsCalculationJobStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_claim_waits_for_debounce_window(db_session):
+    """Test that a new job is not claimed until its debounce window has passed."""
+    from backend.database import db
+
+    queue = StatsCalculationQueue(debounce_seconds=30)
+    job_id = await queue.enqueue_calculation(db_session, "global", None)
+    # A burst of requests collapses into the pending job
+    assert await queue.enqueue_calculation(db_session, "global", None) == job_id
+
+    lock_session = db.AsyncSessionLocal()
+    try:
+        assert await queue._claim_next_job(lock_session) is None
+    finally:
+        await lock_session.close()
+
+    assert 25 < await queue._next_claim_delay() <= 31
+
+    # Age the job past the window
+    await db_session.execute(
+        update(StatsCalculationJob)
+        .where(StatsCalculationJob.id == job_id)
+        .values(created_at=StatsCalculationJob.created_at - timedelta(seconds=60))
+    )
+    await db_session.commit()
+    lock_session = db.AsyncSessionLocal()
+    try:
+        assert await queue._claim_next_job(lock_session) == job_id
+    finally:
+        await lock_session.close()
+
+
+@pytest.mark.asyncio
+async def test_next_claim_delay_idle_and_busy_scope(db_session, queue):
+    """Test the idle fallback poll and the retry while jobs wait on a busy scope."""
+    from backend.services import stats_queue
+
+    assert await queue._next_claim_delay() == stats_queue.IDLE_POLL_SECONDS
+
+    await queue.enqueue_calculation(db_session, "global", None)
+    assert await queue._next_claim_delay() == stats_queue.SCOPE_RETRY_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_listener_wakes_workers_on_enqueue(db_session, test_engine, monkeypatch):
+    """Test that an enqueue on another instance wakes this one through NOTIFY."""
+    import asyncio
+    from backend.database import db
+
+    monkeypatch.setattr(db, "engine", test_engine)
+    listening = StatsCalculationQueue(debounce_seconds=0)
+    listener = asyncio.create_task(listening._listen_for_jobs())
+    try:
+        # The listener sets the event once it is subscribed
+        await asyncio.wait_for(listening._wake_event.wait(), timeout=10)
+        listening._wake_event.clear()
+
+        await StatsCalculationQueue().enqueue_calculation(db_session, "global", None)
+
+        await asyncio.wait_for(listening._wake_event.wait(), timeout=10)
+    finally:
+        listening._stop_event.set()
+        await asyncio.wait_for(listener, timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_different_leagues_concurrently(
+    db_session, test_engine, monkeypatch
+):
+    """Test that the worker pool runs jobs for different leagues at the same time."""
+    import asyncio
+
+    league_ids = [await _create_league(db_session, f"League {i}") for i in range(2)]
+    started = []
+    both_started = asyncio.Event()
+
+    async def mock_global_calc(session, full_rebuild=False):
+        return {}
+
+    async def mock_league_calc(session, league_id):
+        started.append(league_id)
+        if len(started) == len(league_ids):
+            both_started.set()
+        # Blocks until the other league's job is running too
+        await asyncio.wait_for(both_started.wait(), timeout=10)
+        return {}
+
+    from backend.database import db
+
+    monkeypatch.setattr(db, "engine", test_engine)
+    queue = StatsCalculationQueue(debounce_seconds=0)
+    queue.register_calculation_callbacks(mock_global_calc, mock_league_calc)
+    job_ids = [await queue.enqueue_calculation(db_session, "league", lid) for lid in league_ids]
+
+    queue.start_background_worker(worker_count=2)
+    try:
+        await asyncio.wait_for(both_started.wait(), timeout=10)
+        for _ in range(100):
+            db_session.expire_all()
+            result = await db_session.execute(
+                select(StatsCalculationJob.status).where(StatsCalculationJob.id.in_(job_ids))
+            )
+            await db_session.commit()
+            if all(s == StatsCalculationJobStatus.COMPLETED for s in result.scalars()):
+                break
+            await asyncio.sleep(0.05)
+        else:
+            pytest.fail("Jobs did not complete")
+    finally:
+        tasks = [*queue._worker_tasks, queue._listener_task]
+        queue.stop_background_worker()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert sorted(started) == sorted(league_ids)
+
+
 # ============================================================================
 # Callback Registration Tests
 # ============================================================================
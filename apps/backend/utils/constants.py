@@ -9,4 +9,11 @@ APP_NAME = "Beach League"
 K = 40  # K-factor for global ELO ratings
 SEASON_K = 10  # K-factor for season ratings (more stable)
 INITIAL_ELO = 1200
+SEASON_INITIAL_RATING = 100.0  # Starting rating in season-rating seasons
 USE_POINT_DIFFERENTIAL = False  # Set to True to factor in margin of victory
+
+# Stats calculation
+STATS_CHECKPOINT_INTERVAL = 500  # Snapshot tracker state every N matches for partial replays
+STATS_CHECKPOINT_KEEP_RECENT = 4  # Latest checkpoints always kept; older ones are log-spaced
+USE_COMPACT_STATS_TRACKER = False  # Use the array-backed tracker for global stats replays
+STATS_MATCH_LOAD_CHUNK_SIZE = 5000  # Rows fetched per round trip when streaming replay matches
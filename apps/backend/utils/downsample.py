@@ -0,0 +1,59 @@
+"""
+Downsampling of chart series.
+"""
+
+from typing import List, Sequence
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], max_points: int) -> List[int]:
+    """
+    Pick up to max_points points of a series with largest-triangle-three-buckets.
+
+    The first and last points are always kept. The points in between are split
+    into max_points - 2 buckets, and from each bucket the point forming the
+    largest triangle with the previously kept point and the average of the next
+    bucket is kept, which preserves peaks and dips a plain stride would skip.
+
+    Args:
+        xs: X values in ascending order
+        ys: Y values, same length as xs
+        max_points: Point budget (at least 2)
+
+    Returns:
+        Ascending indices of the points to keep (all of them if the series
+        already fits the budget)
+    """
+    n = len(xs)
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+    if n <= max_points:
+        return list(range(n))
+
+    kept = [0]
+    bucket_size = (n - 2) / (max_points - 2)
+    previous = 0
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (just the last point for the final bucket)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n - 1)
+        if next_end <= next_start:
+            next_start, next_end = n - 1, n
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        px, py = xs[previous], ys[previous]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            # Twice the triangle's area; the factor doesn't change the argmax
+            area = abs((px - avg_x) * (ys[i] - py) - (px - xs[i]) * (avg_y - py))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+        previous = best
+
+    kept.append(n - 1)
+    return kept
@@ -0,0 +1,73 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque token holding the sort key values of the last row of a
+page. The next page is the rows strictly after those values in the listing's
+order, found with a row-value comparison on the sort key, so fetching a deep
+page walks the index from that key instead of skipping OFFSET rows, and rows
+inserted meanwhile don't shift the page boundaries.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Sequence, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a row's sort key values as an opaque, URL-safe cursor.
+
+    Dates and datetimes are stored as ISO strings; decode_cursor parses them back.
+    """
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor: The opaque cursor string
+        parsers: One callable per value converting it back to the sort key type
+            (e.g. datetime.fromisoformat, int)
+
+    Returns:
+        Tuple of parsed values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or has the wrong shape
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:  # bad base64, UTF-8 or JSON
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise InvalidCursorError("Invalid cursor")
+    try:
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def after_cursor(
+    columns: Sequence[ColumnElement], values: Sequence[Any], descending: bool = True
+) -> ColumnElement:
+    """
+    Condition selecting rows that come after values when ordered by columns.
+
+    All columns must be sorted in the same direction and the last one must be
+    unique (usually the primary key) so the order is total.
+    """
+    key = tuple_(*columns)
+    bound = tuple_(*values)
+    return key < bound if descending else key > bound
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Backtest ELO parameters against the recorded match history.
+
+This script:
+1. Loads the stat-eligible match stream once (optionally one league or season)
+2. Replays it under every K-factor / point-differential combination at once
+   (see services/elo_backtest.py)
+3. Prints each configuration's predictive metrics, best log loss first:
+   log loss, Brier score, accuracy on decisive matches and calibration error
+4. Optionally writes the full results (with calibration bins) to a JSON file
+
+The first --warmup matches are replayed but not scored, since every rating
+starts equal and early predictions are coin flips under any configuration.
+
+Usage:
+    python scripts/backtest_elo.py --k 10 20 30 40 50 60 --warmup 500
+    python scripts/backtest_elo.py --league-id 3 --output backtest.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add apps to path (so backend.* imports work)
+# This mirrors the Docker setup where PYTHONPATH=/app and backend is at /app/backend
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+apps_path = os.path.join(project_root, "apps")
+sys.path.insert(0, apps_path)
+
+from backend.database.db import AsyncSessionLocal
+from backend.services import elo_backtest
+
+DEFAULT_K_VALUES = [8, 12, 16, 20, 24, 32, 40, 48, 56, 64, 80]
+
+
+async def run_backtest(args):
+    async with AsyncSessionLocal() as session:
+        encoded = await elo_backtest.load_backtest_matches_async(
+            session, season_id=args.season_id, league_id=args.league_id
+        )
+    point_differential = {"off": (False,), "on": (True,), "both": (False, True)}
+    configs = elo_backtest.elo_config_grid(args.k, point_differential[args.point_differential])
+    started = time.perf_counter()
+    results = elo_backtest.backtest_elo(
+        encoded, configs, warmup=args.warmup, calibration_bins=args.calibration_bins
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"Replayed {len(encoded.match_ids)} ranked matches x {len(configs)} configs "
+        f"in {elapsed:.2f}s ({results[0]['matches'] if results else 0} scored)\n"
+    )
+    return results
+
+
+def _fmt(value, width):
+    return f"{value:>{width}.4f}" if value is not None else f"{'-':>{width}}"
+
+
+def print_results(results):
+    ranked = sorted(
+        results, key=lambda r: float("inf") if r["log_loss"] is None else r["log_loss"]
+    )
+    print(f"{'K':>6} {'margin':>7} {'log loss':>9} {'brier':>7} {'accuracy':>9} {'calib':>7}")
+    for r in ranked:
+        print(
+            f"{r['k']:>6g} {'yes' if r['use_point_differential'] else 'no':>7} "
+            f"{_fmt(r['log_loss'], 9)} {_fmt(r['brier'], 7)} {_fmt(r['accuracy'], 9)} "
+            f"{_fmt(r['calibration_error'], 7)}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--k", type=float, nargs="+", default=DEFAULT_K_VALUES, help="K-factors to sweep"
+    )
+    parser.add_argument(
+        "--point-differential",
+        choices=["off", "on", "both"],
+        default="both",
+        help="Score matches by win/loss, by margin, or sweep both",
+    )
+    parser.add_argument("--warmup", type=int, default=0, help="Leading matches not scored")
+    parser.add_argument("--calibration-bins", type=int, default=10)
+    parser.add_argument("--league-id", type=int, help="Only this league's matches")
+    parser.add_argument("--season-id", type=int, help="Only this season's matches")
+    parser.add_argument("--output", help="Write full results (with calibration bins) as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = asyncio.run(run_backtest(args))
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
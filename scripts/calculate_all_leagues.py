@@ -46,7 +46,9 @@ async def calculate_all_leagues():
         print("=" * 60)
         
         try:
-            global_result = await data_service.calculate_global_stats_async(session)
+            global_result = await data_service.calculate_global_stats_async(
+                session, full_rebuild=True
+            )
             global_player_count = global_result.get("player_count", 0)
             global_match_count = global_result.get("match_count", 0)
             print(f"✓ Global stats calculated: {global_player_count} players, {global_match_count} matches\n")